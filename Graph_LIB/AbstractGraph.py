@@ -6,6 +6,41 @@ matriz, etc.). As mensagens e docstrings aqui usam português para
 manter consistência com o restante do projeto.
 """
 
+import sys
+
+
+def bytes_objetos(objetos):
+    """Soma de `sys.getsizeof` de vários objetos (sem seguir referências)."""
+    tamanho = sys.getsizeof
+    return sum(tamanho(o) for o in objetos)
+
+
+def bytes_dict(d, chaves=True, valores=True):
+    """Bytes de um dicionário, opcionalmente com suas chaves e valores.
+
+    Objetos compartilhados com outra estrutura (ex.: os rótulos dos
+    vértices, que também aparecem nas listas de vizinhos) devem ser
+    contados em um só lugar; por isso chaves e valores são opcionais.
+    """
+    total = sys.getsizeof(d)
+    if chaves:
+        total += bytes_objetos(d)
+    if valores:
+        total += bytes_objetos(d.values())
+    return total
+
+
+def relatorio_memoria(estruturas, num_arestas):
+    """Monta o dicionário de `memory_usage` a partir de estrutura -> bytes."""
+    total = sum(estruturas.values())
+    por_aresta = total / num_arestas if num_arestas else 0.0
+    return {
+        "estruturas": estruturas,
+        "total": total,
+        "bytes_por_aresta": por_aresta,
+        "mb_por_milhao_de_arestas": por_aresta * 1_000_000 / 2**20,
+    }
+
 
 class AbstractGraph:
     """Classe base para representações de grafos direcionados.
@@ -40,12 +75,34 @@ class AbstractGraph:
             node: identificador do vértice (qualquer tipo hashable).
 
         Note:
-            Se o vértice já existir, o comportamento atual sobrescreve
-            sua entrada interna sem lançar erro.
+            Se o vértice já existir, nada muda (suas arestas são
+            mantidas).
         """
+        if node in self.vertices:
+            return
         self.vertices[node] = {}
         self.edges[node] = []
 
+    def add_nodes_from(self, nodes):
+        """Adiciona vários vértices de uma vez.
+
+        Vértices repetidos no lote ou já existentes são ignorados.
+
+        Args:
+            nodes: iterável de identificadores de vértice.
+
+        Returns:
+            lista dos vértices efetivamente criados, na ordem do lote.
+        """
+        novos = [node for node in dict.fromkeys(nodes) if node not in self.vertices]
+        self.vertices.update({node: {} for node in novos})
+        self.edges.update({node: [] for node in novos})
+        self._novos_vertices(novos)
+        return novos
+
+    def _novos_vertices(self, novos):
+        """Gancho para subclasses com estruturas próprias por vértice."""
+
     def add_edge(self, from_node, to_node):
         """Adiciona uma aresta dirigida de `from_node` para `to_node`.
 
@@ -60,15 +117,112 @@ class AbstractGraph:
             raise ValueError("Both nodes must be in the graph.")
         self.edges[from_node].append(to_node)
 
+    def add_edges_from(self, edges, create_nodes=False):
+        """Adiciona várias arestas dirigidas, com peso opcional, de uma vez.
+
+        Repetições (no lote ou de arestas que já existem) viram uma
+        única aresta com a soma dos pesos, como em `main.build_graph`;
+        aresta sem peso vale 1. O lote inteiro é validado antes de
+        qualquer alteração, e cada lista de adjacência cresce com um
+        único `extend`.
+
+        Args:
+            edges: iterável de `(u, v)` ou `(u, v, w)`, ou array NumPy
+                de forma (m, 2) ou (m, 3).
+            create_nodes: se True, cria os vértices que faltarem em vez
+                de lançar erro.
+
+        Returns:
+            int: número de arestas novas (pares que ainda não existiam).
+
+        Raises:
+            ValueError: se algum vértice não existir e `create_nodes`
+                for False (nada é alterado nesse caso).
+        """
+        pesos = self._preparar_lote(edges, create_nodes)
+
+        # só origens que já têm arestas precisam do teste de existência
+        # (um conjunto por origem distinta, não por par do lote)
+        origens = dict.fromkeys(u for u, _ in pesos)
+        existentes = {u: set(self.edges[u]) for u in origens if self.edges[u]}
+        novos_por_origem = {}
+        if not existentes:
+            self.edge_weights.update(pesos)
+        for (u, v), w in pesos.items():
+            vizinhos = existentes.get(u)
+            if vizinhos is not None and v in vizinhos:
+                atual = self.edge_weights.get((u, v))
+                self.edge_weights[(u, v)] = (1 if atual is None else atual) + w
+                continue
+            destinos = novos_por_origem.get(u)
+            if destinos is None:
+                novos_por_origem[u] = [v]
+            else:
+                destinos.append(v)
+            if existentes:
+                self.edge_weights[(u, v)] = w
+
+        for u, destinos in novos_por_origem.items():
+            self.edges[u].extend(destinos)
+            self._novas_arestas(u, destinos)
+        self._pesos_alterados(pesos)
+        return sum(len(destinos) for destinos in novos_por_origem.values())
+
+    def _preparar_lote(self, edges, create_nodes):
+        """Soma os pesos repetidos do lote e valida (ou cria) os vértices.
+
+        Returns:
+            dict (u, v) -> peso total, na ordem da primeira ocorrência.
+        """
+        if hasattr(edges, "tolist"):
+            edges = edges.tolist()
+
+        pesos = {}
+        acumulado = pesos.get
+        for edge in edges:
+            if len(edge) == 3:
+                u, v, w = edge
+                if w is None:
+                    w = 1
+            else:
+                u, v = edge
+                w = 1
+            chave = (u, v)
+            pesos[chave] = acumulado(chave, 0) + w
+
+        vertices = self.vertices
+        faltando = list(dict.fromkeys(
+            [u for u, _ in pesos if u not in vertices] + [v for _, v in pesos if v not in vertices]
+        ))
+        if faltando and not create_nodes:
+            amostra = ", ".join(repr(x) for x in faltando[:5])
+            raise ValueError(
+                f"Both nodes must be in the graph ({len(faltando)} missing: {amostra}...)."
+            )
+        self.add_nodes_from(faltando)
+        return pesos
+
+    def _novas_arestas(self, u, destinos):
+        """Gancho para subclasses que espelham a adjacência (ex.: adj_list)."""
+
+    def _pesos_alterados(self, pares):
+        """Gancho para subclasses que guardam o peso fora de `edge_weights`."""
+
     def remove_edge(self, from_node, to_node):
         """Remove a aresta dirigida `from_node` -> `to_node` se existir.
 
+        Com arestas paralelas, remove uma cópia; o peso só é apagado
+        quando a última cópia sai. Custa O(grau); para remoções
+        frequentes use `DynamicGraph`.
+
         Args:
             from_node: vértice de origem.
             to_node: vértice de destino.
         """
         if from_node in self.edges and to_node in self.edges[from_node]:
             self.edges[from_node].remove(to_node)
+            if to_node not in self.edges[from_node]:
+                self.edge_weights.pop((from_node, to_node), None)
 
     def get_neighbors(self, node):
         """Retorna os vizinhos de saída (adjacência) de um vértice.
@@ -280,6 +434,27 @@ class AbstractGraph:
                     return False
         return True
 
+    def memory_usage(self):
+        """Memória ocupada pelo grafo, por estrutura (em bytes).
+
+        Conta os contêineres e os objetos que eles guardam (listas,
+        tuplas de chave, pesos); os rótulos dos vértices são contados
+        uma vez, em `vertices`. Valores aproximados: inteiros pequenos
+        e strings internadas são compartilhados pelo interpretador.
+
+        Returns:
+            dict com "estruturas" (nome -> bytes), "total",
+            "bytes_por_aresta" e "mb_por_milhao_de_arestas".
+        """
+        estruturas = {
+            "vertices": bytes_dict(self.vertices),
+            "edges": bytes_dict(self.edges, chaves=False),
+            "edge_weights": bytes_dict(self.edge_weights),
+            "peso_vertice": bytes_dict(self.peso_vertice, chaves=False),
+            "rotulos": bytes_dict(self.rotulos, chaves=False),
+        }
+        return relatorio_memoria(estruturas, self.get_edge_count())
+
     def __str__(self):
         return (
             f"Nodes: {self.vertices}, "
@@ -6,7 +6,7 @@ herdadas, uma lista de adjacência explícita (`adj_list`) para
 operações de leitura/escrita eficientes.
 """
 
-from AbstractGraph import AbstractGraph
+from Graph_LIB.AbstractGraph import AbstractGraph
 
 
 class AdjacencyListGraph(AbstractGraph):
@@ -30,7 +30,15 @@ class AdjacencyListGraph(AbstractGraph):
             node: identificador do vértice (qualquer tipo hashable).
         """
         super().add_node(node)
-        self.adj_list[node] = []
+        self.adj_list.setdefault(node, [])
+
+    def _novos_vertices(self, novos):
+        """Cria a lista de adjacência dos vértices de `add_nodes_from`."""
+        self.adj_list.update({node: [] for node in novos})
+
+    def _novas_arestas(self, u, destinos):
+        """Espelha em `adj_list` as arestas novas de `add_edges_from`."""
+        self.adj_list[u].extend(destinos)
 
     def add_edge(self, from_node, to_node):
         """Adiciona aresta dirigida `from_node -> to_node`.
@@ -45,6 +53,12 @@ class AdjacencyListGraph(AbstractGraph):
         super().add_edge(from_node, to_node)
         self.adj_list[from_node].append(to_node)
 
+    def remove_edge(self, from_node, to_node):
+        """Remove a aresta `from_node -> to_node` também de `adj_list`."""
+        if self.has_edge(from_node, to_node):
+            super().remove_edge(from_node, to_node)
+            self.adj_list[from_node].remove(to_node)
+
     def get_neighbors(self, node):
         """Retorna a lista de vizinhos de saída de `node`.
 
@@ -7,7 +7,7 @@ arestas em uma matriz quadrada `adj_matrix`. Esta representação é
 acesso O(1) à presença de uma aresta entre dois vértices.
 """
 
-from AbstractGraph import AbstractGraph
+from Graph_LIB.AbstractGraph import AbstractGraph
 
 
 class AdjacencyMatrixGraph(AbstractGraph):
@@ -34,4 +34,38 @@ class AdjacencyMatrixGraph(AbstractGraph):
         """
         super().__init__()
         self.num_vertices = num_vertices
-        self.adj_matrix = [[0 for _ in range(num_vertices)] for _ in range(num_vertices)]
\ No newline at end of file
+        self.adj_matrix = [[0 for _ in range(num_vertices)] for _ in range(num_vertices)]
+
+    def _sincronizar(self, u, v):
+        """Copia para a matriz o estado da aresta (u, v) nas estruturas da classe base.
+
+        A célula guarda o peso (1 se não definido) ou 0 sem aresta.
+        Vértices fora de 0..num_vertices-1 ficam só na classe base.
+        """
+        n = self.num_vertices
+        if isinstance(u, int) and isinstance(v, int) and 0 <= u < n and 0 <= v < n:
+            if v in self.edges.get(u, ()):
+                w = self.edge_weights.get((u, v))
+                self.adj_matrix[u][v] = 1 if w is None else w
+            else:
+                self.adj_matrix[u][v] = 0
+
+    def _pesos_alterados(self, pares):
+        """Copia para a matriz o peso das arestas tocadas por `add_edges_from`."""
+        for u, v in pares:
+            self._sincronizar(u, v)
+
+    def add_edge(self, from_node, to_node):
+        """Adiciona a aresta e marca a célula correspondente da matriz."""
+        super().add_edge(from_node, to_node)
+        self._sincronizar(from_node, to_node)
+
+    def remove_edge(self, from_node, to_node):
+        """Remove a aresta e zera a célula quando a última cópia sai."""
+        super().remove_edge(from_node, to_node)
+        self._sincronizar(from_node, to_node)
+
+    def set_edge_weight(self, u, v, w):
+        """Define o peso da aresta e o copia para a matriz."""
+        super().set_edge_weight(u, v, w)
+        self._sincronizar(u, v)
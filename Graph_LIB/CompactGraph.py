@@ -0,0 +1,359 @@
+"""Grafo com armazenamento compacto em arrays tipados.
+
+`CompactGraph` guarda o mesmo conteúdo de `AbstractGraph` sem os cinco
+dicionários paralelos. Cada vértice recebe um id inteiro (internado na
+primeira vez em que aparece) e tudo o mais é indexado por esse id:
+
+  - `_vizinhos[i]`: `array('i')` com os ids de destino;
+  - `_pesos[i]`: `array('d')` paralelo a `_vizinhos[i]` (NaN = sem peso);
+  - `_peso_vertice`: `array('d')` com o peso de cada vértice (NaN = sem peso);
+  - `_codigo_rotulo`: `array('i')` com o código do rótulo de cada vértice
+    na tabela de textos internados `_textos` (-1 = sem rótulo).
+
+Um inteiro em `array('i')` ocupa 4 bytes e um float em `array('d')`
+ocupa 8, contra ~28 bytes de um `int` do Python, mais a tupla da chave
+e a entrada do dicionário de `edge_weights`. Rótulos repetidos (ex.:
+"bot", "mantenedor") são guardados uma vez só.
+
+Como em `DynamicGraph`, o grafo é simples: repetir `add_edge` não cria
+aresta paralela, e `add_edges_from` soma os pesos das repetidas. Pesos
+de vértice e de aresta são sempre float.
+"""
+
+from array import array
+import sys
+from typing import Any, Dict, Hashable, List, Optional
+
+from Graph_LIB.AbstractGraph import AbstractGraph, bytes_dict, bytes_objetos, relatorio_memoria
+
+NAN = float("nan")
+
+# vértices sem arestas de saída compartilham estes arrays (nunca alterados)
+_SEM_VIZINHOS = array("i")
+_SEM_PESOS = array("d")
+
+
+def _peso(w: float) -> Optional[float]:
+    """Converte o NaN armazenado de volta para None."""
+    return None if w != w else w
+
+
+class CompactGraph(AbstractGraph):
+    """Grafo direcionado em arrays tipados indexados por id de vértice.
+
+    `vertices` é o mapa rótulo -> id (consulta sem cópia). `edges`,
+    `edge_weights`, `peso_vertice` e `rotulos` são montados a cada
+    acesso, só para compatibilidade com quem lê as estruturas da classe
+    base; para alterar rótulos use `set_rotulo`.
+    """
+
+    def __init__(self):
+        """Inicializa as tabelas vazias (não usa os dicionários da classe base)."""
+        self._id: Dict[Hashable, int] = {}
+        self._rotulo_de: List[Any] = []
+        self._vizinhos: List[array] = []
+        self._pesos: List[array] = []
+        self._peso_vertice = array("d")
+        self._codigo_rotulo = array("i")
+        self._textos: List[str] = []
+        self._codigo_texto: Dict[str, int] = {}
+        self._num_arestas = 0
+
+    # ---------- visões compatíveis com AbstractGraph ----------
+
+    @property
+    def vertices(self) -> Dict[Hashable, int]:
+        return self._id
+
+    @property
+    def edges(self) -> Dict[Hashable, List[Hashable]]:
+        """Cópia rótulo -> lista de vizinhos de saída (O(n + m))."""
+        rotulo = self._rotulo_de
+        return {u: [rotulo[d] for d in self._vizinhos[i]] for u, i in self._id.items()}
+
+    @property
+    def edge_weights(self) -> Dict[tuple, float]:
+        """Cópia (u, v) -> peso das arestas com peso definido (O(m))."""
+        rotulo = self._rotulo_de
+        return {
+            (u, rotulo[d]): w
+            for u, i in self._id.items()
+            for d, w in zip(self._vizinhos[i], self._pesos[i])
+            if w == w
+        }
+
+    @property
+    def peso_vertice(self) -> Dict[Hashable, float]:
+        """Cópia vértice -> peso dos vértices com peso definido."""
+        pesos = self._peso_vertice
+        return {u: pesos[i] for u, i in self._id.items() if pesos[i] == pesos[i]}
+
+    @property
+    def rotulos(self) -> Dict[Hashable, str]:
+        """Cópia vértice -> rótulo dos vértices rotulados."""
+        textos, codigos = self._textos, self._codigo_rotulo
+        return {u: textos[codigos[i]] for u, i in self._id.items() if codigos[i] >= 0}
+
+    @classmethod
+    def de_csr(cls, indptr, indices, pesos, rotulos) -> "CompactGraph":
+        """Monta o grafo direto de arrays CSR (ex.: os de um `GrafoCSR`).
+
+        O vértice i recebe o id i e seus vizinhos são copiados de
+        `indices[indptr[i]:indptr[i + 1]]` de uma vez, sem passar por
+        `add_edges_from`. As arestas já devem ser únicas por par.
+        """
+        g = cls()
+        g.add_nodes_from(rotulos)
+        if len(g._rotulo_de) != len(indptr) - 1:
+            raise ValueError("Rótulos de vértice repetidos.")
+        destinos = memoryview(bytes(indices.astype("=i4", copy=False).data)).cast("i")
+        valores = memoryview(bytes(pesos.astype("=f8", copy=False).data)).cast("d")
+        inicios = indptr.tolist()
+        for i in range(len(inicios) - 1):
+            a, b = inicios[i], inicios[i + 1]
+            if a < b:
+                g._vizinhos[i] = array("i", destinos[a:b])
+                g._pesos[i] = array("d", valores[a:b])
+        g._num_arestas = inicios[-1] if inicios else 0
+        return g
+
+    # ---------- ids ----------
+
+    def _id_de(self, node) -> int:
+        try:
+            return self._id[node]
+        except KeyError:
+            raise ValueError("Node not found in the graph.") from None
+
+    def _novo_id(self, node) -> int:
+        i = len(self._rotulo_de)
+        self._id[node] = i
+        self._rotulo_de.append(node)
+        self._vizinhos.append(_SEM_VIZINHOS)
+        self._pesos.append(_SEM_PESOS)
+        return i
+
+    def _arrays_proprios(self, i):
+        """Arrays de saída de `i`, trocando os compartilhados antes da escrita."""
+        if self._vizinhos[i] is _SEM_VIZINHOS:
+            self._vizinhos[i] = array("i")
+            self._pesos[i] = array("d")
+        return self._vizinhos[i], self._pesos[i]
+
+    # ---------- vértices ----------
+
+    def add_node(self, node):
+        """Adiciona um vértice; nada muda se já existir."""
+        if node not in self._id:
+            self._novo_id(node)
+            self._peso_vertice.append(NAN)
+            self._codigo_rotulo.append(-1)
+
+    def add_nodes_from(self, nodes):
+        novos = [node for node in dict.fromkeys(nodes) if node not in self._id]
+        for node in novos:
+            self._novo_id(node)
+        self._peso_vertice.extend([NAN] * len(novos))
+        self._codigo_rotulo.extend([-1] * len(novos))
+        return novos
+
+    def set_rotulo(self, node, texto: Optional[str]):
+        """Define (ou apaga, com None) o rótulo de um vértice.
+
+        Raises:
+            ValueError: se o vértice não existir.
+        """
+        i = self._id_de(node)
+        if texto is None:
+            self._codigo_rotulo[i] = -1
+            return
+        codigo = self._codigo_texto.get(texto)
+        if codigo is None:
+            codigo = len(self._textos)
+            self._textos.append(sys.intern(texto))
+            self._codigo_texto[texto] = codigo
+        self._codigo_rotulo[i] = codigo
+
+    def get_rotulo(self, node) -> Optional[str]:
+        """Rótulo do vértice, ou None se não tiver."""
+        codigo = self._codigo_rotulo[self._id_de(node)]
+        return self._textos[codigo] if codigo >= 0 else None
+
+    # ---------- arestas ----------
+
+    def _posicao(self, u, v) -> int:
+        """Índice de u -> v em `_vizinhos[id(u)]`, ou -1 se não existir."""
+        i, j = self._id.get(u), self._id.get(v)
+        if i is None or j is None:
+            return -1
+        try:
+            return self._vizinhos[i].index(j)
+        except ValueError:
+            return -1
+
+    def add_edge(self, from_node, to_node):
+        """Adiciona a aresta `from_node -> to_node` (sem efeito se já existir).
+
+        Raises:
+            ValueError: se qualquer um dos vértices não existir no grafo.
+        """
+        if from_node not in self._id or to_node not in self._id:
+            raise ValueError("Both nodes must be in the graph.")
+        i, j = self._id[from_node], self._id[to_node]
+        if j not in self._vizinhos[i]:
+            vizinhos, pesos = self._arrays_proprios(i)
+            vizinhos.append(j)
+            pesos.append(NAN)
+            self._num_arestas += 1
+
+    def add_edges_from(self, edges, create_nodes=False):
+        """Mesmo contrato de `AbstractGraph.add_edges_from` (soma pesos repetidos)."""
+        pesos = self._preparar_lote(edges, create_nodes)
+        ids = self._id
+
+        # agrupa por origem para crescer cada array com um único extend
+        por_origem = {}
+        for (u, v), w in pesos.items():
+            i = ids[u]
+            lote = por_origem.get(i)
+            if lote is None:
+                por_origem[i] = lote = ({}, [])
+            lote[0][ids[v]] = len(lote[1])
+            lote[1].append(float(w))
+
+        novas = 0
+        for i, (destinos, valores) in por_origem.items():
+            vizinhos, pesos_i = self._arrays_proprios(i)
+            if vizinhos:
+                for k, j in enumerate(vizinhos):
+                    p = destinos.pop(j, None)
+                    if p is not None:
+                        atual = pesos_i[k]
+                        pesos_i[k] = (1.0 if atual != atual else atual) + valores[p]
+            vizinhos.extend(destinos)
+            pesos_i.extend([valores[p] for p in destinos.values()])
+            novas += len(destinos)
+        self._num_arestas += novas
+        return novas
+
+    def remove_edge(self, from_node, to_node):
+        """Remove a aresta `from_node -> to_node` e seu peso, se existir (O(grau))."""
+        k = self._posicao(from_node, to_node)
+        if k >= 0:
+            i = self._id[from_node]
+            del self._vizinhos[i][k]
+            del self._pesos[i][k]
+            self._num_arestas -= 1
+
+    # ---------- consultas ----------
+
+    def get_neighbors(self, node):
+        rotulo = self._rotulo_de
+        return [rotulo[d] for d in self._vizinhos[self._id_de(node)]]
+
+    def get_vertex_count(self):
+        return len(self._id)
+
+    def get_edge_count(self):
+        return self._num_arestas
+
+    def has_edge(self, from_node, to_node) -> bool:
+        return self._posicao(from_node, to_node) >= 0
+
+    def get_vertex_in_degree(self, u):
+        j = self._id_de(u)
+        return sum(1 for vizinhos in self._vizinhos if j in vizinhos)
+
+    def get_vertex_out_degree(self, u):
+        return len(self._vizinhos[self._id_de(u)])
+
+    def set_vertex_weight(self, v, w):
+        self._peso_vertice[self._id_de(v)] = NAN if w is None else float(w)
+
+    def get_vertex_weight(self, v):
+        return _peso(self._peso_vertice[self._id_de(v)])
+
+    def _indice_aresta(self, u, v):
+        k = self._posicao(u, v)
+        if k < 0:
+            raise ValueError("Edge not found in the graph.")
+        return self._id[u], k
+
+    def set_edge_weight(self, u, v, w):
+        i, k = self._indice_aresta(u, v)
+        self._pesos[i][k] = NAN if w is None else float(w)
+
+    def get_edge_weight(self, u, v):
+        i, k = self._indice_aresta(u, v)
+        return _peso(self._pesos[i][k])
+
+    def is_connected(self):
+        """Conectividade fraca por union-find sobre os ids (O(m α(n)))."""
+        n = len(self._rotulo_de)
+        if n == 0:
+            return True
+        pai = list(range(n))
+
+        def raiz(x):
+            while pai[x] != x:
+                pai[x] = pai[pai[x]]
+                x = pai[x]
+            return x
+
+        componentes = n
+        for i, vizinhos in enumerate(self._vizinhos):
+            for j in vizinhos:
+                a, b = raiz(i), raiz(j)
+                if a != b:
+                    pai[a] = b
+                    componentes -= 1
+        return componentes == 1
+
+    def para_arrays(self):
+        """Arestas em ids 0..n-1 (os próprios ids internados).
+
+        Peso não definido vira 1.
+
+        Returns:
+            (rotulos, origens, destinos, pesos), com os três últimos
+            em arrays NumPy.
+        """
+        import numpy as np
+
+        graus = np.fromiter((len(v) for v in self._vizinhos), dtype=np.int64, count=len(self._vizinhos))
+        origens = np.repeat(np.arange(len(graus), dtype=np.int64), graus)
+        destinos = np.frombuffer(b"".join(v.tobytes() for v in self._vizinhos), dtype=np.int32)
+        pesos = np.frombuffer(b"".join(p.tobytes() for p in self._pesos), dtype=np.float64).copy()
+        pesos[np.isnan(pesos)] = 1.0
+        return list(self._rotulo_de), origens, destinos, pesos
+
+    def memory_usage(self):
+        """Memória por estrutura (em bytes); mesmo formato de `AbstractGraph.memory_usage`.
+
+        `adjacencia` e `pesos_arestas` somam o cabeçalho de cada array
+        (~64-80 bytes por vértice com arestas de saída) e o buffer: 4
+        bytes por destino e 8 por peso. Vértices sem saída só custam o
+        ponteiro para o array vazio compartilhado.
+        """
+        estruturas = {
+            "ids": bytes_dict(self._id) + sys.getsizeof(self._rotulo_de),
+            "adjacencia": sys.getsizeof(self._vizinhos) + bytes_objetos(self._proprios(self._vizinhos)),
+            "pesos_arestas": sys.getsizeof(self._pesos) + bytes_objetos(self._proprios(self._pesos)),
+            "peso_vertice": sys.getsizeof(self._peso_vertice),
+            "rotulos": (
+                sys.getsizeof(self._codigo_rotulo)
+                + sys.getsizeof(self._textos) + bytes_objetos(self._textos)
+                + bytes_dict(self._codigo_texto, chaves=False, valores=False)
+            ),
+        }
+        return relatorio_memoria(estruturas, self._num_arestas)
+
+    @staticmethod
+    def _proprios(arrays):
+        return (a for a in arrays if a is not _SEM_VIZINHOS and a is not _SEM_PESOS)
+
+    def __str__(self):
+        return (
+            f"CompactGraph({self.get_vertex_count()} vértices, "
+            f"{self.get_edge_count()} arestas, {len(self._textos)} rótulos distintos)"
+        )
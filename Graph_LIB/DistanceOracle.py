@@ -0,0 +1,431 @@
+"""Oráculo de distâncias por marcos (landmarks) para consultas repetidas.
+
+Responder "a que distância o colaborador A está do mantenedor B" com
+uma BFS (ou Dijkstra) por pergunta custa O(n + m) cada vez. O oráculo
+escolhe k marcos (os vértices de maior grau ou PageRank), guarda a
+distância de cada vértice até e a partir de cada marco e, pela
+desigualdade triangular, limita qualquer distância em O(k):
+
+    d(u, v) <= d(u, L) + d(L, v)
+    d(u, v) >= d(L, v) - d(L, u)   e   d(u, v) >= d(u, L) - d(v, L)
+
+A distância exata sai de uma busca guiada por esses mesmos limites
+(ALT: A*, landmarks e triangle inequality): A* com pesos e, sem pesos,
+uma BFS por nível que descarta os vértices x com d(u, x) + inferior(x, v)
+maior que o limite superior de d(u, v). Quando os limites coincidem,
+nem busca.
+
+As distâncias ficam em arrays (n, k), com inf onde não há caminho, e
+podem ser gravadas junto com o grafo no arquivo de `GraphFile` (blocos
+`extras`). Alterações de arestas invalidam só os marcos cujas
+distâncias podem ter mudado; os demais continuam exatos e seguem
+respondendo até `atualizar` recalcular os inválidos no grafo novo.
+"""
+
+import heapq
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Graph_LIB.GraphLIB import GrafoCSR, _vizinhos_da_fronteira, bfs, congelar, dijkstra, pagerank
+
+# critérios aceitos em OraculoDistancias(estrategia=...)
+ESTRATEGIAS = ["grau", "pagerank"]
+# folga relativa na poda do A* pelo limite superior (arredondamento de ponto flutuante)
+FOLGA_RELATIVA = 1e-12
+
+
+def _importancia(g: GrafoCSR, estrategia: str) -> np.ndarray:
+    if estrategia == "pagerank":
+        return pagerank(g)
+    if g.direcionado:
+        return g.graus() + np.bincount(g.indices, minlength=g.n)
+    return g.graus()
+
+
+def escolher_marcos(g: GrafoCSR, k: int, estrategia: str = "grau") -> np.ndarray:
+    """Os k vértices mais importantes, evitando vizinhos de marcos já escolhidos.
+
+    Marcos vizinhos dão limites quase iguais; pular os vizinhos espalha
+    os marcos pelo grafo. Se faltarem candidatos, os vizinhos pulados
+    completam a lista (na mesma ordem de importância).
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia desconhecida: {estrategia} (opções: {', '.join(ESTRATEGIAS)})")
+    ordem = np.argsort(-_importancia(g, estrategia), kind="stable")
+    k = min(k, g.n)
+    bloqueado = np.zeros(g.n, dtype=bool)
+    marcos, pulados = [], []
+    for v in ordem.tolist():
+        if len(marcos) == k:
+            break
+        if bloqueado[v]:
+            pulados.append(v)
+            continue
+        marcos.append(v)
+        bloqueado[g.vizinhos(v)] = True
+        bloqueado[g.transposto().vizinhos(v)] = True
+    marcos.extend(pulados[:k - len(marcos)])
+    return np.array(marcos, dtype=np.int64)
+
+
+class OraculoDistancias:
+    """Índice de distâncias por marcos sobre um `GrafoCSR`.
+
+    As consultas recebem e devolvem rótulos de vértice (como o resto do
+    projeto); os arrays internos são indexados por id.
+
+    Attributes:
+        g: grafo indexado.
+        marcos: ids dos marcos.
+        desde: array (n, k), desde[x, i] = d(marco i, x).
+        ate: array (n, k), ate[x, i] = d(x, marco i) (o mesmo array de
+            `desde` em grafos não direcionados).
+        validos: máscara dos marcos com distâncias exatas no grafo atual.
+    """
+
+    def __init__(
+        self,
+        grafo,
+        k: int = 16,
+        estrategia: str = "grau",
+        ponderado: bool = False,
+        marcos: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        :param grafo: GrafoCSR, grafo do Graph_LIB ou do NetworkX.
+        :param k: número de marcos.
+        :param estrategia: "grau" ou "pagerank" (ver ESTRATEGIAS).
+        :param ponderado: usa o peso das arestas como distância
+            (Dijkstra); senão, conta arestas (BFS).
+        :param marcos: ids dos marcos, no lugar da escolha automática.
+        """
+        self.g = congelar(grafo)
+        self.estrategia = estrategia
+        self.ponderado = ponderado
+        if marcos is None:
+            self.marcos = escolher_marcos(self.g, k, estrategia)
+        else:
+            self.marcos = np.fromiter(marcos, dtype=np.int64)
+        k = len(self.marcos)
+        self.desde = np.empty((self.g.n, k))
+        self.ate = self.desde if not self.g.direcionado else np.empty((self.g.n, k))
+        self.validos = np.zeros(k, dtype=bool)
+        self._pendentes = False
+        self._calcular(range(k))
+
+    # ---------- construção ----------
+
+    def _distancias(self, g: GrafoCSR, origem: int) -> np.ndarray:
+        if self.ponderado:
+            return dijkstra(g, origem)[0]
+        dist = bfs(g, origem)[1].astype(np.float64)
+        dist[dist < 0] = np.inf
+        return dist
+
+    def _calcular(self, indices: Iterable[int]) -> None:
+        """Recalcula as colunas dos marcos em `indices` no grafo atual."""
+        indices = list(indices)
+        if indices and not self.desde.flags.writeable:
+            # carregado por mmap (somente leitura): copia só quando precisa mudar
+            self.desde = np.array(self.desde)
+            self.ate = self.desde if not self.g.direcionado else np.array(self.ate)
+        reverso = self.g.transposto()
+        for i in indices:
+            marco = int(self.marcos[i])
+            self.desde[:, i] = self._distancias(self.g, marco)
+            if self.g.direcionado:
+                self.ate[:, i] = self._distancias(reverso, marco)
+            self.validos[i] = True
+
+    def _custo(self, peso: float) -> float:
+        return float(peso) if self.ponderado else 1.0
+
+    # ---------- invalidação incremental ----------
+
+    def registrar_alteracao(
+        self,
+        u: Hashable,
+        v: Hashable,
+        peso_antigo: Optional[float] = None,
+        peso_novo: Optional[float] = None
+    ) -> int:
+        """Marca como inválidos os marcos afetados pela alteração da aresta u -> v.
+
+        Chamar a cada aresta alterada, ainda com as distâncias do grafo
+        anterior: `peso_antigo=None` é uma aresta nova, `peso_novo=None`
+        uma aresta removida (as duas direções, se não direcionado).
+
+        - Inserir (ou baratear) a aresta só muda as distâncias de um
+          marco se ela encurta o caminho até v: d(L, u) + c < d(L, v).
+        - Remover (ou encarecer) só muda se a aresta estava em um
+          menor caminho: d(L, u) + c == d(L, v).
+
+        Os marcos não afetados continuam exatos e seguem respondendo;
+        `atualizar` recalcula os afetados. Vértices novos invalidam tudo.
+
+        :return: número de marcos invalidados por esta alteração.
+        """
+        self._pendentes = True
+        if u not in self.g.ids or v not in self.g.ids:
+            invalidados = int(self.validos.sum())
+            self.validos[:] = False
+            return invalidados
+        a, b = self.g.ids[u], self.g.ids[v]
+        afetados = np.zeros(len(self.marcos), dtype=bool)
+        arcos = [(a, b)] if self.g.direcionado else [(a, b), (b, a)]
+        for x, y in arcos:
+            if peso_novo is not None:
+                c = self._custo(peso_novo)
+                afetados |= self.desde[x] + c < self.desde[y]
+                afetados |= self.ate[y] + c < self.ate[x]
+            if peso_antigo is not None:
+                c = self._custo(peso_antigo)
+                with np.errstate(invalid="ignore"):
+                    afetados |= np.isfinite(self.desde[y]) & (self.desde[x] + c == self.desde[y])
+                    afetados |= np.isfinite(self.ate[x]) & (self.ate[y] + c == self.ate[x])
+        invalidados = int((afetados & self.validos).sum())
+        self.validos &= ~afetados
+        return invalidados
+
+    def atualizar(self, grafo) -> int:
+        """Passa a usar o grafo alterado e recalcula só os marcos inválidos.
+
+        Se o conjunto de vértices mudou, os marcos (mantidos por rótulo
+        quando ainda existem) são todos recalculados.
+
+        :return: número de marcos recalculados.
+        """
+        novo = congelar(grafo)
+        if novo.rotulos != self.g.rotulos:
+            rotulos = [self.g.rotulos[i] for i in self.marcos.tolist()]
+            marcos = [novo.ids[r] for r in rotulos if r in novo.ids]
+            if len(marcos) < len(self.marcos):
+                extras = [i for i in escolher_marcos(novo, len(self.marcos) * 2, self.estrategia).tolist()
+                          if i not in set(marcos)]
+                marcos += extras[:len(self.marcos) - len(marcos)]
+            refeito = OraculoDistancias(novo, estrategia=self.estrategia, ponderado=self.ponderado, marcos=marcos)
+            self.__dict__.update(refeito.__dict__)
+            return len(self.marcos)
+        self.g = novo
+        invalidos = np.flatnonzero(~self.validos).tolist()
+        self._calcular(invalidos)
+        self._pendentes = False
+        return len(invalidos)
+
+    # ---------- consultas ----------
+
+    def _colunas_validas(self):
+        """Índice das colunas dos marcos válidos (fatia inteira se todos forem)."""
+        return slice(None) if self.validos.all() else np.flatnonzero(self.validos)
+
+    def _limites_ids(self, a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        colunas = self._colunas_validas()
+        desde_a, desde_b = self.desde[a][:, colunas], self.desde[b][:, colunas]
+        ate_a, ate_b = self.ate[a][:, colunas], self.ate[b][:, colunas]
+        with np.errstate(invalid="ignore"):
+            superior = np.min(ate_a + desde_b, axis=1, initial=np.inf)
+            diferencas = np.concatenate([desde_b - desde_a, ate_a - ate_b], axis=1)
+        # inf - inf (nenhum dos dois alcança o marco) não limita nada
+        inferior = np.fmax.reduce(np.nan_to_num(diferencas, nan=0.0, posinf=np.inf, neginf=0.0),
+                                  axis=1, initial=0.0)
+        inferior[a == b] = superior[a == b] = 0.0
+        return inferior, superior
+
+    def limites(self, u: Hashable, v: Hashable) -> Tuple[float, float]:
+        """Limites (inferior, superior) de d(u, v) em O(k).
+
+        inf no inferior: v não é alcançável a partir de u; inf no
+        superior: nenhum marco liga os dois.
+        """
+        a = np.array([self.g.id_de(u)])
+        b = np.array([self.g.id_de(v)])
+        inferior, superior = self._limites_ids(a, b)
+        return float(inferior[0]), float(superior[0])
+
+    def limites_lote(self, pares: Iterable[Tuple[Hashable, Hashable]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Limites de vários pares (u, v) de uma vez, vetorizados."""
+        ids = [(self.g.id_de(u), self.g.id_de(v)) for u, v in pares]
+        if not ids:
+            return np.empty(0), np.empty(0)
+        a, b = np.array(ids, dtype=np.int64).T
+        return self._limites_ids(a, b)
+
+    def _heuristica(self, alvo: int, ids=None) -> np.ndarray:
+        """Maior limite inferior de d(x, alvo) entre os marcos válidos (inf: não alcança).
+
+        :param ids: vértices x (padrão: todos).
+        """
+        colunas = self._colunas_validas()
+        desde_alvo, ate_alvo = self.desde[alvo, colunas], self.ate[alvo, colunas]
+        if ids is None:
+            desde_x, ate_x = self.desde[:, colunas], self.ate[:, colunas]
+        else:
+            desde_x, ate_x = self.desde[ids][:, colunas], self.ate[ids][:, colunas]
+        with np.errstate(invalid="ignore"):
+            diferencas = np.concatenate([desde_alvo - desde_x, ate_x - ate_alvo], axis=1)
+        return np.fmax.reduce(diferencas, axis=1, initial=0.0)
+
+    def _busca_niveis(self, origem: int, alvo: int, superior: float) -> Tuple[float, np.ndarray, int]:
+        """BFS por nível (sem pesos) que descarta os vértices fora de um menor caminho.
+
+        x sai da fronteira quando d(origem, x) + h(x) > `superior`: todo
+        caminho por ele é mais longo que um caminho já garantido.
+        """
+        g = self.g
+        dist = np.full(g.n, -1, dtype=np.int32)
+        pai = np.full(g.n, -1, dtype=np.int32)
+        dist[origem] = 0
+        fronteira = np.array([origem], dtype=np.int32)
+        visitados = 1
+        nivel = 0
+        while len(fronteira) and dist[alvo] < 0:
+            nivel += 1
+            vizinhos, de = _vizinhos_da_fronteira(g, fronteira)
+            novos = dist[vizinhos] < 0
+            fronteira, primeiro = np.unique(vizinhos[novos], return_index=True)
+            dist[fronteira] = nivel
+            pai[fronteira] = de[novos][primeiro]
+            visitados += len(fronteira)
+            h = self._heuristica(alvo, fronteira)
+            fronteira = fronteira[np.isfinite(h) & (nivel + h <= superior)]
+        return (float(dist[alvo]) if dist[alvo] >= 0 else np.inf), pai, visitados
+
+    def _alt(self, origem: int, alvo: int, superior: float) -> Tuple[float, np.ndarray, int]:
+        """A* (com pesos) guiado pelos marcos; a heurística é consistente,
+        então cada vértice fecha uma vez.
+        """
+        g = self.g
+        indptr, indices, pesos = memoryview(g.indptr), memoryview(g.indices), memoryview(g.pesos)
+        # heurística de todos os vértices de uma vez: O(n·k) no NumPy, bem
+        # mais barato que o laço do A* em Python
+        h = self._heuristica(alvo).tolist()
+        # folga relativa: a soma em ponto flutuante de nova + h pode passar
+        # do superior por arredondamento quando o menor caminho o atinge
+        superior = superior * (1 + FOLGA_RELATIVA) + FOLGA_RELATIVA
+        dist = {origem: 0.0}
+        pai = np.full(g.n, -1, dtype=np.int32)
+        fechado = set()
+        heap = [(h[origem], origem)]
+        while heap:
+            _, x = heapq.heappop(heap)
+            if x in fechado:
+                continue
+            fechado.add(x)
+            if x == alvo:
+                return dist[x], pai, len(fechado)
+            d = dist[x]
+            inicio, fim = indptr[x], indptr[x + 1]
+            for y, c in zip(indices[inicio:fim], pesos[inicio:fim]):
+                nova = d + c
+                if nova < dist.get(y, np.inf) and h[y] != np.inf and nova + h[y] <= superior:
+                    dist[y] = nova
+                    pai[y] = x
+                    heapq.heappush(heap, (nova + h[y], y))
+        return np.inf, pai, len(fechado)
+
+    def _exata(self, origem: int, alvo: int, superior: Optional[float] = None) -> Tuple[float, np.ndarray, int]:
+        """Distância exata, pais e vértices visitados pela busca guiada."""
+        if self._pendentes:
+            raise RuntimeError("Há arestas alteradas: chame atualizar() com o grafo novo antes da busca exata.")
+        if superior is None:
+            superior = float(self._limites_ids(np.array([origem]), np.array([alvo]))[1][0])
+        buscar = self._alt if self.ponderado else self._busca_niveis
+        resultado = buscar(origem, alvo, superior)
+        if resultado[0] == np.inf and superior != np.inf:
+            # o corte pelo superior nunca deveria esvaziar a busca de um par
+            # alcançável; se esvaziou, repete sem ele
+            resultado = buscar(origem, alvo, np.inf)
+        return resultado
+
+    def distancia(self, u: Hashable, v: Hashable) -> float:
+        """Distância exata de u até v (inf se não houver caminho).
+
+        Quando os limites dos marcos coincidem (ex.: v é marco ou está
+        em um menor caminho que passa por um), responde sem busca; senão
+        roda a busca guiada pelos marcos: A* com pesos e, sem pesos, uma
+        BFS por nível que descarta os vértices cujo limite inferior já
+        passa do superior.
+        """
+        inferior, superior = self.limites(u, v)
+        if inferior == superior:
+            return inferior
+        return self._exata(self.g.id_de(u), self.g.id_de(v), superior)[0]
+
+    def caminho(self, u: Hashable, v: Hashable) -> List[Hashable]:
+        """Um menor caminho de u até v, em rótulos ([] se não houver)."""
+        origem, alvo = self.g.id_de(u), self.g.id_de(v)
+        distancia, pai, _ = self._exata(origem, alvo)
+        if distancia == np.inf:
+            return []
+        sequencia = [alvo]
+        while sequencia[-1] != origem:
+            sequencia.append(int(pai[sequencia[-1]]))
+        return [self.g.rotulos[i] for i in reversed(sequencia)]
+
+    # ---------- persistência ----------
+
+    def blocos(self) -> Dict[str, np.ndarray]:
+        """Blocos `extras` para `GraphFile.salvar`, lidos de volta por `de_arquivo`."""
+        blocos = {
+            "marcos": self.marcos.astype(np.int64),
+            "marcos_desde": np.ascontiguousarray(self.desde).ravel(),
+            "marcos_validos": self.validos.astype(np.uint8),
+            "marcos_config": np.array([int(self.ponderado), ESTRATEGIAS.index(self.estrategia)], dtype=np.int64),
+        }
+        if self.g.direcionado:
+            blocos["marcos_ate"] = np.ascontiguousarray(self.ate).ravel()
+        return blocos
+
+    def salvar(self, caminho: str, extras: Optional[Dict[str, np.ndarray]] = None) -> int:
+        """Grava o grafo e o índice no mesmo arquivo de `GraphFile`.
+
+        :param extras: outros blocos gravados junto.
+        """
+        from Graph_LIB import GraphFile
+
+        if self._pendentes:
+            raise RuntimeError("Há arestas alteradas: chame atualizar() antes de salvar.")
+        return GraphFile.salvar(self.g, caminho, extras={**(extras or {}), **self.blocos()})
+
+    @classmethod
+    def de_arquivo(cls, arquivo) -> "OraculoDistancias":
+        """Índice gravado por `salvar`, sem recalcular distâncias.
+
+        :param arquivo: caminho do arquivo ou `GraphFile.ArquivoGrafo`
+            já aberto. Os arrays ficam sobre o mmap até alguma
+            alteração forçar um recálculo.
+        :raises ValueError: se o arquivo não tiver o índice.
+        """
+        from Graph_LIB import GraphFile
+
+        if isinstance(arquivo, str):
+            arquivo = GraphFile.abrir(arquivo)
+        extras = arquivo.extras
+        if "marcos" not in extras:
+            raise ValueError("O arquivo de grafo não tem um oráculo de distâncias.")
+        g = arquivo.grafo
+        k = len(extras["marcos"])
+        ponderado, estrategia = extras["marcos_config"].tolist()
+
+        oraculo = cls.__new__(cls)
+        oraculo.g = g
+        oraculo.estrategia = ESTRATEGIAS[estrategia]
+        oraculo.ponderado = bool(ponderado)
+        oraculo.marcos = np.array(extras["marcos"])
+        oraculo.desde = extras["marcos_desde"].reshape(g.n, k)
+        oraculo.ate = extras["marcos_ate"].reshape(g.n, k) if g.direcionado else oraculo.desde
+        oraculo.validos = extras["marcos_validos"].astype(bool)
+        oraculo._pendentes = False
+        return oraculo
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """Bytes dos arrays de distâncias (o grafo fica de fora)."""
+        estruturas = {"desde": self.desde.nbytes, "marcos": self.marcos.nbytes}
+        if self.ate is not self.desde:
+            estruturas["ate"] = self.ate.nbytes
+        return {"estruturas": estruturas, "total": sum(estruturas.values())}
+
+    def __repr__(self) -> str:
+        return (f"OraculoDistancias({len(self.marcos)} marcos por {self.estrategia}, "
+                f"{int(self.validos.sum())} válidos, {self.g!r})")
@@ -0,0 +1,311 @@
+"""Grafo dinâmico com remoção de arestas e vértices em O(1) amortizado.
+
+`DynamicGraph` é um `AbstractGraph` pensado para grafos que mudam o
+tempo todo (expirar contas de bot, descartar interações antigas).
+Cada vértice ocupa um slot inteiro; por slot são mantidos:
+
+  - `_saida[s]`: slots de destino, em lista;
+  - `_peso[s]`: pesos paralelos a `_saida[s]`;
+  - `_pos[s]`: índice de cada destino dentro de `_saida[s]`;
+  - `_entrada[s]`: slots de origem (dicionário usado como conjunto).
+
+Remover a aresta u -> v troca a posição dela com a última da lista e
+encurta a lista (swap-remove), usando `_pos` para achar a posição sem
+busca linear. Remover um vértice apaga as arestas incidentes (saída e
+entrada), o peso, o rótulo, e devolve o slot para reuso.
+
+Diferente da classe base, o grafo é simples: repetir `add_edge` não cria
+aresta paralela, e `add_edges_from` soma os pesos das repetidas.
+"""
+
+import sys
+from typing import Any, Dict, Hashable, List, Optional
+
+from Graph_LIB.AbstractGraph import AbstractGraph, bytes_dict, bytes_objetos, relatorio_memoria
+
+
+class DynamicGraph(AbstractGraph):
+    """Grafo direcionado com slots recicláveis e índice de posição das arestas.
+
+    `vertices` é o mapa rótulo -> slot (consulta sem cópia). `edges` e
+    `edge_weights` são montados a cada acesso, só para compatibilidade
+    com quem lê as estruturas da classe base.
+    """
+
+    def __init__(self):
+        """Inicializa os slots vazios (não usa os dicionários da classe base)."""
+        self.peso_vertice = {}
+        self.rotulos = {}
+        self._slot: Dict[Hashable, int] = {}
+        self._rotulo_de: List[Any] = []
+        self._livres: List[int] = []
+        self._saida: List[List[int]] = []
+        self._peso: List[List[Optional[float]]] = []
+        self._pos: List[Dict[int, int]] = []
+        self._entrada: List[Dict[int, None]] = []
+        self._num_arestas = 0
+
+    # ---------- visões compatíveis com AbstractGraph ----------
+
+    @property
+    def vertices(self) -> Dict[Hashable, int]:
+        return self._slot
+
+    @property
+    def edges(self) -> Dict[Hashable, List[Hashable]]:
+        """Cópia rótulo -> lista de vizinhos de saída (O(n + m))."""
+        rotulo = self._rotulo_de
+        return {v: [rotulo[d] for d in self._saida[s]] for v, s in self._slot.items()}
+
+    @property
+    def edge_weights(self) -> Dict[tuple, Any]:
+        """Cópia (u, v) -> peso das arestas com peso definido (O(m))."""
+        rotulo = self._rotulo_de
+        return {
+            (u, rotulo[d]): w
+            for u, s in self._slot.items()
+            for d, w in zip(self._saida[s], self._peso[s])
+            if w is not None
+        }
+
+    # ---------- slots ----------
+
+    def _slot_de(self, node) -> int:
+        try:
+            return self._slot[node]
+        except KeyError:
+            raise ValueError("Node not found in the graph.") from None
+
+    def _novo_slot(self, node) -> int:
+        if self._livres:
+            s = self._livres.pop()
+            self._rotulo_de[s] = node
+        else:
+            s = len(self._rotulo_de)
+            self._rotulo_de.append(node)
+            self._saida.append([])
+            self._peso.append([])
+            self._pos.append({})
+            self._entrada.append({})
+        self._slot[node] = s
+        return s
+
+    def _remover_arco(self, su: int, sv: int) -> bool:
+        """Swap-remove de su -> sv; False se a aresta não existir."""
+        i = self._pos[su].pop(sv, None)
+        if i is None:
+            return False
+        saida, peso = self._saida[su], self._peso[su]
+        ultimo, ultimo_peso = saida.pop(), peso.pop()
+        if i < len(saida):
+            saida[i] = ultimo
+            peso[i] = ultimo_peso
+            self._pos[su][ultimo] = i
+        del self._entrada[sv][su]
+        self._num_arestas -= 1
+        return True
+
+    def _adicionar_arco(self, su: int, sv: int, w) -> None:
+        self._pos[su][sv] = len(self._saida[su])
+        self._saida[su].append(sv)
+        self._peso[su].append(w)
+        self._entrada[sv][su] = None
+        self._num_arestas += 1
+
+    # ---------- vértices ----------
+
+    def add_node(self, node):
+        """Adiciona um vértice (reusando um slot livre); nada muda se já existir."""
+        if node not in self._slot:
+            self._novo_slot(node)
+
+    def add_nodes_from(self, nodes):
+        novos = [node for node in dict.fromkeys(nodes) if node not in self._slot]
+        for node in novos:
+            self._novo_slot(node)
+        return novos
+
+    def remove_node(self, node):
+        """Remove o vértice, suas arestas de saída e de entrada, peso e rótulo.
+
+        Custa O(grau) e devolve o slot para ser reusado.
+
+        Raises:
+            ValueError: se o vértice não existir.
+        """
+        s = self._slot_de(node)
+        entrada = self._entrada[s]
+        entrada.pop(s, None)  # laço: sai junto com as arestas de saída
+        for d in self._saida[s]:
+            if d != s:
+                del self._entrada[d][s]
+        self._num_arestas -= len(self._saida[s])
+        for origem in list(entrada):
+            self._remover_arco(origem, s)
+
+        self._saida[s] = []
+        self._peso[s] = []
+        self._pos[s] = {}
+        self._entrada[s] = {}
+        self._rotulo_de[s] = None
+        self._livres.append(s)
+        del self._slot[node]
+        self.peso_vertice.pop(node, None)
+        self.rotulos.pop(node, None)
+
+    # ---------- arestas ----------
+
+    def add_edge(self, from_node, to_node):
+        """Adiciona a aresta `from_node -> to_node` (sem efeito se já existir).
+
+        Raises:
+            ValueError: se qualquer um dos vértices não existir no grafo.
+        """
+        if from_node not in self._slot or to_node not in self._slot:
+            raise ValueError("Both nodes must be in the graph.")
+        su, sv = self._slot[from_node], self._slot[to_node]
+        if sv not in self._pos[su]:
+            self._adicionar_arco(su, sv, None)
+
+    def add_edges_from(self, edges, create_nodes=False):
+        """Mesmo contrato de `AbstractGraph.add_edges_from` (soma pesos repetidos)."""
+        pesos = self._preparar_lote(edges, create_nodes)
+        slot = self._slot
+
+        novas = 0
+        for (u, v), w in pesos.items():
+            su, sv = slot[u], slot[v]
+            i = self._pos[su].get(sv)
+            if i is None:
+                self._adicionar_arco(su, sv, w)
+                novas += 1
+            else:
+                atual = self._peso[su][i]
+                self._peso[su][i] = (1 if atual is None else atual) + w
+        return novas
+
+    def remove_edge(self, from_node, to_node):
+        """Remove a aresta `from_node -> to_node` e seu peso, se existir (O(1))."""
+        if from_node in self._slot and to_node in self._slot:
+            self._remover_arco(self._slot[from_node], self._slot[to_node])
+
+    def remove_edges_from(self, edges):
+        """Remove várias arestas; devolve quantas existiam."""
+        slot = self._slot
+        removidas = 0
+        for u, v, *_ in edges:
+            if u in slot and v in slot and self._remover_arco(slot[u], slot[v]):
+                removidas += 1
+        return removidas
+
+    # ---------- consultas ----------
+
+    def get_neighbors(self, node):
+        rotulo = self._rotulo_de
+        return [rotulo[d] for d in self._saida[self._slot_de(node)]]
+
+    def get_predecessors(self, node):
+        """Vizinhos de entrada de `node`."""
+        rotulo = self._rotulo_de
+        return [rotulo[o] for o in self._entrada[self._slot_de(node)]]
+
+    def get_vertex_count(self):
+        return len(self._slot)
+
+    def get_edge_count(self):
+        return self._num_arestas
+
+    def has_edge(self, from_node, to_node) -> bool:
+        su, sv = self._slot.get(from_node), self._slot.get(to_node)
+        return su is not None and sv is not None and sv in self._pos[su]
+
+    def get_vertex_in_degree(self, u):
+        return len(self._entrada[self._slot_de(u)])
+
+    def get_vertex_out_degree(self, u):
+        return len(self._saida[self._slot_de(u)])
+
+    def set_vertex_weight(self, v, w):
+        self._slot_de(v)
+        self.peso_vertice[v] = w
+
+    def get_vertex_weight(self, v):
+        self._slot_de(v)
+        return self.peso_vertice.get(v)
+
+    def _indice_aresta(self, u, v):
+        su, sv = self._slot.get(u), self._slot.get(v)
+        i = None if su is None or sv is None else self._pos[su].get(sv)
+        if i is None:
+            raise ValueError("Edge not found in the graph.")
+        return su, i
+
+    def set_edge_weight(self, u, v, w):
+        su, i = self._indice_aresta(u, v)
+        self._peso[su][i] = w
+
+    def get_edge_weight(self, u, v):
+        su, i = self._indice_aresta(u, v)
+        return self._peso[su][i]
+
+    def is_connected(self):
+        """Conectividade fraca por busca nos slots (O(n + m))."""
+        if not self._slot:
+            return True
+        inicio = next(iter(self._slot.values()))
+        visitados = {inicio}
+        pilha = [inicio]
+        while pilha:
+            s = pilha.pop()
+            for t in self._saida[s]:
+                if t not in visitados:
+                    visitados.add(t)
+                    pilha.append(t)
+            for t in self._entrada[s]:
+                if t not in visitados:
+                    visitados.add(t)
+                    pilha.append(t)
+        return len(visitados) == len(self._slot)
+
+    def para_arrays(self):
+        """Arestas com ids compactos 0..n-1, na ordem de inserção dos vértices.
+
+        Slots livres não aparecem; peso não definido vira 1.
+
+        Returns:
+            (rotulos, origens, destinos, pesos), listas paralelas.
+        """
+        compacto = [-1] * len(self._rotulo_de)
+        rotulos = []
+        for node, s in self._slot.items():
+            compacto[s] = len(rotulos)
+            rotulos.append(node)
+
+        origens, destinos, pesos = [], [], []
+        for node, s in self._slot.items():
+            i = compacto[s]
+            for d, w in zip(self._saida[s], self._peso[s]):
+                origens.append(i)
+                destinos.append(compacto[d])
+                pesos.append(1 if w is None else w)
+        return rotulos, origens, destinos, pesos
+
+    def memory_usage(self):
+        """Memória por estrutura (em bytes); mesmo formato de `AbstractGraph.memory_usage`."""
+        tamanho = sys.getsizeof
+        estruturas = {
+            "slots": bytes_dict(self._slot) + tamanho(self._rotulo_de) + tamanho(self._livres),
+            "saida": tamanho(self._saida) + bytes_objetos(self._saida),
+            "pesos_arestas": tamanho(self._peso) + sum(tamanho(p) + bytes_objetos(p) for p in self._peso),
+            "posicoes": tamanho(self._pos) + sum(bytes_dict(p, chaves=False) for p in self._pos),
+            "entrada": tamanho(self._entrada) + bytes_objetos(self._entrada),
+            "peso_vertice": bytes_dict(self.peso_vertice, chaves=False),
+            "rotulos": bytes_dict(self.rotulos, chaves=False),
+        }
+        return relatorio_memoria(estruturas, self._num_arestas)
+
+    def __str__(self):
+        return (
+            f"DynamicGraph({self.get_vertex_count()} vértices, "
+            f"{self.get_edge_count()} arestas, {len(self._livres)} slots livres)"
+        )
@@ -0,0 +1,318 @@
+"""Arquivo binário de grafo: grava um `GrafoCSR` e o reabre por mmap.
+
+Evita refazer o grafo a partir do JSON (`load_data` + `build_graph`) a
+cada execução. O arquivo é a própria representação CSR em blocos
+contíguos, então abrir não copia nem converte as arestas: `indptr`,
+`indices` e `pesos` viram arrays NumPy somente leitura sobre um
+`mmap`. Vários processos (interface, CLI em lote, workers) que abrem o
+mesmo arquivo compartilham as mesmas páginas do cache do sistema.
+
+Layout (versão 1, little-endian):
+
+  - cabeçalho fixo: `MAGICO`, versão, flags (bit 0 = direcionado, bit 1 =
+    ids inteiros), número de blocos, n (vértices) e número de arcos;
+  - tabela de blocos: nome, dtype, deslocamento e número de itens;
+  - blocos, cada um alinhado a `ALINHAMENTO` bytes:
+      indptr (int64, n + 1), indices (int32), pesos (float64),
+      ids (int64 por vértice, ou os textos em UTF-8 separados por "\\0");
+    e, quando existirem, os atributos dos vértices:
+      peso_vertice (float64, NaN = sem peso), rotulo_codigo (int32,
+      -1 = sem rótulo) e rotulo_textos (tabela de rótulos distintos).
+
+Outros blocos (`extras`) podem ser gravados junto e são devolvidos por
+nome em `ArquivoGrafo.extras`; leitores antigos os ignoram. Versões
+maiores que `VERSAO` são recusadas.
+
+Grafos do Graph_LIB são gravados dirigidos, como em `congelar`; aresta
+sem peso definido vira peso 1.
+"""
+
+import math
+import mmap
+import os
+import struct
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from Graph_LIB.AbstractGraph import AbstractGraph
+from Graph_LIB.GraphLIB import GrafoCSR, congelar
+
+MAGICO = b"GRAFOCSR"
+VERSAO = 1
+ALINHAMENTO = 64
+
+DIRECIONADO = 1
+IDS_INTEIROS = 2
+
+_CABECALHO = struct.Struct("<8sHHIQQ")
+_BLOCO = struct.Struct("<16s4sQQ")
+_DTYPES = {"i8": "<i8", "i4": "<i4", "f8": "<f8", "u1": "u1"}
+
+
+class ArquivoGrafo:
+    """Conteúdo de um arquivo de grafo aberto por `abrir`.
+
+    Attributes:
+        grafo: o `GrafoCSR` (arrays de arestas sobre o mmap).
+        versao: versão do layout lida do cabeçalho.
+        peso_vertice: dict vértice -> peso (só os definidos).
+        rotulos: dict vértice -> rótulo (só os definidos).
+        extras: blocos adicionais, nome -> array somente leitura.
+    """
+
+    def __init__(self, grafo, versao, peso_vertice, rotulos, extras):
+        self.grafo = grafo
+        self.versao = versao
+        self.peso_vertice = peso_vertice
+        self.rotulos = rotulos
+        self.extras = extras
+
+    def __repr__(self) -> str:
+        return f"ArquivoGrafo(v{self.versao}, {self.grafo!r}, extras={sorted(self.extras)})"
+
+
+# ---------- escrita ----------
+
+def _juntar_textos(textos: List[str], oque: str) -> np.ndarray:
+    if any("\0" in t for t in textos):
+        raise ValueError(f"{oque} não podem conter o caractere nulo.")
+    return np.frombuffer("\0".join(textos).encode("utf-8"), dtype=np.uint8)
+
+
+def _bloco_ids(rotulos: List[Hashable]):
+    if all(isinstance(r, str) for r in rotulos):
+        return 0, _juntar_textos(rotulos, "Rótulos de vértice")
+    if all(isinstance(r, (int, np.integer)) and not isinstance(r, bool) for r in rotulos):
+        return IDS_INTEIROS, np.asarray(rotulos, dtype=np.int64)
+    raise TypeError("Os vértices precisam ser todos str ou todos int para serem gravados.")
+
+
+def _blocos_atributos(g: GrafoCSR, peso_vertice, rotulos) -> Dict[str, np.ndarray]:
+    blocos = {}
+    if peso_vertice:
+        pesos = np.full(g.n, np.nan)
+        for v, w in peso_vertice.items():
+            if w is not None:
+                pesos[g.ids[v]] = w
+        blocos["peso_vertice"] = pesos
+    if rotulos:
+        codigo_texto: Dict[str, int] = {}
+        codigos = np.full(g.n, -1, dtype=np.int32)
+        for v, texto in rotulos.items():
+            if texto is not None:
+                codigos[g.ids[v]] = codigo_texto.setdefault(str(texto), len(codigo_texto))
+        blocos["rotulo_codigo"] = codigos
+        blocos["rotulo_textos"] = _juntar_textos(list(codigo_texto), "Rótulos")
+    return blocos
+
+
+def _codigo_dtype(array: np.ndarray) -> str:
+    for codigo, dtype in _DTYPES.items():
+        if array.dtype == np.dtype(dtype):
+            return codigo
+    raise TypeError(f"dtype sem suporte no arquivo de grafo: {array.dtype}")
+
+
+def salvar(grafo, caminho: str, extras: Optional[Dict[str, np.ndarray]] = None) -> int:
+    """Grava o grafo em `caminho` (substituição atômica do arquivo).
+
+    :param grafo: `GrafoCSR`, grafo do Graph_LIB ou do NetworkX. Dos
+        grafos do Graph_LIB também são gravados `peso_vertice` e
+        `rotulos`.
+    :param extras: blocos adicionais (nome -> array int64, int32,
+        float64 ou uint8), devolvidos em `ArquivoGrafo.extras`.
+    :return: tamanho do arquivo, em bytes.
+    """
+    g = congelar(grafo)
+    flags = DIRECIONADO if g.direcionado else 0
+    tipo_ids, ids = _bloco_ids(g.rotulos)
+    flags |= tipo_ids
+
+    blocos = {
+        "indptr": g.indptr.astype("<i8", copy=False),
+        "indices": g.indices.astype("<i4", copy=False),
+        "pesos": g.pesos.astype("<f8", copy=False),
+        "ids": ids,
+    }
+    if isinstance(grafo, AbstractGraph):
+        blocos.update(_blocos_atributos(g, grafo.peso_vertice, grafo.rotulos))
+    for nome, array in (extras or {}).items():
+        if nome in blocos:
+            raise ValueError(f"Nome de bloco reservado: {nome}")
+        if len(nome.encode("ascii")) > 16:
+            raise ValueError(f"Nome de bloco longo demais: {nome}")
+        blocos[nome] = np.ascontiguousarray(array)
+
+    # deslocamentos: cabeçalho e tabela primeiro, depois os blocos alinhados
+    posicao = _CABECALHO.size + _BLOCO.size * len(blocos)
+    tabela = []
+    for nome, array in blocos.items():
+        posicao = -(-posicao // ALINHAMENTO) * ALINHAMENTO
+        tabela.append((nome, _codigo_dtype(array), posicao, array.size))
+        posicao += array.nbytes
+
+    temporario = f"{caminho}.tmp{os.getpid()}"
+    try:
+        with open(temporario, "wb") as f:
+            f.write(_CABECALHO.pack(MAGICO, VERSAO, flags, len(blocos), g.n, len(g.indices)))
+            for nome, codigo, deslocamento, itens in tabela:
+                f.write(_BLOCO.pack(nome.encode("ascii"), codigo.encode("ascii"), deslocamento, itens))
+            for (_, _, deslocamento, _), array in zip(tabela, blocos.values()):
+                f.write(b"\0" * (deslocamento - f.tell()))
+                f.write(np.ascontiguousarray(array).data)
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return posicao
+
+
+# ---------- leitura ----------
+
+def _separar_textos(bloco: np.ndarray, quantidade: int) -> List[str]:
+    if quantidade == 0:
+        return []
+    textos = bloco.tobytes().decode("utf-8").split("\0")
+    if len(textos) != quantidade:
+        raise ValueError("Arquivo de grafo corrompido: tabela de textos com tamanho errado.")
+    return textos
+
+
+def ler_cabecalho(caminho: str) -> Dict[str, Any]:
+    """Cabeçalho e tabela de blocos, sem mapear o arquivo.
+
+    :return: {"versao", "direcionado", "ids_inteiros", "n", "arcos",
+        "blocos": {nome: (dtype, deslocamento, itens)}}.
+    :raises ValueError: se não for um arquivo de grafo ou a versão for
+        mais nova que `VERSAO`.
+    """
+    with open(caminho, "rb") as f:
+        return _cabecalho(f.read(_CABECALHO.size), f.read, os.fstat(f.fileno()).st_size)
+
+
+def _cabecalho(inicio: bytes, ler, tamanho: int) -> Dict[str, Any]:
+    if len(inicio) < _CABECALHO.size:
+        raise ValueError("Arquivo de grafo truncado.")
+    magico, versao, flags, num_blocos, n, arcos = _CABECALHO.unpack(inicio)
+    if magico != MAGICO:
+        raise ValueError("Não é um arquivo de grafo do Graph_LIB.")
+    if versao > VERSAO:
+        raise ValueError(f"Versão {versao} do arquivo de grafo não suportada (máximo: {VERSAO}).")
+
+    blocos = {}
+    for _ in range(num_blocos):
+        nome, codigo, deslocamento, itens = _BLOCO.unpack(ler(_BLOCO.size))
+        codigo = codigo.rstrip(b"\0").decode("ascii")
+        if codigo not in _DTYPES:
+            raise ValueError(f"Arquivo de grafo corrompido: dtype desconhecido {codigo!r}.")
+        dtype = np.dtype(_DTYPES[codigo])
+        if deslocamento + itens * dtype.itemsize > tamanho:
+            raise ValueError("Arquivo de grafo truncado.")
+        blocos[nome.rstrip(b"\0").decode("ascii")] = (dtype, deslocamento, itens)
+
+    return {
+        "versao": versao,
+        "direcionado": bool(flags & DIRECIONADO),
+        "ids_inteiros": bool(flags & IDS_INTEIROS),
+        "n": n,
+        "arcos": arcos,
+        "blocos": blocos,
+    }
+
+
+class _Leitor:
+    """Lê em sequência de um buffer (mmap ou bytes), como `file.read`."""
+
+    def __init__(self, dados, posicao):
+        self.dados = dados
+        self.posicao = posicao
+
+    def __call__(self, tamanho):
+        trecho = self.dados[self.posicao:self.posicao + tamanho]
+        self.posicao += tamanho
+        return trecho
+
+
+def abrir(caminho: str, usar_mmap: bool = True) -> ArquivoGrafo:
+    """Abre um arquivo gravado por `salvar`.
+
+    :param usar_mmap: False lê o arquivo inteiro para a memória (útil
+        quando o arquivo vai ser sobrescrito enquanto o grafo é usado).
+    """
+    with open(caminho, "rb") as f:
+        if usar_mmap:
+            dados = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            dados = f.read()
+    info = _cabecalho(dados[:_CABECALHO.size], _Leitor(dados, _CABECALHO.size), len(dados))
+
+    def bloco(nome):
+        dtype, deslocamento, itens = info["blocos"][nome]
+        return np.frombuffer(dados, dtype=dtype, count=itens, offset=deslocamento)
+
+    n = info["n"]
+    if info["ids_inteiros"]:
+        rotulos = bloco("ids").tolist()
+    else:
+        rotulos = _separar_textos(bloco("ids"), n)
+    grafo = GrafoCSR(bloco("indptr"), bloco("indices"), bloco("pesos"), rotulos, info["direcionado"])
+
+    peso_vertice = {}
+    if "peso_vertice" in info["blocos"]:
+        pesos = bloco("peso_vertice").tolist()
+        peso_vertice = {r: w for r, w in zip(rotulos, pesos) if not math.isnan(w)}
+
+    rotulos_vertice = {}
+    if "rotulo_codigo" in info["blocos"]:
+        codigos = bloco("rotulo_codigo")
+        distintos = int(codigos.max()) + 1 if n else 0
+        textos = _separar_textos(bloco("rotulo_textos"), distintos)
+        rotulos_vertice = {r: textos[c] for r, c in zip(rotulos, codigos.tolist()) if c >= 0}
+
+    reservados = {"indptr", "indices", "pesos", "ids", "peso_vertice", "rotulo_codigo", "rotulo_textos"}
+    extras = {nome: bloco(nome) for nome in info["blocos"] if nome not in reservados}
+    return ArquivoGrafo(grafo, info["versao"], peso_vertice, rotulos_vertice, extras)
+
+
+def carregar(caminho: str, usar_mmap: bool = True) -> GrafoCSR:
+    """Atalho para `abrir(caminho).grafo`."""
+    return abrir(caminho, usar_mmap).grafo
+
+
+def carregar_grafo(caminho: str, classe=None) -> AbstractGraph:
+    """Reconstrói um grafo mutável do Graph_LIB a partir do arquivo.
+
+    As arestas entram com `add_edges_from` (um lote só), ou direto dos
+    arrays quando a classe tem `de_csr` (`CompactGraph`), com os pesos,
+    `peso_vertice` e `rotulos` gravados. Em arquivos não direcionados
+    cada aresta vira as duas arestas dirigidas.
+
+    :param classe: `CompactGraph` (padrão), `DynamicGraph`,
+        `AdjacencyListGraph` ou outra subclasse de `AbstractGraph` com
+        construtor sem argumentos.
+    """
+    if classe is None:
+        from Graph_LIB.CompactGraph import CompactGraph
+        classe = CompactGraph
+
+    arquivo = abrir(caminho)
+    g = arquivo.grafo
+    rotulos = g.rotulos
+    if hasattr(classe, "de_csr"):
+        grafo = classe.de_csr(g.indptr, g.indices, g.pesos, rotulos)
+    else:
+        grafo = classe()
+        grafo.add_nodes_from(rotulos)
+        origens = [rotulos[i] for i in g.origens().tolist()]
+        destinos = [rotulos[i] for i in g.indices.tolist()]
+        grafo.add_edges_from(zip(origens, destinos, g.pesos.tolist()))
+
+    for v, w in arquivo.peso_vertice.items():
+        grafo.set_vertex_weight(v, w)
+    if hasattr(grafo, "set_rotulo"):
+        for v, texto in arquivo.rotulos.items():
+            grafo.set_rotulo(v, texto)
+    else:
+        grafo.rotulos.update(arquivo.rotulos)
+    return grafo
@@ -1 +1,1193 @@
-# PASSAR TODAS AS FUNÇÕES DA API PRA CÁ.
\ No newline at end of file
+"""Fachada do Graph_LIB: grafo congelado em arrays e algoritmos de percurso.
+
+`GrafoCSR` congela qualquer representação do Graph_LIB
+(`AbstractGraph`, `AdjacencyListGraph`, `AdjacencyMatrixGraph`,
+`DynamicGraph`, `CompactGraph`), um
+grafo do NetworkX ou uma lista de arestas em três arrays no formato CSR:
+
+  - `indptr[i]:indptr[i + 1]` é a faixa dos vizinhos do vértice i;
+  - `indices` guarda os vizinhos (ids inteiros) de todos os vértices;
+  - `pesos` é paralelo a `indices` (arestas repetidas somam o peso,
+    como em `main.build_graph`).
+
+Os vértices são internados: o vértice i tem rótulo `rotulos[i]` e
+`ids[rotulo] == i`. Os algoritmos trabalham só com esses ids e
+devolvem arrays indexados por eles; `para_rotulos` converte um array
+para o dicionário rótulo -> valor usado no resto do projeto.
+
+Algoritmos:
+  - `bfs` e `bfs_multiplas_origens`: expandem a fronteira inteira de
+    cada nível com NumPy, em vez de visitar vértice a vértice;
+  - `componentes_conexos` e `ordem_topologica`: também por nível,
+    sem laço Python por vértice;
+  - `dfs` e `dijkstra` (heap binário): iterativos, sem recursão,
+    lendo os vizinhos de cada vértice uma única vez direto dos buffers.
+
+Centralidades com a mesma definição e normalização do NetworkX (e do
+PageRank manual de `Metrics.CentralityMetrics`): `pagerank`,
+`closeness`, `betweenness` (Brandes) e `agrupamento`; para grafos
+direcionados, `hits`, `reciprocidade` e `metricas_direcionadas`, que
+tiram força de entrada/saída, HITS e reciprocidade dos mesmos produtos
+esparsos sobre o par CSR/CSC (`ProdutosEsparsos`). São elas que
+`CentralityMetrics` e os `CommunityMetrics` usam quando recebem um grafo
+do Graph_LIB; `GrafoCSR.para_networkx` fica para o que não tem versão
+nativa (detecção de comunidades).
+"""
+
+import heapq
+import random
+import sys
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Graph_LIB.AbstractGraph import AbstractGraph, bytes_objetos, relatorio_memoria
+from Graph_LIB.CompactGraph import CompactGraph
+from Graph_LIB.DynamicGraph import DynamicGraph
+
+
+class GrafoCSR:
+    """Grafo imutável em arrays CSR com ids de vértice internados.
+
+    Em grafos não direcionados cada aresta aparece nos dois sentidos
+    (u -> v e v -> u); laços aparecem uma vez.
+    """
+
+    def __init__(
+        self,
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        pesos: Sequence[float],
+        rotulos: Sequence[Hashable],
+        direcionado: bool = False
+    ):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.pesos = np.asarray(pesos, dtype=np.float64)
+        self.rotulos = list(rotulos)
+        self.ids = {rotulo: i for i, rotulo in enumerate(self.rotulos)}
+        self.direcionado = direcionado
+        self._transposto = None
+
+        if len(self.indptr) != len(self.rotulos) + 1:
+            raise ValueError("indptr deve ter um elemento a mais que o número de vértices.")
+        if len(self.indices) != len(self.pesos) or self.indptr[-1] != len(self.indices):
+            raise ValueError("indices e pesos devem ter o tamanho indicado por indptr[-1].")
+
+    # ---------- construção ----------
+
+    @classmethod
+    def de_arrays(
+        cls,
+        n: int,
+        origens: Sequence[int],
+        destinos: Sequence[int],
+        pesos: Optional[Sequence[float]] = None,
+        rotulos: Optional[Sequence[Hashable]] = None,
+        direcionado: bool = False
+    ) -> "GrafoCSR":
+        """Monta o grafo a partir de arestas já em ids inteiros (0..n-1).
+
+        Arestas repetidas viram uma só com a soma dos pesos.
+        """
+        u = np.asarray(origens, dtype=np.int64)
+        v = np.asarray(destinos, dtype=np.int64)
+        w = np.ones(len(u)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+        if len(u) != len(v) or len(u) != len(w):
+            raise ValueError("origens, destinos e pesos devem ter o mesmo tamanho.")
+        if len(u) and (min(u.min(), v.min()) < 0 or max(u.max(), v.max()) >= n):
+            raise ValueError("Aresta com vértice fora do intervalo 0..n-1.")
+
+        if not direcionado:
+            fora_laco = u != v
+            u, v, w = (
+                np.concatenate([u, v[fora_laco]]),
+                np.concatenate([v, u[fora_laco]]),
+                np.concatenate([w, w[fora_laco]]),
+            )
+
+        # ordena por (origem, destino) e soma os pesos das repetidas
+        codigo = u * n + v
+        ordem = np.argsort(codigo, kind="stable")
+        codigo = codigo[ordem]
+        unicos, inicios = np.unique(codigo, return_index=True)
+        soma = np.add.reduceat(w[ordem], inicios) if len(codigo) else np.empty(0)
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(unicos // n, minlength=n), out=indptr[1:])
+        return cls(
+            indptr,
+            unicos % n,
+            soma,
+            rotulos if rotulos is not None else range(n),
+            direcionado
+        )
+
+    @classmethod
+    def de_arestas(
+        cls,
+        arestas: Iterable[Tuple],
+        vertices: Iterable[Hashable] = (),
+        direcionado: bool = False
+    ) -> "GrafoCSR":
+        """Monta o grafo a partir de tuplas (u, v) ou (u, v, peso) com rótulos.
+
+        :param vertices: vértices a incluir mesmo sem arestas (ex.: data["users"]).
+        """
+        ids: Dict[Hashable, int] = {}
+        for vertice in vertices:
+            ids.setdefault(vertice, len(ids))
+
+        origens, destinos, pesos = [], [], []
+        for aresta in arestas:
+            origens.append(ids.setdefault(aresta[0], len(ids)))
+            destinos.append(ids.setdefault(aresta[1], len(ids)))
+            pesos.append(aresta[2] if len(aresta) > 2 and aresta[2] is not None else 1.0)
+
+        return cls.de_arrays(len(ids), origens, destinos, pesos, list(ids), direcionado)
+
+    @classmethod
+    def de_networkx(cls, G, weight: str = "weight") -> "GrafoCSR":
+        """Congela um nx.Graph/nx.DiGraph (peso padrão 1)."""
+        rotulos = list(G.nodes())
+        ids = {rotulo: i for i, rotulo in enumerate(rotulos)}
+        m = G.number_of_edges()
+        origens = np.empty(m, dtype=np.int64)
+        destinos = np.empty(m, dtype=np.int64)
+        pesos = np.empty(m, dtype=np.float64)
+        for i, (u, v, w) in enumerate(G.edges(data=weight, default=1)):
+            origens[i] = ids[u]
+            destinos[i] = ids[v]
+            pesos[i] = w
+        return cls.de_arrays(len(rotulos), origens, destinos, pesos, rotulos, G.is_directed())
+
+    @classmethod
+    def de_grafo(cls, grafo: AbstractGraph, direcionado: bool = True) -> "GrafoCSR":
+        """Congela um grafo do Graph_LIB.
+
+        Arestas sem peso definido valem 1. Vale também para
+        `AdjacencyMatrixGraph`: as arestas saem de `edges`/`edge_weights`
+        (a matriz é só um espelho dos vértices 0..num_vertices-1).
+
+        :param direcionado: False trata cada aresta u -> v como {u, v}.
+        """
+        if isinstance(grafo, (DynamicGraph, CompactGraph)):
+            rotulos, origens, destinos, pesos = grafo.para_arrays()
+            return cls.de_arrays(len(rotulos), origens, destinos, pesos, rotulos, direcionado)
+
+        rotulos = list(grafo.vertices)
+        ids = {rotulo: i for i, rotulo in enumerate(rotulos)}
+        pesos_definidos = grafo.edge_weights
+        origens, destinos, pesos = [], [], []
+        for u, vizinhos in grafo.edges.items():
+            i = ids[u]
+            for v in vizinhos:
+                origens.append(i)
+                destinos.append(ids[v])
+                w = pesos_definidos.get((u, v))
+                pesos.append(1.0 if w is None else w)
+        return cls.de_arrays(len(rotulos), origens, destinos, pesos, rotulos, direcionado)
+
+    # ---------- consultas ----------
+
+    @property
+    def n(self) -> int:
+        """Número de vértices."""
+        return len(self.rotulos)
+
+    @property
+    def m(self) -> int:
+        """Número de arestas (cada aresta não direcionada conta uma vez)."""
+        if self.direcionado:
+            return len(self.indices)
+        lacos = int(np.count_nonzero(self.indices == self.origens()))
+        return (len(self.indices) + lacos) // 2
+
+    def graus(self) -> np.ndarray:
+        """Grau de saída (ou grau, se não direcionado) de cada vértice."""
+        return np.diff(self.indptr)
+
+    def forcas(self) -> np.ndarray:
+        """Soma dos pesos das arestas de saída de cada vértice.
+
+        Em grafos não direcionados é o grau ponderado do NetworkX
+        (laços contam duas vezes).
+        """
+        origens = self.origens()
+        forca = np.bincount(origens, weights=self.pesos, minlength=self.n)
+        if not self.direcionado:
+            laco = self.indices == origens
+            forca += np.bincount(origens[laco], weights=self.pesos[laco], minlength=self.n)
+        return forca
+
+    def origens(self) -> np.ndarray:
+        """Vértice de origem de cada posição de `indices`."""
+        return np.repeat(np.arange(self.n, dtype=np.int32), self.graus())
+
+    def vizinhos(self, i: int) -> np.ndarray:
+        """Vizinhos de saída do vértice de id `i`."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def id_de(self, rotulo: Hashable) -> int:
+        try:
+            return self.ids[rotulo]
+        except KeyError:
+            raise ValueError(f"Vértice não encontrado no grafo: {rotulo!r}") from None
+
+    def transposto(self) -> "GrafoCSR":
+        """Grafo com as arestas invertidas (o próprio grafo se não direcionado)."""
+        if not self.direcionado:
+            return self
+        if self._transposto is None:
+            self._transposto = GrafoCSR.de_arrays(
+                self.n, self.indices, self.origens(), self.pesos, self.rotulos, direcionado=True
+            )
+            self._transposto._transposto = self
+        return self._transposto
+
+    def simetrico(self) -> "GrafoCSR":
+        """Versão não direcionada (u -> v vira {u, v}, somando os pesos)."""
+        if not self.direcionado:
+            return self
+        return GrafoCSR.de_arrays(self.n, self.origens(), self.indices, self.pesos, self.rotulos)
+
+    def subgrafo(self, manter) -> "GrafoCSR":
+        """Subgrafo induzido pelos vértices em `manter`.
+
+        :param manter: máscara booleana por id ou array de ids.
+        :return: grafo com ids renumerados na ordem original (o rótulo
+            de cada vértice continua o mesmo).
+        """
+        mascara = np.zeros(self.n, dtype=bool)
+        mascara[manter] = True
+        novo_id = np.cumsum(mascara) - 1
+        u, v = self.origens(), self.indices
+        fica = mascara[u] & mascara[v]
+        k = int(mascara.sum())
+
+        # renumerar preserva a ordem, então as faixas continuam ordenadas
+        indptr = np.zeros(k + 1, dtype=np.int64)
+        np.cumsum(np.bincount(novo_id[u[fica]], minlength=k), out=indptr[1:])
+        rotulos = [self.rotulos[i] for i in np.flatnonzero(mascara).tolist()]
+        return GrafoCSR(indptr, novo_id[v[fica]], self.pesos[fica], rotulos, self.direcionado)
+
+    def para_networkx(self, weight: str = "weight"):
+        """Cópia em nx.Graph/nx.DiGraph, para algoritmos sem versão nativa."""
+        import networkx as nx
+
+        G = nx.DiGraph() if self.direcionado else nx.Graph()
+        G.add_nodes_from(self.rotulos)
+        origens = self.origens()
+        manter = slice(None) if self.direcionado else origens <= self.indices
+        rotulos = self.rotulos
+        G.add_weighted_edges_from(
+            (
+                (rotulos[u], rotulos[v], w)
+                for u, v, w in zip(
+                    origens[manter].tolist(), self.indices[manter].tolist(), self.pesos[manter].tolist()
+                )
+            ),
+            weight=weight
+        )
+        return G
+
+    def para_rotulos(self, valores: Sequence, ignorar: Any = None) -> Dict[Hashable, Any]:
+        """Array indexado por id -> dicionário rótulo -> valor.
+
+        :param ignorar: valor omitido do resultado (ex.: -1 ou inf para
+            vértices não alcançados).
+        """
+        lista = valores.tolist() if isinstance(valores, np.ndarray) else list(valores)
+        if ignorar is None:
+            return dict(zip(self.rotulos, lista))
+        return {r: v for r, v in zip(self.rotulos, lista) if v != ignorar}
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """Memória por estrutura (em bytes); mesmo formato de `AbstractGraph.memory_usage`.
+
+        O transposto em cache, se já tiver sido montado, entra à parte.
+        """
+        estruturas = {
+            "indptr": self.indptr.nbytes,
+            "indices": self.indices.nbytes,
+            "pesos": self.pesos.nbytes,
+            "rotulos": sys.getsizeof(self.rotulos) + bytes_objetos(self.rotulos),
+            "ids": sys.getsizeof(self.ids) + bytes_objetos(self.ids.values()),
+        }
+        if self._transposto is not None:
+            t = self._transposto
+            estruturas["transposto"] = t.indptr.nbytes + t.indices.nbytes + t.pesos.nbytes
+        return relatorio_memoria(estruturas, self.m)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        tipo = "direcionado" if self.direcionado else "não direcionado"
+        return f"GrafoCSR({tipo}, {self.n} vértices, {self.m} arestas)"
+
+
+def e_networkx(grafo) -> bool:
+    """Indica se `grafo` é do NetworkX (sem precisar importá-lo)."""
+    return hasattr(grafo, "adj") and hasattr(grafo, "is_directed")
+
+
+def congelar(grafo, direcionado: Optional[bool] = None) -> GrafoCSR:
+    """Converte qualquer grafo suportado em `GrafoCSR` (sem cópia se já for).
+
+    :param direcionado: só para grafos do Graph_LIB, que são dirigidos
+        por definição; None mantém a direção.
+    """
+    if isinstance(grafo, GrafoCSR):
+        return grafo
+    if isinstance(grafo, AbstractGraph):
+        return GrafoCSR.de_grafo(grafo, direcionado=True if direcionado is None else direcionado)
+    if e_networkx(grafo):
+        return GrafoCSR.de_networkx(grafo)
+    raise TypeError(f"Tipo de grafo não suportado: {type(grafo).__name__}")
+
+
+# ---------- percursos ----------
+
+def _vizinhos_da_fronteira(g: GrafoCSR, fronteira: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vizinhos de todos os vértices da fronteira e, para cada um, de quem veio."""
+    inicios = g.indptr[fronteira]
+    tamanhos = g.indptr[fronteira + 1] - inicios
+    total = int(tamanhos.sum())
+    if total == 0:
+        vazio = np.empty(0, dtype=np.int32)
+        return vazio, vazio
+    # posição em `indices` = início da faixa do vértice + deslocamento dentro dela
+    deslocamento = np.repeat(inicios - (np.cumsum(tamanhos) - tamanhos), tamanhos)
+    posicoes = np.arange(total, dtype=np.int64) + deslocamento
+    return g.indices[posicoes], np.repeat(fronteira, tamanhos)
+
+
+def _niveis(
+    g: GrafoCSR,
+    origens: np.ndarray,
+    dist: np.ndarray,
+    pai: Optional[np.ndarray] = None,
+    profundidade_max: Optional[int] = None
+):
+    """Percorre em largura preenchendo `dist` (e `pai`); gera cada fronteira."""
+    fronteira = np.unique(origens).astype(np.int32)
+    dist[fronteira] = 0
+    nivel = 0
+    while len(fronteira):
+        yield fronteira
+        if profundidade_max is not None and nivel >= profundidade_max:
+            return
+        nivel += 1
+        vizinhos, de = _vizinhos_da_fronteira(g, fronteira)
+        novos = dist[vizinhos] < 0
+        fronteira, primeiro = np.unique(vizinhos[novos], return_index=True)
+        dist[fronteira] = nivel
+        if pai is not None:
+            pai[fronteira] = de[novos][primeiro]
+
+
+def bfs(
+    g: GrafoCSR,
+    origem: int,
+    profundidade_max: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Busca em largura a partir do id `origem`.
+
+    :return: (ordem, dist, pai). `ordem` lista os vértices alcançados
+        nível a nível (dentro do nível, por id); `dist` é o número de
+        arestas até a origem (-1 se não alcançado); `pai` é o
+        antecessor na árvore de busca (-1 na origem e nos não alcançados).
+    """
+    dist = np.full(g.n, -1, dtype=np.int32)
+    pai = np.full(g.n, -1, dtype=np.int32)
+    niveis = list(_niveis(g, np.array([origem]), dist, pai, profundidade_max))
+    return np.concatenate(niveis), dist, pai
+
+
+def bfs_multiplas_origens(
+    g: GrafoCSR,
+    origens: Iterable[int],
+    profundidade_max: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Busca em largura simultânea a partir de várias origens.
+
+    :return: (dist, origem_mais_proxima), ambos -1 nos vértices não
+        alcançados. Em empates, vale a origem do vizinho de menor id
+        no nível anterior.
+    """
+    dist = np.full(g.n, -1, dtype=np.int32)
+    pai = np.full(g.n, -1, dtype=np.int32)
+    origens = np.fromiter(origens, dtype=np.int32)
+    mais_proxima = np.full(g.n, -1, dtype=np.int32)
+    for fronteira in _niveis(g, origens, dist, pai, profundidade_max):
+        # cada vértice herda a origem do pai, que está no nível anterior
+        com_pai = pai[fronteira] >= 0
+        mais_proxima[fronteira[~com_pai]] = fronteira[~com_pai]
+        mais_proxima[fronteira[com_pai]] = mais_proxima[pai[fronteira[com_pai]]]
+    return dist, mais_proxima
+
+
+def dfs(g: GrafoCSR, origem: int) -> Tuple[List[int], np.ndarray]:
+    """Busca em profundidade iterativa (pré-ordem) a partir do id `origem`.
+
+    :return: (ordem, pai), com pai -1 na origem e nos não alcançados.
+    """
+    # memoryview devolve ints do Python sem criar escalares do NumPy
+    indptr, indices = memoryview(g.indptr), memoryview(g.indices)
+    visitado = bytearray(g.n)
+    pai = [-1] * g.n
+
+    visitado[origem] = 1
+    ordem = [origem]
+    pilha = [(origem, iter(indices[indptr[origem]:indptr[origem + 1]]))]
+    while pilha:
+        v, vizinhos = pilha[-1]
+        for w in vizinhos:
+            if not visitado[w]:
+                visitado[w] = 1
+                pai[w] = v
+                ordem.append(w)
+                pilha.append((w, iter(indices[indptr[w]:indptr[w + 1]])))
+                break
+        else:
+            pilha.pop()
+    return ordem, np.array(pai, dtype=np.int32)
+
+
+def dijkstra(
+    g: GrafoCSR,
+    origem: int,
+    alvo: Optional[int] = None,
+    custos: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Menores caminhos a partir de `origem` com heap binário.
+
+    O custo de cada aresta é o peso, como `weight="weight"` no NetworkX.
+
+    :param alvo: se definido, para assim que a distância dele é final.
+    :param custos: custo alternativo de cada aresta, paralelo a `g.indices`
+        (ex.: 1 / g.pesos para tratar interações fortes como próximas).
+    :return: (dist, pai); dist é inf e pai -1 nos não alcançados.
+    """
+    custos = g.pesos if custos is None else np.ascontiguousarray(custos, dtype=np.float64)
+    if len(custos) != len(g.indices):
+        raise ValueError("custos deve ter um valor por aresta de g.indices.")
+    if len(custos) and custos.min() < 0:
+        raise ValueError("Dijkstra não aceita arestas com custo negativo.")
+
+    indptr, indices, custos = memoryview(g.indptr), memoryview(g.indices), memoryview(custos)
+    dist = [np.inf] * g.n
+    pai = [-1] * g.n
+    final = bytearray(g.n)
+
+    dist[origem] = 0.0
+    heap = [(0.0, origem)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if final[v]:
+            continue
+        final[v] = 1
+        if v == alvo:
+            break
+        inicio, fim = indptr[v], indptr[v + 1]
+        for w, c in zip(indices[inicio:fim], custos[inicio:fim]):
+            nova = d + c
+            if nova < dist[w]:
+                dist[w] = nova
+                pai[w] = v
+                heapq.heappush(heap, (nova, w))
+    return np.array(dist), np.array(pai, dtype=np.int32)
+
+
+def caminho(pai: np.ndarray, origem: int, alvo: int) -> List[int]:
+    """Reconstrói o caminho origem -> alvo a partir do array de pais ([] se não houver)."""
+    if alvo != origem and pai[alvo] < 0:
+        return []
+    sequencia = [alvo]
+    while sequencia[-1] != origem:
+        sequencia.append(int(pai[sequencia[-1]]))
+    sequencia.reverse()
+    return sequencia
+
+
+# ---------- estrutura global ----------
+
+def componentes_conexos(g: GrafoCSR) -> Tuple[np.ndarray, int]:
+    """Componente de cada vértice (fracamente conexo, se direcionado).
+
+    Propaga o menor id entre vizinhos e encurta os ponteiros até
+    estabilizar, tudo com operações sobre os arrays inteiros.
+
+    :return: (componente, quantidade). Componentes numerados de 0 em
+        diante, na ordem do menor id de cada um.
+    """
+    g = g.simetrico()
+    n = g.n
+    rotulo = np.arange(n, dtype=np.int64)
+    com_vizinhos = np.flatnonzero(g.graus() > 0)
+    inicios = g.indptr[com_vizinhos]
+
+    while len(com_vizinhos):
+        novo = rotulo.copy()
+        menor_vizinho = np.minimum.reduceat(rotulo[g.indices], inicios)
+        novo[com_vizinhos] = np.minimum(novo[com_vizinhos], menor_vizinho)
+        # leva o menor rótulo também para a raiz atual do vértice
+        np.minimum.at(novo, rotulo, novo)
+        while True:
+            encurtado = novo[novo]
+            if np.array_equal(encurtado, novo):
+                break
+            novo = encurtado
+        if np.array_equal(novo, rotulo):
+            break
+        rotulo = novo
+
+    raizes, componente = np.unique(rotulo, return_inverse=True)
+    return componente.astype(np.int32), len(raizes)
+
+
+def maior_componente(g: GrafoCSR) -> np.ndarray:
+    """Máscara dos vértices do maior componente (fracamente) conexo.
+
+    Empates ficam com o componente de menor id.
+    """
+    componente, quantidade = componentes_conexos(g)
+    if quantidade == 0:
+        return np.zeros(0, dtype=bool)
+    return componente == np.argmax(np.bincount(componente))
+
+
+class IndiceComponentes:
+    """Índice de componentes (fracamente) conexos em union-find.
+
+    `pai` aponta para o representante de cada id, com compressão de
+    caminho na consulta e união por tamanho, então unir componentes à
+    medida que arestas chegam custa O(α(n)) por aresta. `de_grafo`
+    parte dos componentes já calculados de forma vetorizada.
+    """
+
+    def __init__(self, n: int = 0):
+        self.pai = list(range(n))
+        self.tamanho = [1] * n
+        self.quantidade = n
+
+    @classmethod
+    def de_grafo(cls, g: GrafoCSR) -> "IndiceComponentes":
+        """Índice com as arestas de `g` já unidas (cada id aponta para a raiz)."""
+        componente, k = componentes_conexos(g)
+        raiz = np.full(k, g.n, dtype=np.int64)
+        np.minimum.at(raiz, componente, np.arange(g.n))
+        tamanho = np.ones(g.n, dtype=np.int64)
+        tamanho[raiz] = np.bincount(componente, minlength=k)
+
+        indice = cls()
+        indice.pai = raiz[componente].tolist()
+        indice.tamanho = tamanho.tolist()
+        indice.quantidade = k
+        return indice
+
+    def __len__(self) -> int:
+        return len(self.pai)
+
+    def adicionar_vertice(self) -> int:
+        """Novo vértice isolado; devolve o id dele."""
+        self.pai.append(len(self.pai))
+        self.tamanho.append(1)
+        self.quantidade += 1
+        return len(self.pai) - 1
+
+    def raiz(self, x: int) -> int:
+        pai = self.pai
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    def unir(self, a: int, b: int) -> bool:
+        """Une os componentes de a e b; False se já eram o mesmo."""
+        a, b = self.raiz(a), self.raiz(b)
+        if a == b:
+            return False
+        if self.tamanho[a] < self.tamanho[b]:
+            a, b = b, a
+        self.pai[b] = a
+        self.tamanho[a] += self.tamanho[b]
+        self.quantidade -= 1
+        return True
+
+    def mesmo_componente(self, a: int, b: int) -> bool:
+        return self.raiz(a) == self.raiz(b)
+
+    def tamanho_de(self, x: int) -> int:
+        """Número de vértices no componente de x."""
+        return self.tamanho[self.raiz(x)]
+
+    def componentes(self) -> Tuple[np.ndarray, int]:
+        """(componente de cada id, quantidade), como em `componentes_conexos`."""
+        pai = np.array(self.pai, dtype=np.int64)
+        while True:
+            salto = pai[pai]
+            if np.array_equal(salto, pai):
+                break
+            pai = salto
+        raizes, componente = np.unique(pai, return_inverse=True)
+        return componente.astype(np.int32), len(raizes)
+
+    def grupos(self, minimo: int = 1) -> List[np.ndarray]:
+        """Ids de cada componente com pelo menos `minimo` vértices, maiores primeiro."""
+        componente, k = self.componentes()
+        contagem = np.bincount(componente, minlength=k)
+        ordem = np.argsort(componente, kind="stable")
+        grupos = np.split(ordem, np.cumsum(contagem)[:-1]) if k else []
+        grupos = [ids for ids in grupos if len(ids) >= minimo]
+        grupos.sort(key=len, reverse=True)
+        return grupos
+
+
+def _vizinhanca_total(g: GrafoCSR) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Adjacência sem laços com os vizinhos de saída e de entrada.
+
+    Em grafos direcionados o grau é entrada + saída e um par recíproco
+    aparece duas vezes, como em `nx.core_number` para DiGraph.
+
+    :return: (indptr, indices, pesos).
+    """
+    u, v, w = g.origens(), g.indices, g.pesos
+    if g.direcionado:
+        u, v, w = np.concatenate([u, v]), np.concatenate([v, u]), np.concatenate([w, w])
+    fora_laco = u != v
+    u, v, w = u[fora_laco], v[fora_laco], w[fora_laco]
+    ordem = np.argsort(u, kind="stable")
+    indptr = np.zeros(g.n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=g.n), out=indptr[1:])
+    return indptr, v[ordem].astype(np.int32), w[ordem]
+
+
+def nucleos(g: GrafoCSR, ponderado: bool = False) -> np.ndarray:
+    """Número de núcleo (k-core) de cada vértice.
+
+    Sem pesos, é o algoritmo de baldes de Batagelj-Zaversnik em O(m),
+    com o mesmo resultado de `nx.core_number`: os vértices são
+    visitados em ordem de grau restante e cada visita decrementa o grau
+    dos vizinhos ainda não visitados, trocando-os de balde em O(1).
+
+    Com `ponderado`, é o núcleo generalizado pela força (soma dos pesos
+    para os vizinhos restantes): o vértice de menor força sai primeiro
+    e seu núcleo é a maior força vista até a saída dele. Como a força
+    não é inteira, os baldes viram um heap (O(m log n)).
+
+    Laços são ignorados (o NetworkX recusa grafos com laços).
+
+    :return: array float64 com o núcleo de cada id.
+    """
+    indptr, indices, pesos = _vizinhanca_total(g)
+    if ponderado:
+        return _nucleos_ponderados(g.n, indptr, indices, pesos)
+
+    n = g.n
+    grau = np.diff(indptr).tolist()
+    if n == 0:
+        return np.zeros(0)
+
+    # vert: vértices ordenados por grau; pos: posição de cada um em vert;
+    # inicio[d]: primeira posição do balde de grau d
+    contagem = np.bincount(grau)
+    inicio = np.concatenate([[0], np.cumsum(contagem)[:-1]]).tolist()
+    vert = np.argsort(grau, kind="stable").tolist()
+    pos = [0] * n
+    for i, v in enumerate(vert):
+        pos[v] = i
+
+    indptr, indices = memoryview(indptr), memoryview(indices)
+    for v in vert:
+        grau_v = grau[v]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            grau_u = grau[u]
+            if grau_u > grau_v:
+                # troca u com o primeiro do seu balde e encolhe o balde
+                pu, pw = pos[u], inicio[grau_u]
+                w = vert[pw]
+                if u != w:
+                    vert[pu], vert[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                inicio[grau_u] += 1
+                grau[u] = grau_u - 1
+    return np.array(grau, dtype=np.float64)
+
+
+def _nucleos_ponderados(n: int, indptr, indices, pesos) -> np.ndarray:
+    origens = np.repeat(np.arange(n), np.diff(indptr))
+    forca = np.bincount(origens, weights=pesos, minlength=n).tolist()
+    indptr, indices, pesos = memoryview(indptr), memoryview(indices), memoryview(pesos)
+
+    heap = [(f, v) for v, f in enumerate(forca)]
+    heapq.heapify(heap)
+    removido = bytearray(n)
+    nucleo = [0.0] * n
+    atual = 0.0
+    while heap:
+        f, v = heapq.heappop(heap)
+        if removido[v] or f != forca[v]:
+            continue  # entrada antiga do heap
+        removido[v] = 1
+        atual = max(atual, f)
+        nucleo[v] = atual
+        inicio, fim = indptr[v], indptr[v + 1]
+        for u, w in zip(indices[inicio:fim], pesos[inicio:fim]):
+            if not removido[u]:
+                forca[u] -= w
+                heapq.heappush(heap, (forca[u], u))
+    return np.array(nucleo)
+
+
+def ordem_topologica(g: GrafoCSR) -> np.ndarray:
+    """Ordem topológica (Kahn, nível a nível) de um grafo direcionado.
+
+    Raises:
+        ValueError: se o grafo não for direcionado ou tiver ciclo.
+    """
+    if not g.direcionado:
+        raise ValueError("Ordem topológica só existe para grafos direcionados.")
+    grau_entrada = np.bincount(g.indices, minlength=g.n)
+    fronteira = np.flatnonzero(grau_entrada == 0).astype(np.int32)
+    niveis = []
+    while len(fronteira):
+        niveis.append(fronteira)
+        vizinhos, _ = _vizinhos_da_fronteira(g, fronteira)
+        alvos, quantidade = np.unique(vizinhos, return_counts=True)
+        grau_entrada[alvos] -= quantidade
+        fronteira = alvos[grau_entrada[alvos] == 0]
+
+    ordem = np.concatenate(niveis) if niveis else np.empty(0, dtype=np.int32)
+    if len(ordem) < g.n:
+        raise ValueError("O grafo tem ciclo; não há ordem topológica.")
+    return ordem
+
+
+# ---------- centralidades ----------
+
+def pagerank(
+    g: GrafoCSR,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-06
+) -> np.ndarray:
+    """PageRank ponderado pela iteração de potência.
+
+    Mesma conta do PageRank manual de `CentralityMetrics`: a massa dos
+    vértices sem saída é espalhada igualmente, e cada iteração é um
+    produto esparso feito com `np.bincount` sobre as arestas.
+    """
+    n = g.n
+    if n == 0:
+        return np.empty(0)
+    origens = g.origens()
+    forca = g.forcas()
+    pendurados = forca == 0.0
+    fracao = g.pesos / np.where(pendurados, 1.0, forca)[origens]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        novo = np.bincount(g.indices, weights=rank[origens] * fracao, minlength=n) * alpha
+        novo += (1.0 - alpha) / n + alpha * rank[pendurados].sum() / n
+        diff = np.abs(novo - rank).sum()
+        rank = novo
+        if diff < tol:
+            break
+    return rank
+
+
+def closeness(
+    g: GrafoCSR,
+    ponderado: bool = False,
+    vertices: Optional[Iterable[int]] = None
+) -> np.ndarray:
+    """Closeness como em `nx.closeness_centrality` (com wf_improved).
+
+    Em grafos direcionados usa a distância *até* o vértice, como o
+    NetworkX. Com `ponderado`, o peso é a distância (Dijkstra).
+
+    :param vertices: ids a calcular (padrão: todos); os demais ficam 0.
+    """
+    n = g.n
+    reverso = g.transposto()
+    valores = np.zeros(n)
+    for v in range(n) if vertices is None else vertices:
+        if ponderado:
+            dist = dijkstra(reverso, v)[0]
+            alcancados = dist[np.isfinite(dist)]
+        else:
+            dist = np.full(n, -1, dtype=np.int32)
+            for _ in _niveis(reverso, np.array([v]), dist):
+                pass
+            alcancados = dist[dist >= 0]
+        total = float(alcancados.sum())
+        if total > 0.0 and n > 1:
+            valores[v] = (len(alcancados) - 1.0) / total * (len(alcancados) - 1.0) / (n - 1)
+    return valores
+
+
+def _brandes_niveis(g: GrafoCSR, s: int, acumulado: np.ndarray) -> None:
+    """Acumula a dependência de `s` sem pesos, um nível da BFS por vez."""
+    dist = np.full(g.n, -1, dtype=np.int32)
+    sigma = np.zeros(g.n)
+    sigma[s] = 1.0
+    arcos = []  # por nível: (de, para) das arestas de caminhos mínimos
+    for nivel, fronteira in enumerate(list(_niveis(g, np.array([s]), dist))):
+        vizinhos, de = _vizinhos_da_fronteira(g, fronteira)
+        no_caminho = dist[vizinhos] == nivel + 1
+        de, para = de[no_caminho], vizinhos[no_caminho]
+        np.add.at(sigma, para, sigma[de])
+        arcos.append((de, para))
+
+    delta = np.zeros(g.n)
+    for de, para in reversed(arcos):
+        np.add.at(delta, de, sigma[de] / sigma[para] * (1.0 + delta[para]))
+    delta[s] = 0.0
+    acumulado += delta
+
+
+def _brandes_dijkstra(s: int, indptr, indices, pesos, acumulado: List[float]) -> None:
+    """Acumula a dependência de `s` com pesos (Dijkstra com contagem de caminhos)."""
+    ordem = []
+    predecessores = {s: []}
+    sigma = {s: 1.0}
+    final = {}
+    visto = {s: 0.0}
+    contador = 0
+    heap = [(0.0, 0, s, s)]
+    while heap:
+        d, _, pred, v = heapq.heappop(heap)
+        if v in final:
+            continue
+        if v != s:
+            sigma[v] += sigma[pred]
+        ordem.append(v)
+        final[v] = d
+        inicio, fim = indptr[v], indptr[v + 1]
+        for w, c in zip(indices[inicio:fim], pesos[inicio:fim]):
+            nova = d + c
+            if w not in final and (w not in visto or nova < visto[w]):
+                visto[w] = nova
+                contador += 1
+                heapq.heappush(heap, (nova, contador, v, w))
+                sigma[w] = 0.0
+                predecessores[w] = [v]
+            elif nova == visto[w]:
+                sigma[w] += sigma[v]
+                predecessores[w].append(v)
+
+    delta = dict.fromkeys(ordem, 0.0)
+    while ordem:
+        w = ordem.pop()
+        coef = (1.0 + delta[w]) / sigma[w]
+        for v in predecessores[w]:
+            delta[v] += sigma[v] * coef
+        if w != s:
+            acumulado[w] += delta[w]
+
+
+def _dependencias(g: GrafoCSR, origens: Iterable[int], ponderado: bool) -> np.ndarray:
+    """Soma das dependências de Brandes das `origens`, ainda sem escala."""
+    if ponderado and len(g.pesos) and g.pesos.min() != g.pesos.max():
+        acumulado = [0.0] * g.n
+        indptr, indices, pesos = memoryview(g.indptr), memoryview(g.indices), memoryview(g.pesos)
+        for s in origens:
+            _brandes_dijkstra(s, indptr, indices, pesos, acumulado)
+        return np.array(acumulado)
+    valores = np.zeros(g.n)
+    for s in origens:
+        _brandes_niveis(g, s, valores)
+    return valores
+
+
+def _escala_betweenness(valores: np.ndarray, n: int, direcionado: bool, normalizado: bool) -> np.ndarray:
+    """Escala do NetworkX para todas as origens, com o n do grafo inteiro."""
+    N = n - 1
+    if N < 2:
+        return valores
+    if normalizado:
+        return valores / (N * (N - 1))
+    return valores if direcionado else valores / 2.0
+
+
+def betweenness(
+    g: GrafoCSR,
+    normalizado: bool = True,
+    k: Optional[int] = None,
+    ponderado: bool = True,
+    seed=None
+) -> np.ndarray:
+    """Betweenness de Brandes, com a normalização de `nx.betweenness_centrality`.
+
+    Sem pesos (ou com todos os pesos iguais) cada origem é uma BFS por
+    nível vetorizada; com pesos distintos, Dijkstra com contagem de
+    caminhos sobre os buffers.
+
+    :param k: amostra de k origens; com a mesma `seed` e a mesma ordem
+        de vértices, sorteia as mesmas origens que o NetworkX.
+    """
+    n = g.n
+    origens = range(n) if k is None else random.Random(seed).sample(range(n), k)
+    valores = _dependencias(g, origens, ponderado)
+
+    # mesma escala de networkx.algorithms.centrality.betweenness._rescale (endpoints=False)
+    N = n - 1
+    if N < 2:
+        return valores
+    if k is None:
+        return _escala_betweenness(valores, n, g.direcionado, normalizado)
+    correcao = 1 if g.direcionado else 2
+    if normalizado:
+        escala_origem = 1 / ((k - 1) * (N - 1)) if k > 1 else np.nan
+        escala = 1 / (k * (N - 1))
+    else:
+        escala_origem = N / ((k - 1) * correcao) if k > 1 else np.nan
+        escala = N / (k * correcao)
+    fatores = np.full(n, escala)
+    fatores[list(origens)] = escala_origem
+    return valores * fatores
+
+
+# ---------- métricas direcionadas ----------
+
+class ProdutosEsparsos:
+    """Par CSR/CSC de um grafo para produtos matriz-vetor com NumPy.
+
+    `g` (CSR) tem as arestas de saída de cada vértice e `g.transposto()`
+    (CSC) as de entrada; as origens de cada arco são expandidas uma vez
+    e reaproveitadas por todos os produtos, então várias métricas saem
+    das mesmas passadas sobre os arrays de arestas.
+    """
+
+    def __init__(self, g: GrafoCSR):
+        self.g = g
+        self.csc = g.transposto()
+        self.linhas = g.origens()
+        self.linhas_csc = self.csc.origens()
+
+    def saida(self, x: np.ndarray) -> np.ndarray:
+        """A @ x: y[u] = soma de peso(u -> v) * x[v]."""
+        return np.bincount(self.linhas, weights=self.g.pesos * x[self.g.indices], minlength=self.g.n)
+
+    def entrada(self, x: np.ndarray) -> np.ndarray:
+        """A.T @ x: y[v] = soma de peso(u -> v) * x[u]."""
+        return np.bincount(self.linhas_csc, weights=self.csc.pesos * x[self.csc.indices], minlength=self.g.n)
+
+    def arcos_reciprocos(self) -> np.ndarray:
+        """Máscara (paralela a `g.indices`) dos arcos u -> v com v -> u no grafo."""
+        n = self.g.n
+        codigos = self.linhas.astype(np.int64) * n + self.g.indices
+        # código v * n + u de cada arco u -> v, procurado por busca binária
+        inversos = self.linhas_csc.astype(np.int64) * n + self.csc.indices
+        if len(codigos) == 0:
+            return np.zeros(0, dtype=bool)
+        if np.any(inversos[1:] < inversos[:-1]):
+            inversos = np.sort(inversos)
+        posicao = np.minimum(np.searchsorted(inversos, codigos), len(inversos) - 1)
+        return inversos[posicao] == codigos
+
+
+def hits(
+    g: GrafoCSR,
+    max_iter: int = 100,
+    tol: float = 1.0e-08,
+    produtos: Optional[ProdutosEsparsos] = None
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Hubs e autoridades (HITS) ponderados, como a versão em Python puro do NetworkX.
+
+    Iteração de potência: a = A.T @ h, h = A @ a, cada vetor dividido
+    pelo máximo a cada passo, até a soma das diferenças de h ficar
+    abaixo de `tol`; no fim, os dois somam 1. Sem arestas, tudo 0.
+
+    :return: (hubs, autoridades, iterações).
+    """
+    n = g.n
+    if n == 0:
+        return np.empty(0), np.empty(0), 0
+    produtos = produtos or ProdutosEsparsos(g)
+    h = np.full(n, 1.0 / n)
+    a = np.zeros(n)
+    iteracoes = 0
+    for iteracoes in range(1, max_iter + 1):
+        anterior = h
+        a = produtos.entrada(anterior)
+        h = produtos.saida(a)
+        if h.max() <= 0.0 or a.max() <= 0.0:
+            return np.zeros(n), np.zeros(n), iteracoes
+        h /= h.max()
+        a /= a.max()
+        if np.abs(h - anterior).sum() < tol:
+            break
+    return h / h.sum(), a / a.sum(), iteracoes
+
+
+def reciprocidade(g: GrafoCSR, produtos: Optional[ProdutosEsparsos] = None) -> Tuple[np.ndarray, float]:
+    """Reciprocidade por vértice e global, como `nx.reciprocity`.
+
+    Por vértice: 2 * |predecessores ∩ sucessores| / (|predecessores| + |sucessores|),
+    NaN em vértices isolados. Global: fração dos arcos (sem laços) com
+    o arco inverso no grafo; NaN sem arcos.
+    """
+    produtos = produtos or ProdutosEsparsos(g)
+    reciprocos = produtos.arcos_reciprocos()
+    linhas = produtos.linhas
+    mutuos = np.bincount(linhas[reciprocos], minlength=g.n)
+    vizinhos = g.graus() + produtos.csc.graus()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        por_vertice = np.where(vizinhos > 0, 2.0 * mutuos / vizinhos, np.nan)
+    arcos = len(g.indices)
+    if arcos == 0:
+        return por_vertice, float("nan")
+    fora_laco = linhas != g.indices
+    return por_vertice, float(np.count_nonzero(reciprocos & fora_laco)) / arcos
+
+
+def metricas_direcionadas(g: GrafoCSR, max_iter: int = 100, tol: float = 1.0e-08) -> Dict[str, Any]:
+    """Métricas de um grafo direcionado a partir de um único par CSR/CSC.
+
+    :return: {"forca_entrada", "forca_saida", "grau_entrada",
+        "grau_saida", "hubs", "autoridades", "reciprocidade" (arrays por
+        id), "reciprocidade_global", "iteracoes_hits"}.
+    """
+    produtos = ProdutosEsparsos(g)
+    uns = np.ones(g.n)
+    hubs, autoridades, iteracoes = hits(g, max_iter, tol, produtos)
+    por_vertice, global_ = reciprocidade(g, produtos)
+    return {
+        "forca_entrada": produtos.entrada(uns),
+        "forca_saida": produtos.saida(uns),
+        "grau_entrada": produtos.csc.graus(),
+        "grau_saida": g.graus(),
+        "hubs": hubs,
+        "autoridades": autoridades,
+        "reciprocidade": por_vertice,
+        "reciprocidade_global": global_,
+        "iteracoes_hits": iteracoes,
+    }
+
+
+# ---------- métricas por componente ----------
+
+# componentes com pelo menos este número de vértices rodam sozinhos, com
+# as origens divididas entre processos; os menores vão juntos em um lote
+LIMIAR_COMPONENTE_GRANDE = 2000
+
+_GRAFO_DO_WORKER = None
+
+
+def _iniciar_worker(g: GrafoCSR) -> None:
+    global _GRAFO_DO_WORKER
+    _GRAFO_DO_WORKER = g
+
+
+def _no_worker(funcao, origens: List[int], ponderado: bool) -> np.ndarray:
+    return funcao(_GRAFO_DO_WORKER, origens, ponderado)
+
+
+def _closeness_das_origens(g: GrafoCSR, origens: Iterable[int], ponderado: bool) -> np.ndarray:
+    return closeness(g, ponderado, vertices=origens)
+
+
+def _somar_por_origens(funcao, g: GrafoCSR, ponderado: bool, processos: int) -> np.ndarray:
+    """Soma de `funcao(g, origens, ponderado)` com as origens repartidas entre processos."""
+    if processos <= 1 or g.n < 2 * processos:
+        return funcao(g, range(g.n), ponderado)
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    # blocos intercalados: origens vizinhas na numeração costumam ter custo parecido
+    partes = processos * 4
+    blocos = [list(range(i, g.n, partes)) for i in range(partes)]
+    with ProcessPoolExecutor(processos, initializer=_iniciar_worker, initargs=(g,)) as pool:
+        return sum(pool.map(_no_worker, repeat(funcao), blocos, repeat(ponderado)))
+
+
+def _por_componente(
+    g: GrafoCSR,
+    funcao,
+    ponderado: bool,
+    processos: int,
+    limiar: int,
+    fator=None
+) -> np.ndarray:
+    """Aplica `funcao` a cada componente com arestas; isolados ficam com 0.
+
+    Cada componente grande vira um subgrafo próprio (processado em
+    paralelo, se pedido); os pequenos são reunidos em um único
+    subgrafo. Como nenhum caminho cruza componentes, a soma por
+    componente é a mesma do grafo inteiro.
+
+    :param fator: fator(n_do_subgrafo) que leva o resultado do subgrafo
+        para a escala do grafo inteiro.
+    """
+    grupos = IndiceComponentes.de_grafo(g).grupos(minimo=2)
+    lotes = [ids for ids in grupos if len(ids) >= limiar]
+    pequenos = [ids for ids in grupos if len(ids) < limiar]
+    if pequenos:
+        lotes.append(np.concatenate(pequenos))
+
+    valores = np.zeros(g.n)
+    for ids in lotes:
+        ids = np.sort(ids)
+        sub = g.subgrafo(ids)
+        parcial = _somar_por_origens(funcao, sub, ponderado, processos if len(ids) >= limiar else 1)
+        valores[ids] = parcial if fator is None else parcial * fator(sub.n)
+    return valores
+
+
+def closeness_por_componente(
+    g: GrafoCSR,
+    ponderado: bool = False,
+    processos: int = 1,
+    limiar: int = LIMIAR_COMPONENTE_GRANDE
+) -> np.ndarray:
+    """`closeness` componente a componente, sem percorrer os isolados.
+
+    Mesmo resultado de `closeness(g, ponderado)`: o valor de cada
+    componente é reescalado pelo fator (n_componente - 1) / (n - 1) do
+    wf_improved do NetworkX.
+    """
+    n = g.n
+    return _por_componente(
+        g, _closeness_das_origens, ponderado, processos, limiar,
+        fator=lambda n_sub: (n_sub - 1) / (n - 1)
+    )
+
+
+def betweenness_por_componente(
+    g: GrafoCSR,
+    normalizado: bool = True,
+    ponderado: bool = True,
+    processos: int = 1,
+    limiar: int = LIMIAR_COMPONENTE_GRANDE
+) -> np.ndarray:
+    """`betweenness` (todas as origens) componente a componente.
+
+    As dependências são somadas por componente e só no fim recebem a
+    escala do NetworkX com o n do grafo inteiro, então o resultado é o
+    mesmo de `betweenness(g, normalizado, ponderado=ponderado)`.
+    """
+    valores = _por_componente(g, _dependencias, ponderado, processos, limiar)
+    return _escala_betweenness(valores, g.n, g.direcionado, normalizado)
+
+
+def agrupamento(g: GrafoCSR) -> np.ndarray:
+    """Coeficiente de agrupamento local sem pesos, como `nx.clustering`.
+
+    Raises:
+        ValueError: em grafos direcionados (use o NetworkX).
+    """
+    if g.direcionado:
+        raise ValueError("agrupamento nativo só para grafos não direcionados.")
+    indptr, indices = memoryview(g.indptr), memoryview(g.indices)
+    vizinhos = [set(indices[indptr[v]:indptr[v + 1]]) - {v} for v in range(g.n)]
+    valores = np.zeros(g.n)
+    for v, conjunto in enumerate(vizinhos):
+        grau = len(conjunto)
+        if grau < 2:
+            continue
+        triangulos = sum(len(conjunto & vizinhos[w]) for w in conjunto)
+        valores[v] = triangulos / (grau * (grau - 1))
+    return valores
@@ -0,0 +1,297 @@
+"""Predição de arestas por vizinhança comum e recomendação de revisores.
+
+Para cada par (u, w) ainda sem aresta, com Γ(x) os vizinhos de x no
+grafo não direcionado (sem laços), calcula as mesmas pontuações do
+NetworkX:
+
+  - common_neighbors:     |Γ(u) ∩ Γ(w)|
+  - jaccard:              |Γ(u) ∩ Γ(w)| / |Γ(u) ∪ Γ(w)|
+  - adamic_adar:          soma de 1 / log(grau(z)), z ∈ Γ(u) ∩ Γ(w)
+  - resource_allocation:  soma de 1 / grau(z),      z ∈ Γ(u) ∩ Γ(w)
+
+Em vez de uma chamada por par, as quatro saem de um mesmo produto
+esparso de vizinhanças S = A·D·A, feito por blocos de origens: os
+caminhos u -> z -> w de um bloco são expandidos a partir do CSR e
+somados por par com `np.bincount` (uma passada por pontuação). Cada
+bloco é limitado pelo número de caminhos de dois passos
+(`max_caminhos`), então a memória não depende do tamanho do grafo; com
+`processos > 1`, os blocos são distribuídos em um ProcessPoolExecutor.
+
+Limiares de grau cortam o trabalho onde ele explode:
+  - `grau_min`: origens e candidatos com grau menor ficam de fora;
+  - `grau_max_intermediario`: vizinhos comuns z com grau maior são
+    ignorados. Um hub gera grau(z)² pares e, em Adamic-Adar e
+    resource allocation, contribui pouco para cada um; com o limiar, as
+    pontuações passam a ser aproximadas (None = exatas).
+
+Cada origem fica com as k melhores candidatas pela métrica escolhida;
+o top-k global de pares passa por um `TopKStreaming` (heap limitado a
+k itens) alimentado bloco a bloco.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Graph_LIB.GraphLIB import GrafoCSR, _vizinhos_da_fronteira, congelar
+from Graph_LIB.TopK import TopKStreaming
+
+METRICAS_LIGACAO = ["common_neighbors", "jaccard", "adamic_adar", "resource_allocation"]
+# caminhos u -> z -> w por bloco (~10 arrays desse tamanho em memória)
+MAX_CAMINHOS_POR_BLOCO = 1 << 22
+# interações usadas por recomendar_revisores: "from" revisou / fez o merge do PR de "to"
+TIPOS_REVISAO = ["revisoes_pull_request", "merge_pull_request"]
+
+
+def vizinhanca(g: GrafoCSR) -> GrafoCSR:
+    """Grafo não direcionado, sem laços e sem pesos (a vizinhança Γ de cada vértice)."""
+    s = g.simetrico()
+    origens = s.origens()
+    manter = origens != s.indices
+    indptr = np.zeros(s.n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origens[manter], minlength=s.n), out=indptr[1:])
+    return GrafoCSR(indptr, s.indices[manter], np.ones(int(manter.sum())), s.rotulos, direcionado=False)
+
+
+class _Contexto:
+    """Arrays compartilhados por todos os blocos (e enviados uma vez a cada processo)."""
+
+    def __init__(self, h: GrafoCSR, metrica: str, k: int, candidato: np.ndarray,
+                 grau_max_intermediario: Optional[int], excluir_existentes: bool):
+        self.h = h
+        self.metrica = metrica
+        self.k = k
+        self.candidato = candidato
+        self.excluir_existentes = excluir_existentes
+        self.grau = h.graus()
+        intermediario = self.grau >= 2
+        if grau_max_intermediario is not None:
+            intermediario &= self.grau <= grau_max_intermediario
+        # grau dos intermediários válidos; 0 corta o vértice como z
+        self.grau_z = np.where(intermediario, self.grau, 0)
+        self.peso_aa = np.where(intermediario, 1.0 / np.log(np.maximum(self.grau, 2)), 0.0)
+        self.peso_ra = np.where(intermediario, 1.0 / np.maximum(self.grau, 1), 0.0)
+
+    def caminhos(self, origens: np.ndarray) -> np.ndarray:
+        """Número de caminhos u -> z -> w a partir de cada origem."""
+        vizinhos, de = _vizinhos_da_fronteira(self.h, origens)
+        return np.bincount(np.searchsorted(origens, de), weights=self.grau_z[vizinhos],
+                           minlength=len(origens)).astype(np.int64)
+
+
+def _pontuar_bloco(ctx: _Contexto, origens: np.ndarray) -> Dict[str, np.ndarray]:
+    """As quatro pontuações de todas as candidatas das `origens` (ordenadas), já no top-k.
+
+    :return: arrays paralelos "origem", "destino" e um por métrica.
+    """
+    h, n = ctx.h, ctx.h.n
+    # primeiro passo: u -> z (só intermediários válidos)
+    z, u = _vizinhos_da_fronteira(h, origens)
+    valido = ctx.grau_z[z] > 0
+    z, u = z[valido], u[valido]
+    # segundo passo: z -> w, levando u junto
+    w, _ = _vizinhos_da_fronteira(h, z)
+    u = np.repeat(u, ctx.grau[z])
+    z = np.repeat(z, ctx.grau[z])
+    manter = (w != u) & ctx.candidato[w]
+    u, z, w = u[manter], z[manter], w[manter]
+
+    codigos = u.astype(np.int64) * n + w
+    pares, inverso = np.unique(codigos, return_inverse=True)
+    comuns = np.bincount(inverso, minlength=len(pares)).astype(np.float64)
+    aa = np.bincount(inverso, weights=ctx.peso_aa[z], minlength=len(pares))
+    ra = np.bincount(inverso, weights=ctx.peso_ra[z], minlength=len(pares))
+    pu, pw = pares // n, pares % n
+
+    if ctx.excluir_existentes and len(pares):
+        vizinhos, de = _vizinhos_da_fronteira(h, origens)
+        existentes = np.sort(de.astype(np.int64) * n + vizinhos)
+        if len(existentes):
+            posicao = np.minimum(np.searchsorted(existentes, pares), len(existentes) - 1)
+            nova = existentes[posicao] != pares
+            pares, comuns, aa, ra, pu, pw = (x[nova] for x in (pares, comuns, aa, ra, pu, pw))
+
+    uniao = ctx.grau[pu] + ctx.grau[pw] - comuns
+    jaccard = np.divide(comuns, uniao, out=np.zeros_like(comuns), where=uniao > 0)
+    pontuacoes = {"common_neighbors": comuns, "jaccard": jaccard, "adamic_adar": aa, "resource_allocation": ra}
+
+    # top-k por origem: maior pontuação primeiro, empate pelo menor id de destino
+    ordem = np.lexsort((pw, -pontuacoes[ctx.metrica], pu))
+    pu = pu[ordem]
+    inicio_grupo = np.searchsorted(pu, pu)
+    manter = np.arange(len(pu)) - inicio_grupo < ctx.k
+    selecionados = ordem[manter]
+    resultado = {"origem": pu[manter], "destino": pw[selecionados]}
+    resultado.update({nome: valores[selecionados] for nome, valores in pontuacoes.items()})
+    return resultado
+
+
+_CONTEXTO_DO_WORKER = None
+
+
+def _iniciar_worker(ctx: _Contexto) -> None:
+    global _CONTEXTO_DO_WORKER
+    _CONTEXTO_DO_WORKER = ctx
+
+
+def _no_worker(origens: np.ndarray) -> Dict[str, np.ndarray]:
+    return _pontuar_bloco(_CONTEXTO_DO_WORKER, origens)
+
+
+def _dividir_em_blocos(ctx: _Contexto, origens: np.ndarray, max_caminhos: int) -> List[np.ndarray]:
+    """Blocos consecutivos de origens com até `max_caminhos` caminhos de dois passos cada."""
+    if len(origens) == 0:
+        return []
+    acumulado = np.cumsum(ctx.caminhos(origens))
+    blocos = []
+    inicio = 0
+    while inicio < len(origens):
+        base = acumulado[inicio - 1] if inicio else 0
+        fim = max(inicio + 1, int(np.searchsorted(acumulado, base + max_caminhos, side="right")))
+        blocos.append(origens[inicio:fim])
+        inicio = fim
+    return blocos
+
+
+def prever_ligacoes(
+    grafo,
+    k: int = 10,
+    metrica: str = "adamic_adar",
+    origens: Optional[Iterable[Hashable]] = None,
+    candidatos: Optional[Iterable[Hashable]] = None,
+    grau_min: int = 1,
+    grau_max_intermediario: Optional[int] = None,
+    excluir_existentes: bool = True,
+    max_caminhos: int = MAX_CAMINHOS_POR_BLOCO,
+    processos: int = 1,
+    k_global: int = 0
+) -> Dict[str, Any]:
+    """Top-k de ligações prováveis de cada origem, com as quatro pontuações.
+
+    :param grafo: GrafoCSR, grafo do Graph_LIB ou do NetworkX (o sentido
+        das arestas é ignorado).
+    :param k: candidatas mantidas por origem.
+    :param metrica: métrica que ordena o top-k (ver METRICAS_LIGACAO).
+    :param origens: rótulos das origens (padrão: todos os vértices).
+    :param candidatos: rótulos aceitos como destino (padrão: todos).
+    :param grau_min: grau mínimo de origens e candidatos.
+    :param grau_max_intermediario: ignora vizinhos comuns com grau maior
+        (pontuações aproximadas); None = exatas.
+    :param excluir_existentes: descarta pares que já têm aresta.
+    :param max_caminhos: caminhos de dois passos por bloco (memória).
+    :param processos: processos que pontuam os blocos em paralelo.
+    :param k_global: se > 0, também devolve os k_global melhores pares.
+    :return: {"origem", "destino" (ids), uma entrada por métrica (arrays
+        paralelos, agrupados por origem e ordenados pela métrica),
+        "grafo" (a vizinhança usada, para traduzir ids), "metrica",
+        "blocos" e, com k_global, "top_global" [(u, w, valor)], cada par
+        não ordenado uma vez}.
+    """
+    if metrica not in METRICAS_LIGACAO:
+        raise ValueError(f"Métrica desconhecida: {metrica} (opções: {', '.join(METRICAS_LIGACAO)})")
+    h = vizinhanca(congelar(grafo))
+    grau = h.graus()
+
+    candidato = grau >= grau_min
+    if candidatos is not None:
+        mascara = np.zeros(h.n, dtype=bool)
+        mascara[[h.ids[c] for c in candidatos if c in h.ids]] = True
+        candidato &= mascara
+    if origens is None:
+        ids_origens = np.flatnonzero(grau >= max(grau_min, 1))
+    else:
+        ids_origens = np.array(sorted({h.ids[o] for o in origens if o in h.ids}), dtype=np.int64)
+        ids_origens = ids_origens[grau[ids_origens] >= max(grau_min, 1)]
+    ids_origens = ids_origens.astype(np.int32)
+
+    ctx = _Contexto(h, metrica, k, candidato, grau_max_intermediario, excluir_existentes)
+    blocos = _dividir_em_blocos(ctx, ids_origens, max_caminhos)
+
+    if processos > 1 and len(blocos) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(processos, initializer=_iniciar_worker, initargs=(ctx,)) as pool:
+            partes = pool.map(_no_worker, blocos)
+            resultados, melhores = _juntar(partes, metrica, k_global)
+    else:
+        resultados, melhores = _juntar((_pontuar_bloco(ctx, b) for b in blocos), metrica, k_global)
+
+    resultados.update({"grafo": h, "metrica": metrica, "blocos": len(blocos)})
+    if k_global:
+        resultados["top_global"] = [
+            (h.rotulos[u], h.rotulos[w], valor) for (u, w), valor in melhores.resultado()
+        ]
+    return resultados
+
+
+def _juntar(partes, metrica: str, k_global: int) -> Tuple[Dict[str, np.ndarray], TopKStreaming]:
+    """Concatena os blocos (na ordem das origens) e alimenta o top-k global."""
+    melhores = TopKStreaming(k_global)
+    # pares já oferecidos ao heap, como (menor id, maior id): as pontuações
+    # são simétricas, e (u, w) e (w, u) ocupariam duas vagas
+    oferecidos = set()
+    colunas: Dict[str, List[np.ndarray]] = {nome: [] for nome in ["origem", "destino"] + METRICAS_LIGACAO}
+    for parte in partes:
+        for nome, valores in parte.items():
+            colunas[nome].append(valores)
+        if k_global and len(parte["origem"]):
+            valores = parte[metrica]
+            limiar = melhores.minimo()
+            # só os pares que ainda podem entrar no heap, do melhor para o pior
+            escolhidos = np.flatnonzero(valores > limiar) if limiar is not None else np.arange(len(valores))
+            escolhidos = escolhidos[np.argsort(-valores[escolhidos], kind="stable")]
+            aceitos = 0
+            for i in escolhidos.tolist():
+                u, w = int(parte["origem"][i]), int(parte["destino"][i])
+                par = (u, w) if u < w else (w, u)
+                if par in oferecidos:
+                    continue
+                oferecidos.add(par)
+                melhores.adicionar(par, float(valores[i]))
+                aceitos += 1
+                if aceitos == k_global:
+                    break
+    vazio = {"origem": np.empty(0, dtype=np.int64), "destino": np.empty(0, dtype=np.int64)}
+    juntos = {
+        nome: np.concatenate(listas) if listas else vazio.get(nome, np.empty(0))
+        for nome, listas in colunas.items()
+    }
+    return juntos, melhores
+
+
+def top_k_por_origem(resultado: Dict[str, Any], metrica: Optional[str] = None) -> Dict[Hashable, List[Tuple[Hashable, float]]]:
+    """Resultado de `prever_ligacoes` como rótulo -> [(candidato, pontuação), ...]."""
+    metrica = metrica or resultado["metrica"]
+    rotulos = resultado["grafo"].rotulos
+    saida: Dict[Hashable, List[Tuple[Hashable, float]]] = {}
+    for u, w, valor in zip(resultado["origem"].tolist(), resultado["destino"].tolist(),
+                           resultado[metrica].tolist()):
+        saida.setdefault(rotulos[u], []).append((rotulos[w], valor))
+    return saida
+
+
+def recomendar_revisores(
+    data: Dict[str, Any],
+    k: int = 5,
+    metrica: str = "adamic_adar",
+    autores: Optional[Iterable[Hashable]] = None,
+    **opcoes
+) -> Dict[Hashable, List[Tuple[Hashable, float]]]:
+    """Revisores prováveis para o próximo PR de cada autor.
+
+    Monta o grafo das interações de TIPOS_REVISAO (quem revisou ou fez
+    o merge -> autor do PR) e pontua, para cada autor, os usuários que
+    já revisaram ou fizeram merge de algum PR e ainda não interagiram
+    com ele.
+
+    :param data: dataset de `main.load_data`.
+    :param autores: autores a recomendar (padrão: todos do grafo).
+    :param opcoes: repassadas para `prever_ligacoes` (grau_min,
+        grau_max_intermediario, processos, ...).
+    :return: autor -> [(revisor, pontuação), ...] (até k, melhores primeiro).
+    """
+    interacoes = [i for tipo in TIPOS_REVISAO for i in data["interactions"].get(tipo, [])]
+    g = GrafoCSR.de_arestas(((i["from"], i["to"]) for i in interacoes), direcionado=True)
+    revisores = {i["from"] for i in interacoes}
+    resultado = prever_ligacoes(g, k=k, metrica=metrica, origens=autores, candidatos=revisores, **opcoes)
+    return top_k_por_origem(resultado)
@@ -1,6 +1,11 @@
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
 
 import networkx as nx
+import numpy as np
+
+from Graph_LIB import GraphLIB
+from Graph_LIB.Profiler import instrumentar
+from Graph_LIB.TopK import TopKStreaming, top_k as _top_k
 
 
 class CentralityMetrics:
@@ -12,19 +17,85 @@ class CentralityMetrics:
       2) Betweenness centrality
       3) Closeness centrality
       4) PageRank (implementado manualmente, sem SciPy)
+
+    Em grafos direcionados (`main.build_graph(..., direcionado=True)`),
+    `directed_metrics` dá força de entrada/saída, hubs e autoridades
+    (HITS) e reciprocidade (METRICAS_DIRECIONADAS), todas de uma
+    passada de `GraphLIB.metricas_direcionadas` sobre o mesmo par
+    CSR/CSC, em vez de uma chamada do NetworkX por métrica.
+
+    Aceita grafos do NetworkX e do Graph_LIB. Os do Graph_LIB são
+    congelados uma vez em `GrafoCSR` e cada métrica roda na versão
+    nativa de `Graph_LIB.GraphLIB`, sem cópia para o NetworkX.
+
+    Com `poda`, betweenness e closeness (as métricas caras) rodam só no
+    subgrafo dos vértices mantidos e são reescaladas para a
+    normalização do grafo inteiro; os vértices podados ficam com 0.
+    Grau e PageRank continuam no grafo inteiro.
+
+      - "maior_componente": mantém o maior componente conexo. Os valores
+        dos vértices mantidos são exatos (nenhum caminho sai do
+        componente); os demais ficam com 0.
+      - "kcore": mantém o k-core (`k_nucleo`, padrão 2). Tira as árvores
+        penduradas (usuários com uma única interação); os valores do
+        núcleo passam a ser aproximados, já que os caminhos até os
+        vértices podados deixam de contar.
+
+    Com `por_componente`, betweenness (sem amostragem) e closeness rodam
+    componente a componente nas versões nativas, pulando os vértices
+    isolados (usuários sem interação na camada), com o mesmo resultado
+    do grafo inteiro. Componentes grandes dividem as origens entre
+    `processos` processos.
+
+    Com `modo_closeness="approx"` (ou `mode="approx"` em
+    closeness_centrality), closeness sai do HyperANF
+    (`Graph_LIB.HyperANF`): contadores HyperLogLog por vértice, algumas
+    passadas sobre as arestas e erro relativo reportado em
+    `distance_distribution()`, junto com centralidade harmônica,
+    função de vizinhança e diâmetro efetivo. Ignora pesos e poda.
     """
 
     def __init__(
         self,
-        graph: nx.Graph,
-        id_to_label: Optional[Dict[Any, str]] = None
+        graph,
+        id_to_label: Optional[Dict[Any, str]] = None,
+        poda: Optional[str] = None,
+        k_nucleo: int = 2,
+        por_componente: bool = False,
+        processos: int = 1,
+        modo_closeness: str = "exact",
+        memoria_mb: float = 64.0
     ) -> None:
         """
-        :param graph: Grafo do NetworkX (pode ser Graph ou DiGraph), ponderado em 'weight'.
+        :param graph: Grafo do NetworkX (Graph ou DiGraph), do Graph_LIB
+            (AbstractGraph, AdjacencyListGraph, AdjacencyMatrixGraph) ou
+            GrafoCSR, ponderado em 'weight'. Os do Graph_LIB são dirigidos.
         :param id_to_label: Mapeamento opcional de id de vértice -> rótulo (ex.: login do GitHub).
+        :param poda: None, "kcore" ou "maior_componente" (ver PODAS).
+        :param k_nucleo: k do k-core mantido com poda="kcore".
+        :param por_componente: calcula betweenness e closeness por componente.
+        :param processos: processos por componente grande (com por_componente).
+        :param modo_closeness: modo padrão de closeness_centrality (ver MODOS).
+        :param memoria_mb: memória dos contadores HyperLogLog no modo "approx".
         """
+        if poda is not None and poda not in PODAS:
+            raise ValueError(f"Poda desconhecida: {poda} (opções: {', '.join(PODAS)})")
+        if modo_closeness not in MODOS:
+            raise ValueError(f"Modo desconhecido: {modo_closeness} (opções: {', '.join(MODOS)})")
         self.G = graph
         self.id_to_label = id_to_label or {}
+        # None = grafo do NetworkX, calculado pelos caminhos originais
+        self.csr = None if GraphLIB.e_networkx(graph) else GraphLIB.congelar(graph)
+        self.poda = poda
+        self.k_nucleo = k_nucleo
+        self.por_componente = por_componente
+        self.processos = processos
+        self.modo_closeness = modo_closeness
+        self.memoria_mb = memoria_mb
+        self._podado = None
+        self._congelado = self.csr
+        self._hyperanf = None
+        self._direcionadas = None
 
     # ---------- helpers internos ----------
 
@@ -40,15 +111,109 @@ class CentralityMetrics:
             for node, value in values.items()
         }
 
+    def _translate_array(self, valores) -> Dict[str, float]:
+        """Array por id do GrafoCSR -> dicionário rótulo -> valor."""
+        return self._translate_ids(self.csr.para_rotulos(valores))
+
+    def _subgrafo_podado(self) -> Tuple["CentralityMetrics", int, int]:
+        """Métricas do subgrafo mantido pela poda (montado uma vez).
+
+        :return: (CentralityMetrics do subgrafo, vértices mantidos, total).
+        """
+        if self._podado is None:
+            g = self._grafo_csr()
+            if self.poda == "kcore":
+                manter = GraphLIB.nucleos(g) >= self.k_nucleo
+            else:
+                manter = GraphLIB.maior_componente(g)
+            if self.csr is not None:
+                sub = g.subgrafo(manter)
+            else:
+                sub = self.G.subgraph([g.rotulos[i] for i in np.flatnonzero(manter).tolist()]).copy()
+            sub_metricas = CentralityMetrics(
+                sub, self.id_to_label, por_componente=self.por_componente, processos=self.processos
+            )
+            self._podado = (sub_metricas, int(manter.sum()), g.n)
+        return self._podado
+
+    def _grafo_csr(self) -> "GraphLIB.GrafoCSR":
+        """O grafo em GrafoCSR (grafos do NetworkX são congelados uma vez, sob demanda)."""
+        if self._congelado is None:
+            self._congelado = GraphLIB.congelar(self.G)
+        return self._congelado
+
+    def _completar(self, parciais: Dict[str, float], fator: float) -> Dict[str, float]:
+        """Valores do subgrafo podado (reescalados) e 0 nos vértices podados."""
+        if self.csr is not None:
+            valores = self._translate_array(np.zeros(self.csr.n))
+        else:
+            valores = self._translate_ids({node: 0.0 for node in self.G.nodes()})
+        valores.update({rotulo: valor * fator for rotulo, valor in parciais.items()})
+        return valores
+
+    def core_number(self, ponderado: bool = False) -> Dict[str, float]:
+        """
+        Número de núcleo (k-core) de cada vértice: o maior k tal que o
+        vértice está em um subgrafo onde todos têm grau >= k. Com
+        `ponderado`, usa a força (soma dos pesos) no lugar do grau.
+        Laços são ignorados.
+        """
+        g = self._grafo_csr()
+        return self._translate_ids(g.para_rotulos(GraphLIB.nucleos(g, ponderado)))
+
+    def distance_distribution(self) -> Dict[str, Any]:
+        """
+        Distribuição de distâncias aproximada (HyperANF, sem pesos),
+        calculada uma vez e reaproveitada pelo modo "approx".
+
+        :return: {"closeness", "harmonic" (por rótulo),
+            "funcao_vizinhanca" (pares a distância <= t, t = 0, 1, ...),
+            "diametro_efetivo", "erro_relativo" (erro padrão de cada
+            contagem), "bits", "memoria_bytes", "iteracoes"}.
+        """
+        if self._hyperanf is None:
+            from Graph_LIB.HyperANF import hyperanf
+
+            g = self._grafo_csr()
+            estimativa = hyperanf(g, memoria_mb=self.memoria_mb)
+            estimativa["closeness"] = self._translate_ids(g.para_rotulos(estimativa["closeness"]))
+            estimativa["harmonic"] = self._translate_ids(g.para_rotulos(estimativa.pop("harmonica")))
+            del estimativa["alcance"]
+            self._hyperanf = estimativa
+        return self._hyperanf
+
+    def harmonic_centrality(self, mode: Optional[str] = None) -> Dict[str, float]:
+        """
+        Centralidade harmônica: soma de 1/d(u, v) para todo u que
+        alcança v (sem pesos). Ao contrário de closeness, não depende
+        de o grafo ser conexo.
+
+        :param mode: "exact" ou "approx" (padrão: `modo_closeness`).
+        """
+        mode = self._modo(mode)
+        if mode == "approx":
+            return dict(self.distance_distribution()["harmonic"])
+        G = self.G if self.csr is None else self.csr.para_networkx()
+        return self._translate_ids(nx.harmonic_centrality(G))
+
+    def _modo(self, mode: Optional[str]) -> str:
+        mode = self.modo_closeness if mode is None else mode
+        if mode not in MODOS:
+            raise ValueError(f"Modo desconhecido: {mode} (opções: {', '.join(MODOS)})")
+        return mode
+
     @staticmethod
     def top_k(metric: Dict[str, float], k: int = 10) -> List[Tuple[str, float]]:
         """
         Retorna os k vértices com maior valor na métrica.
+        Passa os valores para um vetor e usa argpartition (O(n)) em vez
+        de ordenar o dicionário inteiro.
         """
-        return sorted(metric.items(), key=lambda x: x[1], reverse=True)[:k]
+        return _top_k(metric, k)
 
     # ---------- 1) Grau (degree centrality) ----------
 
+    @instrumentar(itens=len)
     def degree_centrality(
         self,
         normalized: bool = True,
@@ -65,6 +230,9 @@ class CentralityMetrics:
             - 'in'   : grau de entrada (apenas para DiGraph)
             - 'out'  : grau de saída (apenas para DiGraph)
         """
+        if self.csr is not None:
+            return self._degree_nativo(normalized, mode)
+
         G = self.G
 
         # Grafo não direcionado
@@ -103,8 +271,25 @@ class CentralityMetrics:
 
         return self._translate_ids(values)
 
+    def _degree_nativo(self, normalized: bool, mode: str) -> Dict[str, float]:
+        """degree_centrality sobre o GrafoCSR (mesmas regras acima)."""
+        g = self.csr
+        if not g.direcionado:
+            raw = g.forcas()
+        elif mode == "in":
+            raw = g.transposto().forcas()
+        elif mode == "out":
+            raw = g.forcas()
+        else:
+            raw = g.forcas() + g.transposto().forcas()
+
+        if normalized:
+            raw = raw / (g.n - 1) if g.n > 1 else raw * 0.0
+        return self._translate_array(raw)
+
     # ---------- 2) Betweenness centrality ----------
 
+    @instrumentar(itens=len)
     def betweenness_centrality(
         self,
         normalized: bool = True,
@@ -119,6 +304,21 @@ class CentralityMetrics:
         :param normalized: se True, normaliza os valores.
         :param k: se definido, usa amostragem de k vértices para acelerar (grafos grandes).
         """
+        if self.poda is not None:
+            sub, mantidos, n = self._subgrafo_podado()
+            parciais = sub.betweenness_centrality(normalized, None if k is None else min(k, mantidos))
+            # normalização do NetworkX: 1 / ((n - 1)(n - 2)) com o n do grafo inteiro
+            fator = (mantidos - 1) * (mantidos - 2) / ((n - 1) * (n - 2)) if normalized and n > 2 else 1.0
+            return self._completar(parciais, fator)
+
+        if self.por_componente and k is None:
+            g = self._grafo_csr()
+            valores = GraphLIB.betweenness_por_componente(g, normalized, processos=self.processos)
+            return self._translate_ids(g.para_rotulos(valores))
+
+        if self.csr is not None:
+            return self._translate_array(GraphLIB.betweenness(self.csr, normalizado=normalized, k=k))
+
         values = nx.betweenness_centrality(
             self.G,
             normalized=normalized,
@@ -129,20 +329,82 @@ class CentralityMetrics:
 
     # ---------- 3) Closeness centrality ----------
 
-    def closeness_centrality(self, use_weights: bool = False) -> Dict[str, float]:
+    @instrumentar(itens=len)
+    def closeness_centrality(self, use_weights: bool = False, mode: Optional[str] = None) -> Dict[str, float]:
         """
         Centralidade de proximidade (closeness).
 
         :param use_weights:
             - False: distância = número de arestas
             - True : usa o peso como 'distance'
+        :param mode: "exact" ou "approx" (HyperANF; ver
+            distance_distribution). Padrão: `modo_closeness`.
         """
+        if self._modo(mode) == "approx":
+            if use_weights:
+                raise ValueError("O modo approx calcula apenas distâncias sem pesos.")
+            return dict(self.distance_distribution()["closeness"])
+
+        if self.poda is not None:
+            sub, mantidos, n = self._subgrafo_podado()
+            # fator (r - 1) / (n - 1) do wf_improved com o n do grafo inteiro
+            fator = (mantidos - 1) / (n - 1) if n > 1 else 1.0
+            return self._completar(sub.closeness_centrality(use_weights), fator)
+
+        if self.por_componente:
+            g = self._grafo_csr()
+            valores = GraphLIB.closeness_por_componente(g, use_weights, processos=self.processos)
+            return self._translate_ids(g.para_rotulos(valores))
+
+        if self.csr is not None:
+            return self._translate_array(GraphLIB.closeness(self.csr, ponderado=use_weights))
+
         distance_attr = "weight" if use_weights else None
         values = nx.closeness_centrality(self.G, distance=distance_attr)
         return self._translate_ids(values)
 
+    def closeness_top_k(
+        self,
+        k: int = 10,
+        use_weights: bool = False,
+        ao_parcial=None,
+        intervalo: int = 1000,
+        mode: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k de closeness calculado vértice a vértice, guardando só k
+        itens em memória.
+
+        :param ao_parcial: callback(top_k_parcial, vertices_processados)
+            chamado a cada `intervalo` vértices, para mostrar o ranking
+            enquanto o cálculo ainda está em andamento.
+        :param mode: como em closeness_centrality. O modo approx, a poda
+            e o cálculo por componente produzem todos os valores de uma
+            vez: o top-k sai deles (ao_parcial é chamado uma vez, no fim).
+        """
+        if self._modo(mode) == "approx" or self.poda is not None or self.por_componente:
+            valores = self.closeness_centrality(use_weights, mode)
+            resultado = _top_k(valores, k)
+            if ao_parcial is not None:
+                ao_parcial(resultado, len(valores))
+            return resultado
+
+        distance_attr = "weight" if use_weights else None
+        parcial = TopKStreaming(k)
+        nodes = self.G.nodes() if self.csr is None else self.csr.rotulos
+        for i, node in enumerate(nodes):
+            if self.csr is None:
+                valor = nx.closeness_centrality(self.G, u=node, distance=distance_attr)
+            else:
+                valor = float(GraphLIB.closeness(self.csr, ponderado=use_weights, vertices=[i])[i])
+            parcial.adicionar(self.id_to_label.get(node, str(node)), valor)
+            if ao_parcial is not None and parcial.vistos % intervalo == 0:
+                ao_parcial(parcial.resultado(), parcial.vistos)
+        return parcial.resultado()
+
     # ---------- 4) PageRank (implementado manualmente) ----------
 
+    @instrumentar(itens=len)
     def pagerank(
         self,
         alpha: float = 0.85,
@@ -156,6 +418,9 @@ class CentralityMetrics:
         - Pondera arestas pelo atributo 'weight'.
         - Trata vértices pendurados (sem saída).
         """
+        if self.csr is not None:
+            return self._translate_array(GraphLIB.pagerank(self.csr, alpha, max_iter, tol))
+
         G = self.G
 
         if G.number_of_nodes() == 0:
@@ -215,31 +480,134 @@ class CentralityMetrics:
         # traduz ids se tiver mapeamento
         return self._translate_ids(rank)
 
+    # ---------- 5) Métricas direcionadas ----------
+
+    def _metricas_direcionadas(self) -> Dict[str, Any]:
+        if self._direcionadas is None:
+            self._direcionadas = GraphLIB.metricas_direcionadas(self._grafo_csr())
+        return self._direcionadas
+
+    @instrumentar(itens=len)
+    def directed_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Métricas de METRICAS_DIRECIONADAS, calculadas juntas (e uma vez só):
+
+          - in_strength / out_strength: soma dos pesos das arestas de
+            entrada / saída;
+          - hub / authority: HITS ponderado (como `nx.hits`), somando 1;
+          - reciprocity: fração dos vizinhos com interação nos dois
+            sentidos, como `nx.reciprocity` (0 em vértices isolados).
+
+        Em grafos não direcionados, entrada e saída coincidem e a
+        reciprocidade é 1.
+        """
+        calculadas = self._metricas_direcionadas()
+        g = self._grafo_csr()
+        arrays = {
+            "in_strength": calculadas["forca_entrada"],
+            "out_strength": calculadas["forca_saida"],
+            "hub": calculadas["hubs"],
+            "authority": calculadas["autoridades"],
+            "reciprocity": np.nan_to_num(calculadas["reciprocidade"], nan=0.0),
+        }
+        return {nome: self._translate_ids(g.para_rotulos(valores)) for nome, valores in arrays.items()}
+
+    def hits(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """(hubs, autoridades) do HITS ponderado; ver directed_metrics."""
+        metricas = self.directed_metrics()
+        return metricas["hub"], metricas["authority"]
+
+    def overall_reciprocity(self) -> float:
+        """Fração das arestas (sem laços) com a aresta inversa, como `nx.overall_reciprocity`."""
+        return self._metricas_direcionadas()["reciprocidade_global"]
+
     # ---------- pacote completo ----------
 
+    def compute_iter(
+        self,
+        degree_mode: str = "total",
+        metricas: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """
+        Calcula as métricas principais uma a uma, devolvendo
+        (nome_metrica, valores) assim que cada uma fica pronta.
+        Permite que a interface mostre resultados parciais.
+
+        :param metricas: subconjunto de METRICAS e METRICAS_DIRECIONADAS
+            a calcular (padrão: todas as de METRICAS).
+        """
+        selecionadas = _validar_metricas(metricas)
+        calculos = {
+            "degree": lambda: self.degree_centrality(mode=degree_mode),
+            "betweenness": self.betweenness_centrality,
+            "closeness": self.closeness_centrality,
+            "pagerank": self.pagerank,
+        }
+        # as direcionadas saem juntas: calculadas na primeira pedida
+        direcionadas: Dict[str, Dict[str, float]] = {}
+
+        def direcionada(nome: str) -> Dict[str, float]:
+            if not direcionadas:
+                direcionadas.update(self.directed_metrics())
+            return direcionadas[nome]
+
+        for nome in METRICAS_DIRECIONADAS:
+            calculos[nome] = lambda nome=nome: direcionada(nome)
+        for nome in selecionadas:
+            yield nome, calculos[nome]()
+
+    @instrumentar()
     def compute_all(
         self,
-        degree_mode: str = "total"
+        degree_mode: str = "total",
+        metricas: Optional[Iterable[str]] = None
     ) -> Dict[str, Dict[str, float]]:
         """
         Devolve todas as métricas principais em um dicionário,
         pronto pra ser usado na etapa de relatório/interface.
         """
-        return {
-            "degree": self.degree_centrality(mode=degree_mode),
-            "betweenness": self.betweenness_centrality(),
-            "closeness": self.closeness_centrality(),
-            "pagerank": self.pagerank()
-        }
-
-def resumo_metricas_grafo(G: nx.Graph) -> Dict[str, Dict[str, float]]:
+        return dict(self.compute_iter(degree_mode=degree_mode, metricas=metricas))
+
+
+METRICAS = ["degree", "betweenness", "closeness", "pagerank"]
+# pedidas explicitamente (ex.: cli --direcionado); ver directed_metrics
+METRICAS_DIRECIONADAS = ["in_strength", "out_strength", "hub", "authority", "reciprocity"]
+# modos de closeness_centrality / harmonic_centrality
+MODOS = ["exact", "approx"]
+# subgrafos aceitos em CentralityMetrics(poda=...)
+PODAS = ["kcore", "maior_componente"]
+
+
+def _validar_metricas(metricas: Optional[Iterable[str]]) -> List[str]:
+    """Mantém a ordem de METRICAS (e METRICAS_DIRECIONADAS) e rejeita nomes desconhecidos."""
+    if metricas is None:
+        return list(METRICAS)
+    pedidas = set(metricas)
+    conhecidas = METRICAS + METRICAS_DIRECIONADAS
+    desconhecidas = pedidas - set(conhecidas)
+    if desconhecidas:
+        raise ValueError(f"Métricas desconhecidas: {', '.join(sorted(desconhecidas))}")
+    return [m for m in conhecidas if m in pedidas]
+
+def resumo_metricas_grafo(
+    G: nx.Graph,
+    metricas: Optional[Iterable[str]] = None
+) -> Dict[str, Dict[str, float]]:
     """
     Calcula, para um grafo, a soma e a média de cada métrica
     (degree, betweenness, closeness, pagerank).
     """
     cm = CentralityMetrics(G)
-    all_metrics = cm.compute_all()
+    return resumir_metricas(cm.compute_all(metricas=metricas))
 
+
+def resumir_metricas(
+    all_metrics: Dict[str, Dict[str, float]]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Soma e média de métricas já calculadas (saída de compute_all),
+    para quem também precisa dos valores por vértice.
+    """
     resumo: Dict[str, Dict[str, float]] = {}
 
     for nome_metrica, valores in all_metrics.items():
@@ -261,20 +629,34 @@ def resumo_metricas_grafo(G: nx.Graph) -> Dict[str, Dict[str, float]]:
 
 
 def resumo_geral_grafos(
-    grafos: List[Tuple[str, nx.Graph]]
+    grafos: List[Tuple[str, nx.Graph]],
+    metricas: Optional[Iterable[str]] = None
 ) -> Tuple[List[Tuple[str, Dict[str, Dict[str, float]]]], Dict[str, float]]:
     """
     :param grafos: lista de tuplas (nome_grafo, grafo)
+    :param metricas: subconjunto de METRICAS (padrão: todas)
     :return:
         - lista com (nome_grafo, resumo_metricas_grafo)
         - dicionário com média geral (ponderada) entre grafos para cada métrica
     """
+    metricas = _validar_metricas(metricas)
     individuais: List[Tuple[str, Dict[str, Dict[str, float]]]] = []
     for nome, G in grafos:
-        resumo = resumo_metricas_grafo(G)
+        resumo = resumo_metricas_grafo(G, metricas)
         individuais.append((nome, resumo))
 
-    metricas = ["degree", "betweenness", "closeness", "pagerank"]
+    return individuais, media_geral_grafos(individuais, metricas)
+
+
+def media_geral_grafos(
+    individuais: List[Tuple[str, Dict[str, Dict[str, float]]]],
+    metricas: Optional[Iterable[str]] = None
+) -> Dict[str, float]:
+    """
+    Média geral (ponderada pelo número de vértices) de cada métrica,
+    a partir dos resumos individuais de resumo_metricas_grafo.
+    """
+    metricas = _validar_metricas(metricas)
     media_geral: Dict[str, float] = {}
 
     for met in metricas:
@@ -291,26 +673,82 @@ def resumo_geral_grafos(
         else:
             media_geral[met] = 0.0
 
-    return individuais, media_geral
+    return media_geral
+
+def media_entre_repositorios(
+    repositorios: List[Tuple[str, List[Tuple[str, Dict[str, Dict[str, float]]]]]],
+    metricas: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Estende media_geral_grafos para vários repositórios, mantendo a
+    ponderação pelo número de vértices.
+
+    :param repositorios: lista de (chave, individuais), onde
+        individuais é a primeira saída de resumo_geral_grafos e chave
+        identifica o dataset (ex.: o caminho do arquivo; dois datasets
+        do mesmo repositório precisam de chaves diferentes).
+    :return: dicionário com
+        - "por_repositorio": média geral de cada chave
+        - "por_camada": média de cada camada (mesmo nome de grafo) somando
+          todos os repositórios
+        - "geral": média de todos os grafos de todos os repositórios
+    """
+    metricas = _validar_metricas(metricas)
+    por_camada: Dict[str, List[Tuple[str, Dict[str, Dict[str, float]]]]] = {}
+    todos: List[Tuple[str, Dict[str, Dict[str, float]]]] = []
+    por_repositorio: Dict[str, Dict[str, float]] = {}
+
+    for repo, individuais in repositorios:
+        if repo in por_repositorio:
+            raise ValueError(f"Chave de repositório repetida: {repo}")
+        por_repositorio[repo] = media_geral_grafos(individuais, metricas)
+        for nome, resumo in individuais:
+            por_camada.setdefault(nome, []).append((repo, resumo))
+            todos.append((f"{repo}:{nome}", resumo))
+
+    return {
+        "por_repositorio": por_repositorio,
+        "por_camada": {
+            nome: media_geral_grafos(resumos, metricas)
+            for nome, resumos in por_camada.items()
+        },
+        "geral": media_geral_grafos(todos, metricas),
+    }
 
 class CommunityMetrics:
     """
     Métricas de Comunidade:
       1) Detecção de comunidades (modularidade)
       2) Bridging ties (vértices que conectam comunidades diferentes)
+
+    Aceita os mesmos grafos que CentralityMetrics. A detecção não tem
+    versão nativa: grafos do Graph_LIB são copiados para o NetworkX só
+    para ela; as pontes são contadas direto no GrafoCSR.
     """
 
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph):
         self.G = graph
+        self.csr = None if GraphLIB.e_networkx(graph) else GraphLIB.congelar(graph)
+        self._copia_nx = None
+
+    def _networkx(self) -> nx.Graph:
+        """O grafo no NetworkX (copiado do GrafoCSR uma única vez)."""
+        if self.csr is None:
+            return self.G
+        if self._copia_nx is None:
+            self._copia_nx = self.csr.para_networkx()
+        return self._copia_nx
 
     # -------------------------
     # 1) Comunidades + modularidade
     # -------------------------
+    @instrumentar("Graph_LIB.CommunityMetrics.detectar_comunidades", itens=lambda r: r["num_comunidades"])
     def detectar_comunidades(self):
         """
         Detecta comunidades usando o algoritmo de modularidade (greedy)
         """
-        if self.G.number_of_nodes() == 0:
+        G = self._networkx()
+        if G.number_of_nodes() == 0:
             return {
                 "comunidades": [],
                 "modularidade": 0.0,
@@ -320,8 +758,8 @@ class CommunityMetrics:
 
         from networkx.algorithms.community import greedy_modularity_communities, modularity
 
-        comunidades = list(greedy_modularity_communities(self.G))
-        modularidade = modularity(self.G, comunidades)
+        comunidades = list(greedy_modularity_communities(G))
+        modularidade = modularity(G, comunidades)
 
         tamanhos = [len(c) for c in comunidades]
 
@@ -338,6 +776,7 @@ class CommunityMetrics:
     # -------------------------
     # 2) Bridging Ties
     # -------------------------
+    @instrumentar("Graph_LIB.CommunityMetrics.bridging_ties", itens=len)
     def bridging_ties(self):
         """
         Mede quem são os vértices que atuam como "pontes" entre comunidades:
@@ -349,6 +788,9 @@ class CommunityMetrics:
         if not comunidades:
             return {}
 
+        if self.csr is not None:
+            return self._bridging_nativo(comunidades)
+
         # cria map node -> comunidade
         node_to_com = {}
         for idx, com in enumerate(comunidades):
@@ -368,6 +810,21 @@ class CommunityMetrics:
 
         return bridging_score
 
+    def _bridging_nativo(self, comunidades) -> Dict[Any, int]:
+        """bridging_ties sobre o GrafoCSR: conta as arestas entre comunidades por vértice."""
+        g = self.csr
+        comunidade = np.empty(g.n, dtype=np.int64)
+        for idx, com in enumerate(comunidades):
+            comunidade[[g.ids[v] for v in com]] = idx
+
+        origens = g.origens()
+        entre = comunidade[origens] != comunidade[g.indices]
+        # não direcionado: cada aresta aparece nos dois sentidos, uma vez por extremidade
+        score = np.bincount(origens[entre], minlength=g.n)
+        if g.direcionado:
+            score += np.bincount(g.indices[entre], minlength=g.n)
+        return g.para_rotulos(score)
+
     # -------------------------
     # Pacote completo
     # -------------------------
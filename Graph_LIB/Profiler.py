@@ -0,0 +1,277 @@
+"""Instrumentação das etapas do pipeline (tempo, CPU, memória, itens).
+
+As etapas importantes (load_data, build_graph, métricas, comunidades,
+layout, renderização) são marcadas com `@instrumentar(...)` ou com o
+context manager `etapa(...)`. Enquanto nenhum `Profiler` está ativo,
+a marcação custa uma consulta a uma variável global por chamada.
+
+Com um `Profiler` ativo, cada etapa registra:
+  - tempo de parede (perf_counter) e tempo de CPU da thread;
+  - pico de memória acima do início da etapa (tracemalloc, opcional);
+  - quantidade de itens processados (vértices, arestas, interações...).
+
+Uso:
+    with Profiler() as prof:
+        data = load_data("dados_github.json")
+        ...
+    print(prof.texto())
+    prof.salvar_chrome_trace("trace.json")  # abrir em chrome://tracing ou Perfetto
+
+O registro vale para todas as threads (inclusive as do TaskScheduler).
+O tracemalloc é global, então com etapas simultâneas em threads
+diferentes o pico de uma inclui as alocações da outra.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+# profiler ativo (None = instrumentação desligada)
+_ativo: Optional["Profiler"] = None
+
+
+class Registro:
+    """Uma execução de uma etapa."""
+
+    __slots__ = ("nome", "inicio", "duracao", "cpu", "pico_memoria", "itens", "thread", "nivel", "_pico_filhos")
+
+    def __init__(self, nome, inicio, thread, nivel):
+        self.nome = nome
+        self.inicio = inicio
+        self.duracao = 0.0
+        self.cpu = 0.0
+        self.pico_memoria = None
+        self.itens = None
+        self.thread = thread
+        self.nivel = nivel
+        self._pico_filhos = 0
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "nome": self.nome,
+            "inicio": self.inicio,
+            "duracao": self.duracao,
+            "cpu": self.cpu,
+            "pico_memoria": self.pico_memoria,
+            "itens": self.itens,
+            "thread": self.thread,
+            "nivel": self.nivel,
+        }
+
+
+class _EtapaNula:
+    """Contexto usado quando a instrumentação está desligada."""
+
+    itens = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULA = _EtapaNula()
+
+
+class Profiler:
+    """Coleta os registros das etapas enquanto está ativo."""
+
+    def __init__(self, memoria: bool = True):
+        """
+        :param memoria: mede o pico de memória com tracemalloc (deixa o
+            código instrumentado mais lento enquanto ativo).
+        """
+        self.memoria = memoria
+        self.registros: List[Registro] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._iniciou_tracemalloc = False
+        self._origem = time.perf_counter()
+
+    # ---------- ativação ----------
+
+    def iniciar(self):
+        """Ativa este profiler globalmente."""
+        global _ativo
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+        self._origem = time.perf_counter()
+        _ativo = self
+        return self
+
+    def parar(self):
+        """Desativa a instrumentação (os registros continuam disponíveis)."""
+        global _ativo
+        if _ativo is self:
+            _ativo = None
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+
+    @property
+    def ativo(self) -> bool:
+        return _ativo is self
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
+        return False
+
+    def limpar(self):
+        with self._lock:
+            self.registros = []
+        self._origem = time.perf_counter()
+
+    # ---------- medição ----------
+
+    def _pilha(self) -> list:
+        pilha = getattr(self._local, "pilha", None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        return pilha
+
+    @contextmanager
+    def medir(self, nome: str):
+        pilha = self._pilha()
+        registro = Registro(nome, time.perf_counter() - self._origem, threading.get_ident(), len(pilha))
+
+        memoria = self.memoria and tracemalloc.is_tracing()
+        if memoria:
+            atual, pico = tracemalloc.get_traced_memory()
+            # guarda o pico até aqui na etapa pai antes de zerar
+            if pilha:
+                pilha[-1]._pico_filhos = max(pilha[-1]._pico_filhos, pico)
+            tracemalloc.reset_peak()
+            base_memoria = atual
+
+        pilha.append(registro)
+        cpu0 = time.thread_time()
+        t0 = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            registro.duracao = time.perf_counter() - t0
+            registro.cpu = time.thread_time() - cpu0
+            pilha.pop()
+
+            if memoria and tracemalloc.is_tracing():
+                _, pico = tracemalloc.get_traced_memory()
+                pico = max(pico, registro._pico_filhos)
+                registro.pico_memoria = max(pico - base_memoria, 0)
+                if pilha:
+                    pilha[-1]._pico_filhos = max(pilha[-1]._pico_filhos, pico)
+
+            with self._lock:
+                self.registros.append(registro)
+
+    # ---------- resultados ----------
+
+    def resumo(self) -> Dict[str, Dict[str, Any]]:
+        """Totais por etapa: chamadas, tempo, CPU, maior pico e itens."""
+        resumo: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            registros = list(self.registros)
+        for r in registros:
+            linha = resumo.setdefault(r.nome, {
+                "chamadas": 0, "segundos": 0.0, "cpu": 0.0, "pico_memoria": None, "itens": None
+            })
+            linha["chamadas"] += 1
+            linha["segundos"] += r.duracao
+            linha["cpu"] += r.cpu
+            if r.pico_memoria is not None:
+                linha["pico_memoria"] = max(linha["pico_memoria"] or 0, r.pico_memoria)
+            if r.itens is not None:
+                linha["itens"] = (linha["itens"] or 0) + r.itens
+        return resumo
+
+    def texto(self) -> str:
+        """Tabela do resumo, das etapas mais demoradas para as mais rápidas."""
+        resumo = sorted(self.resumo().items(), key=lambda x: x[1]["segundos"], reverse=True)
+        largura = max((len(nome) for nome, _ in resumo), default=5)
+        linhas = [f"  {'etapa':<{largura}} {'chamadas':>8} {'tempo (s)':>10} {'cpu (s)':>9} {'pico (MB)':>10} {'itens':>10}"]
+        for nome, r in resumo:
+            pico = "-" if r["pico_memoria"] is None else f"{r['pico_memoria'] / 1e6:.1f}"
+            itens = "-" if r["itens"] is None else str(r["itens"])
+            linhas.append(
+                f"  {nome:<{largura}} {r['chamadas']:>8} {r['segundos']:>10.3f} {r['cpu']:>9.3f} {pico:>10} {itens:>10}"
+            )
+        return "Perfil por etapa:\n" + "\n".join(linhas)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Registros no formato Trace Event (chrome://tracing, Perfetto)."""
+        with self._lock:
+            registros = list(self.registros)
+        pid = os.getpid()
+        eventos = []
+        for r in sorted(registros, key=lambda r: r.inicio):
+            args = {"cpu_ms": r.cpu * 1000.0}
+            if r.pico_memoria is not None:
+                args["pico_mb"] = r.pico_memoria / 1e6
+            if r.itens is not None:
+                args["itens"] = r.itens
+            eventos.append({
+                "name": r.nome,
+                "ph": "X",
+                "ts": r.inicio * 1e6,
+                "dur": r.duracao * 1e6,
+                "pid": pid,
+                "tid": r.thread,
+                "args": args,
+            })
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def salvar_chrome_trace(self, caminho: str) -> str:
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return caminho
+
+
+def ativo() -> Optional[Profiler]:
+    """O profiler ativo, ou None se a instrumentação está desligada."""
+    return _ativo
+
+
+def etapa(nome: str):
+    """
+    Context manager que mede um trecho. O objeto devolvido aceita
+    `.itens = n` para registrar quantos itens foram processados.
+    """
+    prof = _ativo
+    if prof is None:
+        return _NULA
+    return prof.medir(nome)
+
+
+def instrumentar(nome: Optional[str] = None, itens: Optional[Callable[[Any], int]] = None):
+    """
+    Decorador que mede cada chamada da função.
+
+    :param nome: nome da etapa (padrão: nome qualificado da função).
+    :param itens: função resultado -> quantidade de itens (ex.: len).
+    """
+    def decorador(funcao):
+        rotulo = nome or funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            prof = _ativo
+            if prof is None:
+                return funcao(*args, **kwargs)
+            with prof.medir(rotulo) as registro:
+                resultado = funcao(*args, **kwargs)
+                if itens is not None:
+                    registro.itens = itens(resultado)
+                return resultado
+
+        return envoltorio
+
+    return decorador
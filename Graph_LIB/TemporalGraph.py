@@ -0,0 +1,283 @@
+"""Grafo temporal de interações.
+
+Este módulo fornece `TemporalGraph`, que guarda as interações
+ordenadas pelo instante em que aconteceram, e permite calcular
+métricas em janelas deslizantes (ex.: 90 dias, avançando uma semana
+por vez). Entre uma janela e a próxima, apenas as arestas que entram
+e saem da janela são aplicadas ao estado atual, em vez de reconstruir
+o grafo inteiro a cada passo.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def _parse_instante(valor):
+    """Converte um instante ISO 8601 (ou datetime) em datetime."""
+    if valor is None or isinstance(valor, datetime):
+        return valor
+    # fromisoformat não aceita o sufixo "Z" antes do Python 3.11
+    if valor.endswith("Z"):
+        valor = valor[:-1] + "+00:00"
+    return datetime.fromisoformat(valor)
+
+
+def _no_fuso_de(instante, referencia):
+    """Alinha `instante` ao fuso de `referencia` (ingênuo = UTC).
+
+    Os instantes do GitHub vêm em UTC com "Z"; comparar um datetime sem
+    fuso com eles levantaria TypeError.
+    """
+    if instante is None or referencia is None:
+        return instante
+    if referencia.tzinfo is not None and instante.tzinfo is None:
+        return instante.replace(tzinfo=timezone.utc)
+    if referencia.tzinfo is None and instante.tzinfo is not None:
+        return instante.astimezone(timezone.utc).replace(tzinfo=None)
+    return instante
+
+
+class TemporalGraph:
+    """Multigrafo não direcionado de interações ordenadas no tempo.
+
+    Cada evento é uma tupla `(instante, u, v, peso)` e a lista de
+    eventos é mantida sempre ordenada por instante, o que permite
+    recortar intervalos com busca binária.
+    """
+
+    def __init__(self):
+        """Inicializa a lista ordenada de eventos."""
+        self.eventos: List[Tuple[datetime, Any, Any, float]] = []
+
+    @classmethod
+    def from_interacoes(cls, interacoes: Iterable[Dict[str, Any]]) -> "TemporalGraph":
+        """Cria o grafo temporal a partir das interações do JSON.
+
+        Usa o campo "timestamp" das interações brutas. Entradas
+        agregadas não guardam o instante de cada evento; nelas o
+        grupo inteiro é posicionado em "last". Interações sem
+        instante são ignoradas.
+        """
+        tg = cls()
+        for interacao in interacoes:
+            instante = _parse_instante(
+                interacao.get("timestamp", interacao.get("last"))
+            )
+            if instante is None:
+                continue
+            tg.eventos.append(
+                (instante, interacao["from"], interacao["to"], interacao.get("weight", 1))
+            )
+        # ordena uma única vez em vez de inserir evento a evento
+        tg.eventos.sort(key=lambda e: e[0])
+        return tg
+
+    def add_interaction(self, u, v, instante, peso=1):
+        """Insere um evento mantendo a ordem temporal."""
+        insort(self.eventos, (_parse_instante(instante), u, v, peso), key=lambda e: e[0])
+
+    def get_event_count(self):
+        """Retorna o número de eventos armazenados."""
+        return len(self.eventos)
+
+    def intervalo(self) -> Optional[Tuple[datetime, datetime]]:
+        """Retorna o primeiro e o último instante, ou None se vazio."""
+        if not self.eventos:
+            return None
+        return self.eventos[0][0], self.eventos[-1][0]
+
+    def eventos_entre(self, inicio, fim):
+        """Retorna os eventos com `inicio <= instante < fim`.
+
+        Limites sem fuso são tratados como UTC quando os eventos têm fuso.
+        """
+        if not self.eventos:
+            return []
+        referencia = self.eventos[0][0]
+        inicio = _no_fuso_de(_parse_instante(inicio), referencia)
+        fim = _no_fuso_de(_parse_instante(fim), referencia)
+        i = bisect_left(self.eventos, inicio, key=lambda e: e[0])
+        j = bisect_left(self.eventos, fim, key=lambda e: e[0])
+        return self.eventos[i:j]
+
+    def janelas_deslizantes(
+        self,
+        largura: timedelta = timedelta(days=90),
+        passo: timedelta = timedelta(days=7),
+        usuarios: Optional[Iterable[Any]] = None,
+        inicio: Optional[datetime] = None,
+        fim: Optional[datetime] = None,
+        alpha: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1.0e-06
+    ) -> Iterator[Dict[str, Any]]:
+        """Gera as métricas de cada janela `[t, t + largura)`.
+
+        :param largura: tamanho da janela.
+        :param passo: quanto a janela avança a cada snapshot.
+        :param usuarios: se informado, o conjunto de vértices é fixo
+            (como em `build_graph`); caso contrário, cada janela tem
+            apenas os usuários com alguma interação nela.
+        :param inicio, fim: limites da varredura (padrão: intervalo
+            completo dos eventos). Sem fuso, são tratados como UTC
+            quando os eventos têm fuso.
+
+        Cada snapshot contém "inicio", "fim", "num_arestas", "grau",
+        "forca", "pagerank" e "iteracoes" (iterações de PageRank
+        gastas, que caem bastante graças ao warm start).
+        """
+        limites = self.intervalo()
+        if limites is None:
+            return
+        inicio = _no_fuso_de(_parse_instante(inicio), limites[0]) or limites[0]
+        fim = _no_fuso_de(_parse_instante(fim), limites[0]) or limites[1]
+
+        janela = _EstadoJanela(usuarios)
+        entra = bisect_left(self.eventos, inicio, key=lambda e: e[0])
+        sai = entra
+
+        t = inicio
+        while t <= fim:
+            t_fim = t + largura
+
+            # deltas: entram os eventos até o fim da janela...
+            while entra < len(self.eventos) and self.eventos[entra][0] < t_fim:
+                _, u, v, w = self.eventos[entra]
+                janela.adicionar(u, v, w)
+                entra += 1
+
+            # ...e saem os que ficaram antes do início
+            while sai < entra and self.eventos[sai][0] < t:
+                _, u, v, w = self.eventos[sai]
+                janela.remover(u, v, w)
+                sai += 1
+
+            pagerank, iteracoes = janela.pagerank(alpha, max_iter, tol)
+            yield {
+                "inicio": t,
+                "fim": t_fim,
+                "num_arestas": janela.num_arestas,
+                "grau": dict(janela.grau),
+                "forca": dict(janela.forca),
+                "pagerank": pagerank,
+                "iteracoes": iteracoes
+            }
+
+            t += passo
+
+    def __str__(self):
+        return f"TemporalGraph(eventos={len(self.eventos)}, intervalo={self.intervalo()})"
+
+
+class _EstadoJanela:
+    """Estado incremental do grafo de uma janela.
+
+    Mantém o grafo agregado (como `build_graph`), o grau, a força
+    (grau ponderado) e o último vetor de PageRank, usado como ponto de
+    partida na janela seguinte. Como no NetworkX, um laço (u, u) conta
+    duas vezes no grau e na força de u.
+    """
+
+    def __init__(self, usuarios=None):
+        self.fixos = set(usuarios) if usuarios is not None else None
+        self.adj: Dict[Any, Dict[Any, List[float]]] = {}  # u -> v -> [peso, contagem]
+        self.grau: Dict[Any, int] = {}
+        self.forca: Dict[Any, float] = {}
+        self.num_arestas = 0
+        self.rank: Dict[Any, float] = {}
+
+        if self.fixos is not None:
+            for v in self.fixos:
+                self._garantir_vertice(v)
+
+    def _garantir_vertice(self, v):
+        if v not in self.adj:
+            self.adj[v] = {}
+            self.grau[v] = 0
+            self.forca[v] = 0.0
+
+    def _descartar_vertice(self, v):
+        if self.fixos is None and not self.adj[v]:
+            del self.adj[v]
+            del self.grau[v]
+            del self.forca[v]
+
+    def adicionar(self, u, v, w):
+        self._garantir_vertice(u)
+        self._garantir_vertice(v)
+
+        aresta = self.adj[u].get(v)
+        if aresta is None:
+            aresta = [0.0, 0]
+            self.adj[u][v] = aresta
+            self.adj[v][u] = aresta  # mesma lista nos dois sentidos
+            # laço: as duas pontas somam em u
+            self.grau[u] += 1
+            self.grau[v] += 1
+            self.num_arestas += 1
+
+        aresta[0] += w
+        aresta[1] += 1
+        self.forca[u] += w
+        self.forca[v] += w
+
+    def remover(self, u, v, w):
+        aresta = self.adj[u][v]
+        aresta[0] -= w
+        aresta[1] -= 1
+        self.forca[u] -= w
+        self.forca[v] -= w
+
+        # a contagem decide a remoção, evitando resíduos de ponto flutuante
+        if aresta[1] == 0:
+            del self.adj[u][v]
+            self.grau[u] -= 1
+            self.grau[v] -= 1
+            if u != v:
+                del self.adj[v][u]
+            self.num_arestas -= 1
+            self.forca[u] = 0.0 if not self.adj[u] else self.forca[u]
+            self.forca[v] = 0.0 if not self.adj[v] else self.forca[v]
+            self._descartar_vertice(u)
+            if u != v:
+                self._descartar_vertice(v)
+
+    def pagerank(self, alpha, max_iter, tol):
+        """PageRank ponderado com warm start a partir da janela anterior.
+
+        Mesma iteração de potência de `CentralityMetrics.pagerank`.
+        """
+        nodes = list(self.adj)
+        n = len(nodes)
+        if n == 0:
+            self.rank = {}
+            return {}, 0
+
+        # warm start: reaproveita o rank anterior e renormaliza
+        anterior = self.rank
+        rank = {v: anterior.get(v, 1.0 / n) for v in nodes}
+        total = sum(rank.values())
+        rank = {v: r / total for v, r in rank.items()}
+
+        iteracoes = 0
+        for iteracoes in range(1, max_iter + 1):
+            dangling_sum = sum(rank[v] for v in nodes if self.forca[v] == 0.0)
+            base = (1.0 - alpha) / n + alpha * dangling_sum / n
+            new_rank = {v: base for v in nodes}
+
+            for u in nodes:
+                out_s = self.forca[u]
+                if out_s == 0.0:
+                    continue
+                fator = alpha * rank[u] / out_s
+                for v, (w, _) in self.adj[u].items():
+                    new_rank[v] += fator * w
+
+            diff = sum(abs(new_rank[v] - rank[v]) for v in nodes)
+            rank = new_rank
+            if diff < tol:
+                break
+
+        self.rank = rank
+        return dict(rank), iteracoes
@@ -0,0 +1,150 @@
+"""Consultas top-k sobre métricas de vértices.
+
+Ordenar o dicionário inteiro de uma métrica para pegar os 10 maiores
+custa O(n log n) e cria listas do tamanho do grafo. Aqui:
+  - `VetorMetrica` guarda a métrica em um vetor NumPy e usa
+    `argpartition` (O(n)) para o top-k, inclusive por grupo
+    (comunidade, camada, etc.); `top_k` passa o dicionário por ela;
+  - `TopKStreaming` mantém só k itens em um heap mínimo e pode ser
+    alimentado enquanto a métrica ainda está sendo calculada.
+
+Empates seguem a ordem de inserção, como em
+`sorted(..., reverse=True)[:k]`.
+"""
+
+import heapq
+from itertools import count
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def top_k(metric: Dict[str, float], k: int = 10) -> List[Tuple[str, float]]:
+    """Os k itens de maior valor de um dicionário de métrica."""
+    return VetorMetrica.from_dict(metric).top_k(k)
+
+
+def top_k_por_camada(
+    metricas_por_camada: Dict[str, Dict[str, float]],
+    k: int = 10
+) -> Dict[str, List[Tuple[str, float]]]:
+    """Top-k de uma métrica em cada camada (ex.: cada tipo de interação)."""
+    return {camada: top_k(valores, k) for camada, valores in metricas_por_camada.items()}
+
+
+def top_k_por_comunidade(
+    metric: Dict[str, float],
+    comunidades: Sequence[Iterable[Any]],
+    k: int = 10
+) -> List[List[Tuple[str, float]]]:
+    """Top-k de uma métrica dentro de cada comunidade.
+
+    :param comunidades: lista de comunidades (listas de vértices), como
+        em `detectar_comunidades()["comunidades"]`.
+    """
+    vetor = VetorMetrica.from_dict(metric)
+    grupo = np.full(len(vetor), -1, dtype=np.int64)
+    for idx, com in enumerate(comunidades):
+        for v in com:
+            i = vetor.indice.get(str(v))
+            if i is not None:
+                grupo[i] = idx
+    por_grupo = vetor.top_k_por_grupo(grupo, k)
+    return [por_grupo.get(idx, []) for idx in range(len(comunidades))]
+
+
+class VetorMetrica:
+    """Métrica de vértices em formato de vetor (rótulos + valores)."""
+
+    def __init__(self, rotulos: Sequence[str], valores):
+        self.rotulos = list(rotulos)
+        self.valores = np.asarray(valores, dtype=float)
+        self.indice = {r: i for i, r in enumerate(self.rotulos)}
+
+    @classmethod
+    def from_dict(cls, metric: Dict[str, float]) -> "VetorMetrica":
+        return cls(list(metric), np.fromiter(metric.values(), dtype=float, count=len(metric)))
+
+    def __len__(self):
+        return len(self.rotulos)
+
+    def _indices_top_k(self, valores: np.ndarray, k: int) -> np.ndarray:
+        n = len(valores)
+        if k <= 0 or n == 0:
+            return np.empty(0, dtype=np.int64)
+        if k < n:
+            # partition acha o k-ésimo maior em O(n); dos empatados com ele
+            # entram os de menor posição, como em sorted()
+            limiar = -np.partition(-valores, k - 1)[k - 1]
+            maiores = np.flatnonzero(valores > limiar)
+            empatados = np.flatnonzero(valores == limiar)[:k - len(maiores)]
+            candidatos = np.concatenate([maiores, empatados])
+        else:
+            candidatos = np.arange(n)
+        # ordena por valor decrescente e, no empate, pela posição original
+        return candidatos[np.lexsort((candidatos, -valores[candidatos]))]
+
+    def top_k(self, k: int = 10) -> List[Tuple[str, float]]:
+        """Os k maiores valores, em ordem decrescente."""
+        idx = self._indices_top_k(self.valores, k)
+        return [(self.rotulos[i], float(self.valores[i])) for i in idx]
+
+    def top_k_por_grupo(self, grupo, k: int = 10) -> Dict[int, List[Tuple[str, float]]]:
+        """Top-k dentro de cada grupo.
+
+        :param grupo: vetor com o id do grupo de cada vértice (-1 ignora).
+        """
+        grupo = np.asarray(grupo, dtype=np.int64)
+        validos = np.nonzero(grupo >= 0)[0]
+        if len(validos) == 0:
+            return {}
+
+        # agrupa com um único argsort estável e faz o top-k em cada fatia
+        ordem = validos[np.argsort(grupo[validos], kind="stable")]
+        ids, inicios = np.unique(grupo[ordem], return_index=True)
+        fins = np.append(inicios[1:], len(ordem))
+
+        resultado = {}
+        for g, ini, fim in zip(ids, inicios, fins):
+            fatia = ordem[ini:fim]
+            idx = fatia[self._indices_top_k(self.valores[fatia], k)]
+            resultado[int(g)] = [(self.rotulos[i], float(self.valores[i])) for i in idx]
+        return resultado
+
+
+class TopKStreaming:
+    """Top-k com memória limitada a k itens.
+
+    Pode receber os valores um a um (ou em lotes) enquanto a métrica é
+    calculada; `resultado()` devolve o top-k parcial a qualquer momento.
+    """
+
+    def __init__(self, k: int = 10):
+        self.k = k
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        # contador decrescente: no empate, fica quem chegou primeiro
+        self._ordem = count(0, -1)
+        self.vistos = 0
+
+    def adicionar(self, rotulo: Hashable, valor: float):
+        self.vistos += 1
+        if self.k <= 0:
+            return
+        item = (valor, next(self._ordem), rotulo)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def extend(self, itens: Iterable[Tuple[Hashable, float]]):
+        for rotulo, valor in itens:
+            self.adicionar(rotulo, valor)
+
+    def minimo(self) -> Optional[float]:
+        """Menor valor ainda no top-k (limiar para entrar), ou None."""
+        if not self._heap or len(self._heap) < self.k:
+            return None
+        return self._heap[0][0]
+
+    def resultado(self) -> List[Tuple[Hashable, float]]:
+        return [(rotulo, valor) for valor, _, rotulo in sorted(self._heap, reverse=True)]
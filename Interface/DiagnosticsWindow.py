@@ -0,0 +1,109 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from Graph_LIB.Profiler import Profiler
+
+
+class DiagnosticsWindow:
+    """
+    Painel de diagnóstico: liga/desliga a instrumentação das etapas e
+    mostra tempo, CPU, pico de memória e itens de cada uma.
+
+    O `Profiler` pertence a quem abre a janela, então os registros
+    continuam acumulando com a janela fechada.
+    """
+
+    COLUNAS = ["etapa", "chamadas", "segundos", "cpu", "pico_mb", "itens"]
+    HEADERS = ["Etapa", "Chamadas", "Tempo (s)", "CPU (s)", "Pico (MB)", "Itens"]
+
+    def __init__(self, parent, profiler: Profiler, intervalo_ms=1000):
+        self.profiler = profiler
+        self.intervalo_ms = intervalo_ms
+
+        self.win = tk.Toplevel(parent)
+        self.win.title("Diagnóstico")
+        self.win.geometry("760x380")
+
+        frame = ttk.Frame(self.win, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        controles = ttk.Frame(frame)
+        controles.pack(side=tk.TOP, fill=tk.X, pady=(0, 8))
+
+        self.var_ativo = tk.BooleanVar(value=profiler.ativo)
+        ttk.Checkbutton(
+            controles, text="Instrumentação ativa",
+            variable=self.var_ativo, command=self._alternar
+        ).pack(side=tk.LEFT)
+
+        self.var_memoria = tk.BooleanVar(value=profiler.memoria)
+        ttk.Checkbutton(
+            controles, text="Medir memória (mais lento)",
+            variable=self.var_memoria, command=self._alternar_memoria
+        ).pack(side=tk.LEFT, padx=10)
+
+        ttk.Button(controles, text="Exportar Chrome trace...", command=self._exportar).pack(side=tk.RIGHT)
+        ttk.Button(controles, text="Limpar", command=self._limpar).pack(side=tk.RIGHT, padx=5)
+
+        tabela = ttk.Frame(frame)
+        tabela.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tabela, columns=self.COLUNAS, show="headings", height=12)
+        for col, header in zip(self.COLUNAS, self.HEADERS):
+            self.tree.heading(col, text=header)
+            self.tree.column(col, anchor="center", width=90)
+        self.tree.column("etapa", anchor="w", width=300)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll = ttk.Scrollbar(tabela, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._atualizar()
+
+    def _alternar(self):
+        if self.var_ativo.get():
+            self.profiler.iniciar()
+        else:
+            self.profiler.parar()
+
+    def _alternar_memoria(self):
+        # o tracemalloc só é ligado/desligado ao (re)iniciar o profiler
+        ativo = self.profiler.ativo
+        self.profiler.parar()
+        self.profiler.memoria = self.var_memoria.get()
+        if ativo:
+            self.profiler.iniciar()
+
+    def _limpar(self):
+        self.profiler.limpar()
+        self._preencher()
+
+    def _exportar(self):
+        caminho = filedialog.asksaveasfilename(
+            parent=self.win,
+            defaultextension=".json",
+            filetypes=[("Chrome trace", "*.json")],
+            initialfile="trace.json"
+        )
+        if not caminho:
+            return
+        self.profiler.salvar_chrome_trace(caminho)
+        messagebox.showinfo("Diagnóstico", f"Trace salvo em:\n{caminho}", parent=self.win)
+
+    def _preencher(self):
+        self.tree.delete(*self.tree.get_children())
+        resumo = sorted(self.profiler.resumo().items(), key=lambda x: x[1]["segundos"], reverse=True)
+        for nome, r in resumo:
+            self.tree.insert("", tk.END, values=(
+                nome,
+                r["chamadas"],
+                f"{r['segundos']:.3f}",
+                f"{r['cpu']:.3f}",
+                "-" if r["pico_memoria"] is None else f"{r['pico_memoria'] / 1e6:.1f}",
+                "-" if r["itens"] is None else r["itens"],
+            ))
+
+    def _atualizar(self):
+        if not self.win.winfo_exists():
+            return
+        self._preencher()
+        self.win.after(self.intervalo_ms, self._atualizar)
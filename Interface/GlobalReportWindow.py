@@ -2,22 +2,38 @@ import tkinter as tk
 from tkinter import ttk
 import networkx as nx
 
-from Graph_LIB.Metrics import CentralityMetrics, resumo_geral_grafos, resumo_metricas_grafo
+from Graph_LIB.Metrics import (
+    CentralityMetrics,
+    media_geral_grafos,
+    resumo_geral_grafos,
+    resumo_metricas_grafo,
+)
 
 
 class GlobalReportWindow:
     """
     Janela com resumo geral das métricas para vários grafos.
+
+    Com um `scheduler` (TaskScheduler), cada grafo é resumido em segundo
+    plano e sua coluna aparece assim que o resumo fica pronto.
     """
 
+    METRICAS = ["degree", "betweenness", "closeness", "pagerank"]
+
     def __init__(
         self,
         parent,
         titulo: str,
-        grafos: list  # lista de (nome, grafo)
+        grafos: list,  # lista de (nome, grafo)
+        scheduler=None
     ):
         self.parent = parent
         self.grafos = grafos
+        self.scheduler = scheduler
+        self.tarefa = None
+        self.individuais = []
+        self.media_geral = {}
+        self._linhas = {}
 
         self.win = tk.Toplevel(parent)
         self.win.title(titulo)
@@ -26,9 +42,6 @@ class GlobalReportWindow:
         main_frame = ttk.Frame(self.win, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # calcula resumos
-        self.individuais, self.media_geral = resumo_geral_grafos(self.grafos)
-
         # tabela principal
         frame_tab = ttk.LabelFrame(main_frame, text="Médias das métricas por grafo")
         frame_tab.pack(fill=tk.BOTH, expand=True)
@@ -85,19 +98,56 @@ class GlobalReportWindow:
         btn_fechar.pack(side=tk.RIGHT)
 
     def _popular_tabela(self):
-        metricas = ["degree", "betweenness", "closeness", "pagerank"]
-
-        # monta uma linha por métrica
-        for met in metricas:
-            linha = [met]  # primeira coluna: nome da métrica
+        # uma linha por métrica; valores pendentes aparecem como "…"
+        for met in self.METRICAS:
+            linha = [met] + ["…"] * (len(self.grafos) + 1)
+            self._linhas[met] = self.tree.insert("", tk.END, values=tuple(linha))
 
-            # valores médios por grafo
+        if self.scheduler is None:
+            self.individuais, self.media_geral = resumo_geral_grafos(self.grafos)
             for nome_grafo, resumo in self.individuais:
-                valor = resumo.get(met, {}).get("media", 0.0)
-                linha.append(f"{valor:.4f}")
-
-            # média geral entre grafos para essa métrica
-            valor_geral = self.media_geral.get(met, 0.0)
-            linha.append(f"{valor_geral:.4f}")
-
-            self.tree.insert("", tk.END, values=tuple(linha))
+                self._receber_resumo(nome_grafo, resumo)
+            self._mostrar_media_geral(self.media_geral)
+            return
+
+        def calcular(tarefa):
+            individuais = []
+            for i, (nome, G) in enumerate(self.grafos):
+                tarefa.progresso(i / len(self.grafos), f"Calculando métricas: {nome}")
+                resumo = resumo_metricas_grafo(G)
+                individuais.append((nome, resumo))
+                tarefa.parcial(nome, resumo)
+            return media_geral_grafos(individuais)
+
+        def receber(nome_grafo, resumo):
+            self.individuais.append((nome_grafo, resumo))
+            self._receber_resumo(nome_grafo, resumo)
+
+        self.tarefa = self.scheduler.submeter(
+            f"Relatório geral — {len(self.grafos)} grafos",
+            calcular,
+            ao_parcial=receber,
+            ao_concluir=self._mostrar_media_geral
+        )
+        self.win.bind("<Destroy>", self._ao_fechar)
+
+    def _ao_fechar(self, event):
+        if event.widget is self.win and self.tarefa is not None:
+            self.tarefa.cancelar()
+
+    def _receber_resumo(self, nome_grafo, resumo):
+        if not self.win.winfo_exists():
+            return
+        # valores médios do grafo na sua coluna
+        for met in self.METRICAS:
+            valor = resumo.get(met, {}).get("media", 0.0)
+            self.tree.set(self._linhas[met], nome_grafo, f"{valor:.4f}")
+
+    def _mostrar_media_geral(self, media_geral):
+        if not self.win.winfo_exists():
+            return
+        # média geral entre grafos para cada métrica
+        self.media_geral = media_geral
+        for met in self.METRICAS:
+            valor_geral = media_geral.get(met, 0.0)
+            self.tree.set(self._linhas[met], "media_geral", f"{valor_geral:.4f}")
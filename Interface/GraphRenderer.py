@@ -0,0 +1,257 @@
+"""Renderização com nível de detalhe (LOD) para grafos grandes.
+
+`nx.draw` com rótulos cria um artista do matplotlib por vértice, por
+rótulo e por peso de aresta, o que torna redesenho e zoom inviáveis
+acima de algumas centenas de vértices. O `LODRenderer` desenha:
+  - todas as arestas em uma única `LineCollection`;
+  - todos os vértices em um único `scatter`;
+  - rótulos apenas para os top-k vértices (grau ou PageRank) visíveis,
+    ou para todos os visíveis quando o zoom deixa poucos na tela;
+  - pesos das arestas só quando há poucas arestas visíveis;
+  - regiões densas agregadas em células quando há vértices demais na
+    área visível.
+
+O tempo de cada quadro é medido e fica disponível em `tempos_quadro`.
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection
+
+
+class _Cronometro(Artist):
+    """Artista invisível desenhado antes dos demais: marca o início do quadro."""
+
+    def __init__(self, renderer):
+        super().__init__()
+        self._renderer = renderer
+        self.set_zorder(-1e9)
+
+    def draw(self, renderer):
+        self._renderer._inicio_quadro = time.perf_counter()
+
+
+class LODRenderer:
+    """Desenha um grafo NetworkX em um `Axes` com nível de detalhe."""
+
+    def __init__(
+        self,
+        ax,
+        G,
+        pos,
+        cor="skyblue",
+        ranking="degree",
+        top_k=30,
+        limite_rotulos=150,
+        limite_pesos=100,
+        limite_agregacao=3000,
+        celulas_agregacao=60,
+        ao_quadro=None
+    ):
+        """
+        :param pos: dicionário vértice -> (x, y), como o do networkx.
+        :param ranking: "degree" ou "pagerank"; define os top-k rotulados.
+        :param top_k: rótulos mostrados quando há muitos vértices visíveis.
+        :param limite_rotulos: até quantos vértices visíveis todos ganham rótulo.
+        :param limite_pesos: até quantas arestas visíveis os pesos aparecem.
+        :param limite_agregacao: acima de quantos vértices visíveis a
+            região é agregada em células.
+        :param celulas_agregacao: células por eixo no modo agregado.
+        :param ao_quadro: callback(segundos) chamado após cada quadro.
+        """
+        self.ax = ax
+        self.G = G
+        self.cor = cor
+        self.top_k = top_k
+        self.limite_rotulos = limite_rotulos
+        self.limite_pesos = limite_pesos
+        self.limite_agregacao = limite_agregacao
+        self.celulas_agregacao = celulas_agregacao
+        self.ao_quadro = ao_quadro
+
+        self.nos = list(G.nodes())
+        idx = {v: i for i, v in enumerate(self.nos)}
+        n = len(self.nos)
+        m = G.number_of_edges()
+
+        self.P = np.array([pos[v] for v in self.nos], dtype=float).reshape(n, 2)
+        self.src = np.fromiter((idx[u] for u, _ in G.edges()), dtype=np.int64, count=m)
+        self.dst = np.fromiter((idx[v] for _, v in G.edges()), dtype=np.int64, count=m)
+        self.pesos = np.fromiter(
+            (d.get("weight", 1) for _, _, d in G.edges(data=True)), dtype=float, count=m
+        )
+        self.grau = np.bincount(self.src, minlength=n) + np.bincount(self.dst, minlength=n)
+
+        # ordem de prioridade dos rótulos (maior primeiro), calculada uma vez
+        if ranking == "pagerank":
+            from Graph_LIB.Metrics import CentralityMetrics
+            pr = CentralityMetrics(G).pagerank()
+            score = np.array([pr.get(str(v), 0.0) for v in self.nos])
+        else:
+            score = self.grau.astype(float)
+        self.prioridade = np.argsort(-score, kind="stable")
+
+        self.tempos_quadro = deque(maxlen=200)
+        self._inicio_quadro = None
+        self._limites = None
+        self._textos = []
+        self._agregado = None
+
+        self._desenhar_base()
+
+    # ---------- desenho ----------
+
+    def _desenhar_base(self):
+        ax = self.ax
+        n = len(self.nos)
+
+        segmentos = np.stack([self.P[self.src], self.P[self.dst]], axis=1)
+        largura = 0.5 + np.log1p(self.pesos) / max(np.log1p(self.pesos).max(initial=1.0), 1e-9)
+        self.arestas = LineCollection(
+            segmentos, linewidths=largura, colors="#888888", alpha=0.6, zorder=1
+        )
+        ax.add_collection(self.arestas)
+
+        max_grau = max(int(self.grau.max(initial=0)), 1)
+        tamanhos = 20 + 280 * np.sqrt(self.grau / max_grau)
+        self.vertices = ax.scatter(
+            self.P[:, 0], self.P[:, 1], s=tamanhos, c=self.cor,
+            edgecolors="none", zorder=2
+        )
+
+        ax.add_artist(_Cronometro(self))
+        ax.set_axis_off()
+
+        if n:
+            minimo, maximo = self.P.min(axis=0), self.P.max(axis=0)
+            margem = np.maximum((maximo - minimo) * 0.05, 0.05)
+            ax.set_xlim(minimo[0] - margem[0], maximo[0] + margem[0])
+            ax.set_ylim(minimo[1] - margem[1], maximo[1] + margem[1])
+
+        self.atualizar()
+
+        ax.callbacks.connect("xlim_changed", self._ao_mudar_limites)
+        ax.callbacks.connect("ylim_changed", self._ao_mudar_limites)
+        ax.figure.canvas.mpl_connect("draw_event", self._ao_desenhar)
+
+    def _ao_mudar_limites(self, ax):
+        self.atualizar()
+
+    def atualizar(self):
+        """Recalcula rótulos e agregação para a área visível."""
+        limites = (self.ax.get_xlim(), self.ax.get_ylim())
+        if limites == self._limites:
+            return
+        self._limites = limites
+        (x0, x1), (y0, y1) = limites
+
+        for t in self._textos:
+            t.remove()
+        self._textos = []
+
+        if not len(self.nos):
+            return
+
+        visivel = (
+            (self.P[:, 0] >= min(x0, x1)) & (self.P[:, 0] <= max(x0, x1))
+            & (self.P[:, 1] >= min(y0, y1)) & (self.P[:, 1] <= max(y0, y1))
+        )
+        n_visiveis = int(visivel.sum())
+
+        # rótulos: todos os visíveis se forem poucos, senão só os top-k
+        if n_visiveis <= self.limite_rotulos:
+            rotulados = np.nonzero(visivel)[0]
+        else:
+            rotulados = self.prioridade[visivel[self.prioridade]][:self.top_k]
+
+        for i in rotulados:
+            self._textos.append(self.ax.text(
+                self.P[i, 0], self.P[i, 1], str(self.nos[i]),
+                fontsize=8, ha="center", va="center", zorder=3, clip_on=True
+            ))
+
+        if n_visiveis > self.limite_agregacao:
+            self._mostrar_agregado(visivel, limites)
+            return
+        self._esconder_agregado()
+
+        # pesos das arestas: só com poucas arestas na tela
+        arestas_visiveis = np.nonzero(visivel[self.src] & visivel[self.dst])[0]
+        if len(arestas_visiveis) <= self.limite_pesos:
+            meio = (self.P[self.src[arestas_visiveis]] + self.P[self.dst[arestas_visiveis]]) / 2
+            for (x, y), w in zip(meio, self.pesos[arestas_visiveis]):
+                self._textos.append(self.ax.text(
+                    x, y, f"{w:g}", fontsize=7, color="#444444",
+                    ha="center", va="center", zorder=3, clip_on=True,
+                    bbox={"boxstyle": "round,pad=0.1", "fc": "white", "ec": "none", "alpha": 0.7}
+                ))
+
+    def _mostrar_agregado(self, visivel, limites):
+        """Agrupa os vértices visíveis em células de uma grade."""
+        (x0, x1), (y0, y1) = limites
+        g = self.celulas_agregacao
+        ids = np.nonzero(visivel)[0]
+        fx = np.clip(((self.P[ids, 0] - min(x0, x1)) / abs(x1 - x0) * g).astype(np.int64), 0, g - 1)
+        fy = np.clip(((self.P[ids, 1] - min(y0, y1)) / abs(y1 - y0) * g).astype(np.int64), 0, g - 1)
+        celula = np.full(len(self.nos), -1, dtype=np.int64)
+        celula[ids] = fx * g + fy
+
+        ocupadas, inverso, contagem = np.unique(celula[ids], return_inverse=True, return_counts=True)
+        cx = np.bincount(inverso, weights=self.P[ids, 0]) / contagem
+        cy = np.bincount(inverso, weights=self.P[ids, 1]) / contagem
+
+        # arestas entre células (ambas as pontas visíveis)
+        cs, cd = celula[self.src], celula[self.dst]
+        ok = (cs >= 0) & (cd >= 0) & (cs != cd)
+        a, b = np.minimum(cs[ok], cd[ok]), np.maximum(cs[ok], cd[ok])
+        pares, qtd = np.unique(a * (g * g) + b, return_counts=True)
+        pa = np.searchsorted(ocupadas, pares // (g * g))
+        pb = np.searchsorted(ocupadas, pares % (g * g))
+        segmentos = np.stack([np.stack([cx[pa], cy[pa]], 1), np.stack([cx[pb], cy[pb]], 1)], axis=1)
+
+        self._esconder_agregado()
+        self.arestas.set_visible(False)
+        self.vertices.set_visible(False)
+        self._agregado = [
+            self.ax.add_collection(LineCollection(
+                segmentos, linewidths=0.3 + np.log1p(qtd), colors="#888888", alpha=0.4, zorder=1
+            )),
+            self.ax.scatter(
+                cx, cy, s=10 + 20 * np.sqrt(contagem), c=self.cor,
+                edgecolors="#555555", linewidths=0.3, zorder=2
+            )
+        ]
+
+    def _esconder_agregado(self):
+        if self._agregado is not None:
+            for artista in self._agregado:
+                artista.remove()
+            self._agregado = None
+        self.arestas.set_visible(True)
+        self.vertices.set_visible(True)
+
+    # ---------- medição ----------
+
+    def _ao_desenhar(self, event):
+        if self._inicio_quadro is None:
+            return
+        duracao = time.perf_counter() - self._inicio_quadro
+        self._inicio_quadro = None
+        self.tempos_quadro.append(duracao)
+        if self.ao_quadro is not None:
+            self.ao_quadro(duracao)
+
+    def estatisticas_quadros(self):
+        """Média, p95 e máximo (em ms) dos quadros medidos."""
+        if not self.tempos_quadro:
+            return {"quadros": 0, "media_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        tempos = np.array(self.tempos_quadro) * 1000.0
+        return {
+            "quadros": len(tempos),
+            "media_ms": float(tempos.mean()),
+            "p95_ms": float(np.percentile(tempos, 95)),
+            "max_ms": float(tempos.max())
+        }
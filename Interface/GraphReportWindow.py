@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk
 import networkx as nx
 from Graph_LIB.Metrics import CentralityMetrics  # importa sua classe de métricas
+from Interface.VirtualTable import TabelaVirtual, TreeviewVirtual
 from typing import Dict, Any, List, Tuple
 
 
@@ -9,12 +10,35 @@ from typing import Dict, Any, List, Tuple
 class GraphReportWindow:
     """
     Janela de relatório para um grafo NetworkX.
-    Mostra resumo básico + métricas de centralidade.
+    Mostra resumo básico + métricas de centralidade + número de núcleo
+    (k-core) de cada usuário.
+
+    Com um `scheduler` (TaskScheduler), as métricas são calculadas em
+    segundo plano e cada coluna é preenchida assim que fica pronta.
+
+    A tabela é virtualizada (TreeviewVirtual): só as linhas visíveis são
+    inseridas, então abrir a janela não depende do tamanho do grafo.
+    Clicar no cabeçalho ordena pela coluna; o campo de busca filtra por
+    prefixo do login.
     """
 
-    def __init__(self, parent, titulo: str, graph: nx.Graph):
+    # métrica -> coluna da tabela
+    COLUNAS_METRICAS = {
+        "degree": "grau",
+        "betweenness": "betweenness",
+        "closeness": "closeness",
+        "pagerank": "pagerank",
+        "core": "nucleo",
+    }
+
+    def __init__(self, parent, titulo: str, graph: nx.Graph, scheduler=None):
         self.parent = parent
         self.G = graph
+        self.titulo = titulo
+        self.scheduler = scheduler
+        self.tarefa = None
+        self.metricas: Dict[str, Dict[str, float]] = {}
+        self.modelo = None
 
         # DEBUG opcional (pode remover depois)
         print(
@@ -33,55 +57,28 @@ class GraphReportWindow:
         resumo_frame = ttk.LabelFrame(main_frame, text="Resumo do grafo")
         resumo_frame.pack(fill=tk.X)
 
-        n = self.G.number_of_nodes()
-        m = self.G.number_of_edges()
-        densidade = nx.density(self.G) if n > 1 else 0.0
-
-        # conexidade (só faz sentido pra Graph não vazio)
-        conectado = False
-        try:
-            if n > 0 and isinstance(self.G, nx.Graph):
-                conectado = nx.is_connected(self.G)
-        except nx.NetworkXError:
-            conectado = False
-
-        lbl_resumo = ttk.Label(
-            resumo_frame,
-            text=(
-                f"Vértices: {n}   "
-                f"Arestas: {m}   "
-                f"Densidade: {densidade:.4f}   "
-                f"Conexo: {'Sim' if conectado else 'Não'}"
-            )
-        )
-        lbl_resumo.pack(side=tk.LEFT, anchor="w", pady=5)
+        self.lbl_resumo = ttk.Label(resumo_frame, text=self._texto_resumo(None))
+        self.lbl_resumo.pack(side=tk.LEFT, anchor="w", pady=5)
 
         # ===== Métricas de centralidade =====
         metrics_frame = ttk.LabelFrame(main_frame, text="Métricas de centralidade")
         metrics_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
 
-        colunas = ("vertice", "grau", "betweenness", "closeness", "pagerank")
-        self.tree = ttk.Treeview(
-            metrics_frame,
-            columns=colunas,
-            show="headings",
-            height=15
-        )
-
-        headers = ["Vértice", "Grau", "Betweenness", "Closeness", "PageRank"]
-        for col, header in zip(colunas, headers):
-            self.tree.heading(col, text=header)
-            self.tree.column(col, anchor="center", width=120)
+        busca_frame = ttk.Frame(metrics_frame)
+        busca_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+        ttk.Label(busca_frame, text="Buscar login:").pack(side=tk.LEFT)
+        self.busca = tk.StringVar()
+        entrada_busca = ttk.Entry(busca_frame, textvariable=self.busca, width=30)
+        entrada_busca.pack(side=tk.LEFT, padx=5)
+        self.busca.trace_add("write", lambda *_: self.tabela.filtrar(self.busca.get()))
 
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        tabela_frame = ttk.Frame(metrics_frame)
+        tabela_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
-        scrollbar = ttk.Scrollbar(
-            metrics_frame,
-            orient="vertical",
-            command=self.tree.yview
-        )
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        colunas = ("vertice", "grau", "betweenness", "closeness", "pagerank", "nucleo")
+        headers = ["Vértice", "Grau", "Betweenness", "Closeness", "PageRank", "Núcleo (k-core)"]
+        self.tabela = TreeviewVirtual(tabela_frame, colunas, headers)
+        self.tree = self.tabela.tree
 
         # calcula métricas e preenche tabela
         self._popular_metricas()
@@ -95,38 +92,88 @@ class GraphReportWindow:
 
     # ----------------- lógica das métricas -----------------
 
+    def _texto_resumo(self, conectado):
+        n = self.G.number_of_nodes()
+        m = self.G.number_of_edges()
+        densidade = nx.density(self.G) if n > 1 else 0.0
+
+        if conectado is None:
+            texto_conexo = "…"
+        else:
+            texto_conexo = "Sim" if conectado else "Não"
+
+        return (
+            f"Vértices: {n}   "
+            f"Arestas: {m}   "
+            f"Densidade: {densidade:.4f}   "
+            f"Conexo: {texto_conexo}"
+        )
+
+    def _conectado(self):
+        # conexidade (só faz sentido pra Graph não vazio)
+        conectado = False
+        try:
+            if self.G.number_of_nodes() > 0 and isinstance(self.G, nx.Graph):
+                conectado = nx.is_connected(self.G)
+        except nx.NetworkXError:
+            conectado = False
+        return conectado
+
     def _popular_metricas(self):
         print(self)
         if self.G.number_of_nodes() == 0:
+            self.lbl_resumo.configure(text=self._texto_resumo(False))
             return
 
-        # usa CentralityMetrics para calcular tudo
         cm = CentralityMetrics(self.G)
-        all_metrics = cm.compute_all()
-
-        degree = all_metrics["degree"]
-        betweenness = all_metrics["betweenness"]
-        closeness = all_metrics["closeness"]
-        pagerank = all_metrics["pagerank"]
-
-        # vamos ordenar pela métrica de PageRank (decrescente)
-        nodes_sorted = sorted(
-            pagerank.items(),
-            key=lambda x: x[1],
-            reverse=True
+
+        if self.scheduler is None:
+            self._receber("conexo", self._conectado())
+            for nome, valores in cm.compute_iter():
+                self._receber(nome, valores)
+            self._receber("core", cm.core_number())
+            return
+
+        def calcular(tarefa):
+            tarefa.parcial("conexo", self._conectado())
+            total = len(self.COLUNAS_METRICAS)
+            for i, (nome, valores) in enumerate(cm.compute_iter()):
+                tarefa.parcial(nome, valores)
+                tarefa.progresso((i + 1) / total, f"{nome} concluída")
+            tarefa.parcial("core", cm.core_number())
+            tarefa.progresso(1.0, "núcleos concluídos")
+
+        self.tarefa = self.scheduler.submeter(
+            f"Métricas — {self.titulo}",
+            calcular,
+            ao_parcial=self._receber
         )
+        self.win.bind("<Destroy>", self._ao_fechar)
+
+    def _ao_fechar(self, event):
+        # fechar a janela cancela o cálculo pendente
+        if event.widget is self.win and self.tarefa is not None:
+            self.tarefa.cancelar()
+
+    def _receber(self, nome: str, valores):
+        if not self.win.winfo_exists():
+            return
+
+        if nome == "conexo":
+            self.lbl_resumo.configure(text=self._texto_resumo(valores))
+            return
 
-        for node, _ in nodes_sorted:
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    node,
-                    f"{degree.get(node, 0.0):.4f}",
-                    f"{betweenness.get(node, 0.0):.4f}",
-                    f"{closeness.get(node, 0.0):.4f}",
-                    f"{pagerank.get(node, 0.0):.4f}",
-                ),
-            )
+        self.metricas[nome] = valores
 
+        if self.modelo is None:
+            # rótulos vêm da primeira métrica (já traduzidos pelo CentralityMetrics);
+            # a tabela começa ordenada por PageRank (decrescente)
+            self.modelo = TabelaVirtual(list(valores))
+            self.modelo.ordenar("pagerank", True)
+            self.tabela.modelo = self.modelo
 
+        # número de núcleo é inteiro
+        formato = ".0f" if nome == "core" else ".4f"
+        self.modelo.definir_coluna(self.COLUNAS_METRICAS[nome], valores, formato)
+        # só as linhas já carregadas são redesenhadas
+        self.tabela.recarregar()
@@ -0,0 +1,410 @@
+"""Motor de layout para o visualizador de grafos.
+
+Substitui o `nx.spring_layout` (O(V²) por iteração) por uma
+implementação vetorizada em NumPy do ForceAtlas2:
+  - repulsão exata em blocos para grafos pequenos;
+  - aproximação Barnes-Hut para grafos grandes, sobre uma hierarquia
+    de grades (vizinhança próxima calculada de forma exata, células
+    distantes agrupadas no centro de massa);
+  - modo multinível, que contrai o grafo por emparelhamento de arestas
+    pesadas, posiciona o grafo mais grosso e refina nível a nível.
+
+Os layouts são guardados em cache pela impressão digital do grafo em
+um arquivo ao lado do dataset, e o último layout de cada grafo é usado
+como posição inicial quando o grafo muda pouco.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from Graph_LIB.Profiler import instrumentar
+
+
+# acima deste número de vértices a repulsão exata fica cara demais
+LIMITE_REPULSAO_EXATA = 500
+# acima deste número de vértices o modo "auto" usa o multinível
+LIMITE_MULTINIVEL = 5000
+
+
+def fingerprint_grafo(G) -> str:
+    """Impressão digital (SHA-1) dos vértices, arestas e pesos do grafo."""
+    h = hashlib.sha1()
+    for v in sorted(map(str, G.nodes())):
+        h.update(v.encode("utf-8"))
+        h.update(b"\0")
+    h.update(b"\1")
+
+    direcionado = G.is_directed()
+    arestas = []
+    for u, v, d in G.edges(data=True):
+        su, sv = str(u), str(v)
+        if not direcionado and sv < su:
+            su, sv = sv, su
+        arestas.append((su, sv, d.get("weight", 1)))
+    for su, sv, w in sorted(arestas):
+        h.update(f"{su}\0{sv}\0{w}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------
+# Cache de layouts
+# ---------------------------------------------------------------------
+
+class LayoutCache:
+    """Cache de layouts persistido em JSON.
+
+    Estrutura do arquivo:
+      - "layouts": fingerprint -> {"nos": [...], "pos": [[x, y], ...]}
+      - "ultimo":  chave do grafo (ex.: título) -> fingerprint mais recente
+    """
+
+    VERSAO = 1
+
+    def __init__(self, caminho: Optional[str] = None):
+        self.caminho = caminho
+        # layouts podem ser calculados em threads de trabalho
+        self._lock = threading.Lock()
+        self.layouts: Dict[str, Dict[str, Any]] = {}
+        self.ultimo: Dict[str, str] = {}
+
+        if caminho and os.path.exists(caminho):
+            with open(caminho, "r") as f:
+                dados = json.load(f)
+            if dados.get("versao") == self.VERSAO:
+                self.layouts = dados.get("layouts", {})
+                self.ultimo = dados.get("ultimo", {})
+
+    @classmethod
+    def para_dataset(cls, caminho_dataset: str) -> "LayoutCache":
+        """Cria o cache ao lado do dataset (ex.: dados_github.layout.json)."""
+        base, _ = os.path.splitext(caminho_dataset)
+        return cls(base + ".layout.json")
+
+    def obter(self, fingerprint: str) -> Optional[Dict[str, np.ndarray]]:
+        """Retorna o layout de um fingerprint, se existir."""
+        entrada = self.layouts.get(fingerprint)
+        if entrada is None:
+            return None
+        return {v: np.array(p) for v, p in zip(entrada["nos"], entrada["pos"])}
+
+    def anterior(self, chave: str) -> Optional[Dict[str, np.ndarray]]:
+        """Retorna o último layout salvo para a chave (posições iniciais)."""
+        fp = self.ultimo.get(chave)
+        return self.obter(fp) if fp else None
+
+    def salvar(self, fingerprint: str, pos: Dict[Any, np.ndarray], chave: Optional[str] = None):
+        """Guarda um layout e grava o arquivo (se houver caminho)."""
+        nos = list(pos)
+        entrada = {
+            "nos": [str(v) for v in nos],
+            "pos": [[float(pos[v][0]), float(pos[v][1])] for v in nos]
+        }
+
+        with self._lock:
+            self.layouts[fingerprint] = entrada
+
+            if chave is not None:
+                antigo = self.ultimo.get(chave)
+                self.ultimo[chave] = fingerprint
+                # descarta a versão anterior se nenhuma outra chave a usa
+                if antigo and antigo != fingerprint and antigo not in self.ultimo.values():
+                    self.layouts.pop(antigo, None)
+
+            if self.caminho:
+                with open(self.caminho, "w") as f:
+                    json.dump(
+                        {"versao": self.VERSAO, "layouts": self.layouts, "ultimo": self.ultimo},
+                        f,
+                        separators=(",", ":")
+                    )
+
+
+# ---------------------------------------------------------------------
+# ForceAtlas2 vetorizado
+# ---------------------------------------------------------------------
+
+def _repulsao_exata(pos, massa, kr, bloco=512):
+    """Repulsão de todos contra todos, em blocos de linhas."""
+    n = len(pos)
+    F = np.zeros_like(pos)
+    for ini in range(0, n, bloco):
+        fim = min(ini + bloco, n)
+        diff = pos[ini:fim, None, :] - pos[None, :, :]
+        d2 = np.einsum("ijk,ijk->ij", diff, diff)
+        d2[np.arange(fim - ini), np.arange(ini, fim)] = np.inf
+        np.maximum(d2, 1e-9, out=d2)
+        fator = kr * massa[ini:fim, None] * massa[None, :] / d2
+        F[ini:fim] = np.einsum("ij,ijk->ik", fator, diff)
+    return F
+
+
+def _repulsao_barnes_hut(pos, massa, kr, bloco=16384):
+    """Aproximação Barnes-Hut sobre uma hierarquia de grades (quadtree).
+
+    Em cada nível, o vértice interage com o centro de massa das células
+    filhas da vizinhança da sua célula-pai que não são vizinhas da sua
+    própria célula (no máximo 27 por nível). No nível mais fino, os
+    pares dentro da vizinhança 3x3 são calculados exatamente. O custo
+    fica em O(V log V) por iteração.
+    """
+    n = len(pos)
+    minimo = pos.min(axis=0)
+    lado = max(float((pos.max(axis=0) - minimo).max()), 1e-9) * (1.0 + 1e-9)
+    unit = (pos - minimo) / lado
+    nivel_max = max(2, int(np.ceil(np.log2(np.sqrt(n / 4.0)))))
+    offsets = np.arange(-2, 4)
+
+    F = np.zeros_like(pos)
+
+    # campo distante, nível a nível
+    for nivel in range(2, nivel_max + 1):
+        g = 1 << nivel
+        cel = np.minimum((unit * g).astype(np.int64), g - 1)
+        cid = cel[:, 0] * g + cel[:, 1]
+        massa_cel = np.bincount(cid, weights=massa, minlength=g * g)
+        ocupada = massa_cel > 0
+        cx = np.bincount(cid, weights=massa * pos[:, 0], minlength=g * g)
+        cy = np.bincount(cid, weights=massa * pos[:, 1], minlength=g * g)
+        cx[ocupada] /= massa_cel[ocupada]
+        cy[ocupada] /= massa_cel[ocupada]
+
+        # a lista de interação depende só da célula: monta uma vez por célula
+        todas = np.arange(g * g)
+        tx, ty = todas // g, todas % g
+        X = np.repeat((tx // 2 * 2)[:, None] + offsets[None, :], 6, axis=1)
+        Y = np.tile((ty // 2 * 2)[:, None] + offsets[None, :], (1, 6))
+        sel = (
+            (X >= 0) & (X < g) & (Y >= 0) & (Y < g)
+            & ((np.abs(X - tx[:, None]) > 1) | (np.abs(Y - ty[:, None]) > 1))
+        )
+        lista_ids = np.where(sel, X * g + Y, 0)
+        lista_massa = np.where(sel, massa_cel[lista_ids], 0.0)
+
+        for ini in range(0, n, bloco):
+            fim = min(ini + bloco, n)
+            ids = lista_ids[cid[ini:fim]]
+            dx = pos[ini:fim, 0, None] - cx[ids]
+            dy = pos[ini:fim, 1, None] - cy[ids]
+            f = lista_massa[cid[ini:fim]] / np.maximum(dx * dx + dy * dy, 1e-9)
+            f *= kr * massa[ini:fim, None]
+            F[ini:fim, 0] += (f * dx).sum(axis=1)
+            F[ini:fim, 1] += (f * dy).sum(axis=1)
+
+    # campo próximo: pares exatos na vizinhança 3x3 do nível mais fino
+    ordem = np.argsort(cid, kind="stable")
+    inicio = np.searchsorted(cid[ordem], np.arange(g * g + 1))
+    contagem = np.diff(inicio)
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            vx, vy = cel[:, 0] + ox, cel[:, 1] + oy
+            ok = (vx >= 0) & (vx < g) & (vy >= 0) & (vy < g)
+            origem = np.nonzero(ok)[0]
+            alvo = vx[ok] * g + vy[ok]
+            k = contagem[alvo]
+            total = int(k.sum())
+            if total == 0:
+                continue
+            ii = np.repeat(origem, k)
+            desloc = np.repeat(np.cumsum(k) - k, k)
+            jj = ordem[np.repeat(inicio[alvo], k) + np.arange(total) - desloc]
+            outro = ii != jj
+            ii, jj = ii[outro], jj[outro]
+            dx = pos[ii, 0] - pos[jj, 0]
+            dy = pos[ii, 1] - pos[jj, 1]
+            f = kr * massa[ii] * massa[jj] / np.maximum(dx * dx + dy * dy, 1e-9)
+            F[:, 0] += np.bincount(ii, weights=f * dx, minlength=n)
+            F[:, 1] += np.bincount(ii, weights=f * dy, minlength=n)
+
+    return F
+
+
+def _forceatlas2(pos, src, dst, w, massa, iteracoes, kr=1.0, kg=1.0, tolerancia=1.0):
+    """Iterações do ForceAtlas2 com velocidade adaptativa (swing/traction)."""
+    n = len(pos)
+    repulsao = _repulsao_exata if n <= LIMITE_REPULSAO_EXATA else _repulsao_barnes_hut
+
+    forca_ant = np.zeros_like(pos)
+    velocidade = 1.0
+
+    for _ in range(iteracoes):
+        F = repulsao(pos, massa, kr)
+
+        # atração linear ao longo das arestas, ponderada pelo peso
+        delta = (pos[src] - pos[dst]) * w[:, None]
+        for eixo in range(2):
+            F[:, eixo] += np.bincount(dst, weights=delta[:, eixo], minlength=n)
+            F[:, eixo] -= np.bincount(src, weights=delta[:, eixo], minlength=n)
+
+        # gravidade em direção à origem (evita componentes à deriva)
+        dist = np.maximum(np.linalg.norm(pos, axis=1), 1e-9)
+        F -= (kg * massa / dist)[:, None] * pos
+
+        # velocidade global adaptativa
+        swing = np.linalg.norm(F - forca_ant, axis=1)
+        tracao = np.linalg.norm(F + forca_ant, axis=1) / 2.0
+        swing_global = float(np.dot(massa, swing))
+        tracao_global = float(np.dot(massa, tracao))
+        if swing_global > 0:
+            velocidade = min(tolerancia * tracao_global / swing_global, 1.5 * velocidade)
+
+        fator = velocidade / (1.0 + velocidade * np.sqrt(swing))
+        # limita o deslocamento máximo por iteração
+        norma = np.maximum(np.linalg.norm(F, axis=1), 1e-9)
+        fator = np.minimum(fator, 10.0 / norma)
+
+        pos = pos + F * fator[:, None]
+        forca_ant = F
+
+    return pos
+
+
+# ---------------------------------------------------------------------
+# Multinível
+# ---------------------------------------------------------------------
+
+def _contrair(n, src, dst, w, massa):
+    """Emparelhamento guloso por arestas pesadas.
+
+    Retorna (pai, n_grosso, src, dst, w, massa) do grafo contraído.
+    """
+    pai = np.full(n, -1, dtype=np.int64)
+    proximo = 0
+    for e in np.argsort(-w, kind="stable"):
+        u, v = int(src[e]), int(dst[e])
+        if u != v and pai[u] < 0 and pai[v] < 0:
+            pai[u] = pai[v] = proximo
+            proximo += 1
+
+    sozinhos = pai < 0
+    pai[sozinhos] = np.arange(proximo, proximo + int(sozinhos.sum()))
+    n_grosso = proximo + int(sozinhos.sum())
+
+    gs, gd = pai[src], pai[dst]
+    laco = gs == gd
+    gs, gd, gw = gs[~laco], gd[~laco], w[~laco]
+    a, b = np.minimum(gs, gd), np.maximum(gs, gd)
+    chaves, inverso = np.unique(a * n_grosso + b, return_inverse=True)
+    gw = np.bincount(inverso, weights=gw)
+
+    massa_grossa = np.bincount(pai, weights=massa, minlength=n_grosso)
+    return pai, n_grosso, chaves // n_grosso, chaves % n_grosso, gw, massa_grossa
+
+
+def _multinivel(n, src, dst, w, massa, iteracoes, rng, min_vertices=200):
+    """Layout multinível: contrai, posiciona o nível grosso e refina."""
+    niveis = []
+    atual = (n, src, dst, w, massa)
+    while atual[0] > min_vertices:
+        pai, ng, gs, gd, gw, gm = _contrair(*atual)
+        if ng > 0.9 * atual[0]:
+            break  # contração não progride mais
+        niveis.append((atual, pai))
+        atual = (ng, gs, gd, gw, gm)
+
+    ng, gs, gd, gw, gm = atual
+    pos = rng.uniform(-1, 1, size=(ng, 2)) * np.sqrt(ng)
+    pos = _forceatlas2(pos, gs, gd, gw, gm, iteracoes)
+
+    # prolonga: cada vértice nasce na posição do pai, com pequena perturbação
+    for (fino, pai) in reversed(niveis):
+        nf, fs, fd, fw, fm = fino
+        pos = pos[pai] + rng.normal(scale=0.1, size=(nf, 2))
+        pos = _forceatlas2(pos, fs, fd, fw, fm, max(iteracoes // 5, 10))
+
+    return pos
+
+
+# ---------------------------------------------------------------------
+# API pública
+# ---------------------------------------------------------------------
+
+def _normalizar(pos):
+    """Centraliza e escala para [-1, 1], como o spring_layout."""
+    pos = pos - pos.mean(axis=0)
+    escala = np.abs(pos).max()
+    return pos / escala if escala > 0 else pos
+
+
+@instrumentar(itens=len)
+def calcular_layout(
+    G,
+    cache: Optional[LayoutCache] = None,
+    chave: Optional[str] = None,
+    modo: str = "auto",
+    iteracoes: int = 100,
+    seed: int = 42
+) -> Dict[Any, np.ndarray]:
+    """
+    Calcula (ou recupera do cache) as posições dos vértices de G.
+
+    :param cache: cache de layouts; None desativa o cache.
+    :param chave: identifica o grafo entre execuções (ex.: título da
+        janela). Se o grafo mudou, o último layout dessa chave é usado
+        como posição inicial e o refinamento é mais curto.
+    :param modo: "auto", "forceatlas2", "multinivel" ou "spring"
+        (nx.spring_layout, mantido como referência).
+    :return: dicionário vértice -> array [x, y], como o networkx.
+    """
+    fp = None
+    if cache is not None:
+        fp = fingerprint_grafo(G)
+        pronto = cache.obter(fp)
+        if pronto is not None and len(pronto) == G.number_of_nodes():
+            return {v: pronto[str(v)] for v in G.nodes()}
+
+    nos = list(G.nodes())
+    n = len(nos)
+    if n == 0:
+        return {}
+
+    if modo == "spring":
+        import networkx as nx
+        pos_dict = nx.spring_layout(G, seed=seed)
+    else:
+        idx = {v: i for i, v in enumerate(nos)}
+        m = G.number_of_edges()
+        src = np.fromiter((idx[u] for u, _ in G.edges()), dtype=np.int64, count=m)
+        dst = np.fromiter((idx[v] for _, v in G.edges()), dtype=np.int64, count=m)
+        w = np.fromiter((d.get("weight", 1) for _, _, d in G.edges(data=True)), dtype=float, count=m)
+        massa = 1.0 + np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+
+        rng = np.random.default_rng(seed)
+        anterior = cache.anterior(chave) if cache is not None and chave else None
+
+        if anterior:
+            # warm start: reaproveita posições antigas; vértices novos
+            # nascem na média dos vizinhos já posicionados
+            escala = np.sqrt(n)
+            pos = rng.uniform(-1, 1, size=(n, 2)) * escala
+            conhecido = np.zeros(n, dtype=bool)
+            for v, i in idx.items():
+                p = anterior.get(str(v))
+                if p is not None:
+                    pos[i] = p * escala
+                    conhecido[i] = True
+            for v, i in idx.items():
+                if conhecido[i]:
+                    continue
+                viz = [idx[u] for u in G.neighbors(v) if conhecido[idx[u]]]
+                if viz:
+                    pos[i] = pos[viz].mean(axis=0) + rng.normal(scale=0.1, size=2)
+            pos = _forceatlas2(pos, src, dst, w, massa, max(iteracoes // 4, 10))
+        elif modo == "multinivel" or (modo == "auto" and n > LIMITE_MULTINIVEL):
+            pos = _multinivel(n, src, dst, w, massa, iteracoes, rng)
+        elif modo in ("auto", "forceatlas2"):
+            pos = rng.uniform(-1, 1, size=(n, 2)) * np.sqrt(n)
+            pos = _forceatlas2(pos, src, dst, w, massa, iteracoes)
+        else:
+            raise ValueError(f"Modo de layout desconhecido: {modo}")
+
+        pos = _normalizar(pos)
+        pos_dict = {v: pos[i] for v, i in idx.items()}
+
+    if cache is not None:
+        cache.salvar(fp, pos_dict, chave)
+    return pos_dict
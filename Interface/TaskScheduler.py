@@ -0,0 +1,222 @@
+"""Execução de tarefas pesadas fora da thread do Tk.
+
+O `TaskScheduler` roda funções em um pool de threads de trabalho e
+entrega progresso, resultados parciais e o resultado final de volta à
+thread principal por uma fila consultada com `root.after`, então os
+callbacks podem mexer em widgets livremente.
+
+A função da tarefa recebe o objeto `Tarefa` e usa:
+  - `tarefa.progresso(fracao, texto)` para atualizar a barra;
+  - `tarefa.parcial(chave, valor)` para enviar resultados à medida que
+    ficam prontos;
+  - `tarefa.verificar()` para encerrar cedo se o usuário cancelou.
+
+O cancelamento é cooperativo: ele vale na próxima chamada a um desses
+métodos. Um algoritmo do networkx já em andamento roda até o fim.
+"""
+
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+
+class TarefaCancelada(Exception):
+    """Levantada dentro da tarefa quando o usuário pede o cancelamento."""
+
+
+class Tarefa:
+    """Uma unidade de trabalho submetida ao `TaskScheduler`."""
+
+    def __init__(self, nome, funcao, fila, ao_parcial=None, ao_concluir=None, ao_erro=None):
+        self.nome = nome
+        self.funcao = funcao
+        self.ao_parcial = ao_parcial
+        self.ao_concluir = ao_concluir
+        self.ao_erro = ao_erro
+        self.estado = "pendente"  # pendente, executando, concluida, cancelada, erro
+        self.janela = None
+
+        self._fila = fila
+        self._cancelar = threading.Event()
+
+    # ---------- lado da interface ----------
+
+    def cancelar(self):
+        """Pede o cancelamento da tarefa."""
+        self._cancelar.set()
+
+    @property
+    def cancelada(self):
+        return self._cancelar.is_set()
+
+    # ---------- lado da thread de trabalho ----------
+
+    def verificar(self):
+        """Levanta `TarefaCancelada` se o cancelamento foi pedido."""
+        if self._cancelar.is_set():
+            raise TarefaCancelada()
+
+    def progresso(self, fracao=None, texto=""):
+        """Informa o progresso (0.0 a 1.0, ou None se indeterminado)."""
+        self.verificar()
+        self._fila.put((self, "progresso", (fracao, texto)))
+
+    def parcial(self, chave, valor):
+        """Envia um resultado parcial para `ao_parcial(chave, valor)`."""
+        self.verificar()
+        self._fila.put((self, "parcial", (chave, valor)))
+
+
+class JanelaProgresso:
+    """Janela pequena com barra de progresso e botão de cancelar."""
+
+    def __init__(self, parent, titulo, ao_cancelar):
+        self.win = tk.Toplevel(parent)
+        self.win.title(titulo)
+        self.win.geometry("380x110")
+        self.win.transient(parent)
+        self.win.protocol("WM_DELETE_WINDOW", ao_cancelar)
+
+        frame = ttk.Frame(self.win, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.lbl = ttk.Label(frame, text=titulo)
+        self.lbl.pack(side=tk.TOP, anchor="w")
+
+        self.barra = ttk.Progressbar(frame, mode="indeterminate", maximum=1.0)
+        self.barra.pack(side=tk.TOP, fill=tk.X, pady=8)
+        self.barra.start(15)
+
+        self.btn = ttk.Button(frame, text="Cancelar", command=ao_cancelar)
+        self.btn.pack(side=tk.RIGHT)
+
+    def atualizar(self, fracao, texto):
+        if texto:
+            self.lbl.configure(text=texto)
+        if fracao is None:
+            return
+        if str(self.barra.cget("mode")) != "determinate":
+            self.barra.stop()
+            self.barra.configure(mode="determinate")
+        self.barra.configure(value=fracao)
+
+    def cancelando(self):
+        self.lbl.configure(text="Cancelando...")
+        self.btn.configure(state=tk.DISABLED)
+
+    def fechar(self):
+        if self.win.winfo_exists():
+            self.win.destroy()
+
+
+class TaskScheduler:
+    """Pool de threads de trabalho integrado ao loop do Tk."""
+
+    def __init__(self, root, max_workers=2, intervalo_ms=50):
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tarefa")
+        self._fila = queue.Queue()
+        self._ativas = set()
+        self._agendado = False
+
+    def submeter(
+        self,
+        nome,
+        funcao,
+        ao_parcial=None,
+        ao_concluir=None,
+        ao_erro=None,
+        mostrar_progresso=True
+    ) -> Tarefa:
+        """
+        Agenda `funcao(tarefa)` em uma thread de trabalho.
+
+        :param ao_parcial: callback(chave, valor) na thread do Tk.
+        :param ao_concluir: callback(resultado) na thread do Tk.
+        :param ao_erro: callback(exc) na thread do Tk; padrão mostra um
+            messagebox com o erro.
+        :param mostrar_progresso: abre a janela de progresso/cancelamento.
+        """
+        tarefa = Tarefa(nome, funcao, self._fila, ao_parcial, ao_concluir, ao_erro)
+
+        if mostrar_progresso:
+            def cancelar():
+                tarefa.cancelar()
+                tarefa.janela.cancelando()
+            tarefa.janela = JanelaProgresso(self.root, nome, cancelar)
+
+        self._ativas.add(tarefa)
+        self._pool.submit(self._executar, tarefa)
+        self._agendar()
+        return tarefa
+
+    def cancelar_todas(self):
+        for tarefa in list(self._ativas):
+            tarefa.cancelar()
+
+    # ---------- thread de trabalho ----------
+
+    def _executar(self, tarefa):
+        try:
+            tarefa.verificar()
+            tarefa.estado = "executando"
+            resultado = tarefa.funcao(tarefa)
+            tarefa.verificar()
+            self._fila.put((tarefa, "concluida", resultado))
+        except TarefaCancelada:
+            self._fila.put((tarefa, "cancelada", None))
+        except Exception as e:
+            traceback.print_exc()
+            self._fila.put((tarefa, "erro", e))
+
+    # ---------- thread do Tk ----------
+
+    def _agendar(self):
+        if not self._agendado:
+            self._agendado = True
+            self.root.after(self.intervalo_ms, self._processar_fila)
+
+    def _processar_fila(self):
+        self._agendado = False
+        while True:
+            try:
+                tarefa, tipo, valor = self._fila.get_nowait()
+            except queue.Empty:
+                break
+
+            # mensagens atrasadas de tarefas canceladas são descartadas
+            if tarefa.cancelada and tipo in ("progresso", "parcial", "concluida"):
+                tipo = "cancelada" if tipo == "concluida" else None
+            if tipo is None:
+                continue
+
+            if tipo == "progresso":
+                if tarefa.janela is not None:
+                    tarefa.janela.atualizar(*valor)
+                continue
+
+            if tipo == "parcial":
+                if tarefa.ao_parcial is not None:
+                    tarefa.ao_parcial(*valor)
+                continue
+
+            # estados finais
+            tarefa.estado = tipo
+            self._ativas.discard(tarefa)
+            if tarefa.janela is not None:
+                tarefa.janela.fechar()
+
+            if tipo == "concluida" and tarefa.ao_concluir is not None:
+                tarefa.ao_concluir(valor)
+            elif tipo == "erro":
+                if tarefa.ao_erro is not None:
+                    tarefa.ao_erro(valor)
+                else:
+                    messagebox.showerror("Erro", f"Falha em '{tarefa.nome}':\n{valor}")
+
+        if self._ativas:
+            self._agendar()
@@ -0,0 +1,212 @@
+"""Tabela virtualizada para métricas por vértice.
+
+Inserir uma linha por vértice em um `ttk.Treeview` custa tempo e
+memória proporcionais ao grafo inteiro. Aqui o modelo (`TabelaVirtual`)
+guarda as colunas como vetores NumPy e a visão (`TreeviewVirtual`) só
+materializa as linhas que cabem na tela, carregando mais páginas
+conforme o usuário rola.
+
+A ordenação por qualquer coluna usa índices de `argsort` calculados uma
+vez por coluna (e reaproveitados), e a busca por prefixo de login usa
+busca binária sobre os rótulos ordenados.
+"""
+
+from bisect import bisect_left
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class TabelaVirtual:
+    """Modelo da tabela: rótulos dos vértices + colunas numéricas."""
+
+    def __init__(self, rotulos: List[str], coluna_rotulo: str = "vertice",
+                 chaves_rotulo: Optional[Sequence[float]] = None):
+        """
+        :param rotulos: texto da primeira coluna, um por linha.
+        :param coluna_rotulo: id da coluna dos rótulos (ordenada alfabeticamente).
+        :param chaves_rotulo: chave numérica de cada rótulo para ordenar a
+            coluna dos rótulos no lugar da ordem alfabética (ex.: o número
+            da comunidade, para "Comunidade 2" vir antes de "Comunidade 10").
+        """
+        self.rotulos = list(rotulos)
+        self.coluna_rotulo = coluna_rotulo
+        self.chaves_rotulo = None if chaves_rotulo is None else np.asarray(chaves_rotulo)
+        self._indice = {r: i for i, r in enumerate(self.rotulos)}
+        self.colunas: Dict[str, np.ndarray] = {}
+        self.formatos: Dict[str, str] = {}
+        self._ordens: Dict[tuple, np.ndarray] = {}
+        self._busca = None  # (ordem por rótulo, chaves em minúsculas)
+
+        self.ordem_coluna: Optional[str] = None
+        self.decrescente = True
+        self.prefixo = ""
+        self._visao: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return len(self.visao())
+
+    def indice_de(self, rotulo: str) -> int:
+        """Posição original da linha com esse rótulo."""
+        return self._indice[rotulo]
+
+    def definir_coluna(self, nome: str, valores: Dict[str, float], formato: str = ".4f"):
+        """Preenche uma coluna; vértices sem valor ficam como pendentes (NaN)."""
+        self.formatos[nome] = formato
+        coluna = np.full(len(self.rotulos), np.nan)
+        for rotulo, valor in valores.items():
+            i = self._indice.get(rotulo)
+            if i is not None:
+                coluna[i] = valor
+        self.colunas[nome] = coluna
+
+        # invalida apenas as ordens que dependem desta coluna
+        self._ordens.pop((nome, False), None)
+        self._ordens.pop((nome, True), None)
+        if self.ordem_coluna == nome:
+            self._visao = None
+
+    def _ordem(self, coluna: Optional[str], decrescente: bool) -> np.ndarray:
+        chave = (coluna, decrescente)
+        ordem = self._ordens.get(chave)
+        if ordem is not None:
+            return ordem
+
+        if coluna == self.coluna_rotulo:
+            if self.chaves_rotulo is not None:
+                ordem = np.argsort(self.chaves_rotulo, kind="stable")
+            else:
+                ordem = self._ordem_rotulos()
+            if decrescente:
+                ordem = ordem[::-1]
+        elif coluna is None or coluna not in self.colunas:
+            ordem = np.arange(len(self.rotulos))
+        else:
+            valores = self.colunas[coluna]
+            # NaN (pendente) vai para o fim nos dois sentidos
+            ordem = np.argsort(-valores if decrescente else valores, kind="stable")
+
+        self._ordens[chave] = ordem
+        return ordem
+
+    def _ordem_rotulos(self) -> np.ndarray:
+        if self._busca is None:
+            chaves = [r.lower() for r in self.rotulos]
+            ordem = sorted(range(len(chaves)), key=chaves.__getitem__)
+            self._busca = (np.array(ordem, dtype=np.int64), [chaves[i] for i in ordem])
+        return self._busca[0]
+
+    def ordenar(self, coluna: str, decrescente: bool):
+        self.ordem_coluna = coluna
+        self.decrescente = decrescente
+        self._visao = None
+
+    def filtrar(self, prefixo: str):
+        self.prefixo = prefixo.lower()
+        self._visao = None
+
+    def visao(self) -> np.ndarray:
+        """Índices das linhas na ordem atual, já filtrados pelo prefixo."""
+        if self._visao is not None:
+            return self._visao
+
+        ordem = self._ordem(self.ordem_coluna, self.decrescente)
+
+        if self.prefixo:
+            ordem_rotulos = self._ordem_rotulos()
+            chaves = self._busca[1]
+            ini = bisect_left(chaves, self.prefixo)
+            fim = bisect_left(chaves, self.prefixo + "\uffff")
+            marcados = np.zeros(len(self.rotulos), dtype=bool)
+            marcados[ordem_rotulos[ini:fim]] = True
+            ordem = ordem[marcados[ordem]]
+
+        self._visao = ordem
+        return ordem
+
+    def linha(self, i: int, colunas: List[str]) -> tuple:
+        valores = [self.rotulos[i]]
+        for nome in colunas:
+            coluna = self.colunas.get(nome)
+            v = np.nan if coluna is None else coluna[i]
+            valores.append("…" if np.isnan(v) else format(v, self.formatos.get(nome, ".4f")))
+        return tuple(valores)
+
+
+class TreeviewVirtual:
+    """`ttk.Treeview` que materializa só as páginas de linhas já vistas."""
+
+    def __init__(self, parent, colunas, headers, modelo: Optional[TabelaVirtual] = None, pagina=100):
+        """
+        :param colunas: ids das colunas; a primeira é a dos rótulos.
+        :param headers: títulos exibidos; clicar ordena pela coluna.
+        :param pagina: linhas carregadas por vez ao rolar.
+        """
+        self.colunas = list(colunas)
+        self.modelo = modelo
+        self.pagina = pagina
+        self.carregadas = 0
+
+        self.tree = ttk.Treeview(parent, columns=self.colunas, show="headings", height=15)
+        for col, header in zip(self.colunas, headers):
+            self.tree.heading(col, text=header, command=lambda c=col: self.ordenar(c))
+            self.tree.column(col, anchor="center", width=120)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._ao_rolar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def definir_modelo(self, modelo: TabelaVirtual):
+        self.modelo = modelo
+        self.recarregar()
+
+    def _ao_rolar(self, primeiro, ultimo):
+        self.scrollbar.set(primeiro, ultimo)
+        # perto do fim da parte carregada: carrega a próxima página
+        if float(ultimo) > 0.95 and self.modelo is not None and self.carregadas < len(self.modelo):
+            self.tree.after_idle(self._carregar_pagina)
+
+    def _carregar_pagina(self):
+        visao = self.modelo.visao()
+        fim = min(self.carregadas + self.pagina, len(visao))
+        for i in visao[self.carregadas:fim]:
+            self.tree.insert("", tk.END, values=self.modelo.linha(int(i), self.colunas[1:]))
+        self.carregadas = fim
+
+    def recarregar(self, manter=True):
+        """Redesenha as linhas carregadas (ex.: nova coluna ou nova ordem).
+
+        :param manter: mantém a quantidade de linhas já carregadas; caso
+            contrário volta para a primeira página.
+        """
+        quantidade = max(self.carregadas, self.pagina) if manter else self.pagina
+        self.tree.delete(*self.tree.get_children())
+        self.carregadas = 0
+        if self.modelo is None:
+            return
+        visao = self.modelo.visao()
+        fim = min(quantidade, len(visao))
+        for i in visao[:fim]:
+            self.tree.insert("", tk.END, values=self.modelo.linha(int(i), self.colunas[1:]))
+        self.carregadas = fim
+
+    def ordenar(self, coluna):
+        if self.modelo is None:
+            return
+        # clicar de novo na mesma coluna inverte o sentido
+        if self.modelo.ordem_coluna == coluna:
+            decrescente = not self.modelo.decrescente
+        else:
+            decrescente = coluna != self.colunas[0]
+        self.modelo.ordenar(coluna, decrescente)
+        self.recarregar(manter=False)
+        self.tree.yview_moveto(0)
+
+    def filtrar(self, prefixo):
+        if self.modelo is None:
+            return
+        self.modelo.filtrar(prefixo)
+        self.recarregar(manter=False)
@@ -1,20 +1,75 @@
+import importlib
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from Interface.GraphReportWindow import GraphReportWindow
-from Interface.GlobalReportWindow import GlobalReportWindow  # <<< adiciona isso
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import networkx as nx
-from Interface.GraphReportWindow import GraphReportWindow
-from Metrics.CommunityMetricsWindow import CommunityMetricsWindow
+# só módulos leves no topo: matplotlib, networkx, numpy e as janelas de
+# relatório são importados no primeiro uso (ou aquecidos em segundo plano)
+from Interface.TaskScheduler import TaskScheduler
+from Interface.DiagnosticsWindow import DiagnosticsWindow
+from Graph_LIB.Profiler import Profiler, etapa
+
+# importados em segundo plano depois que o menu aparece
+MODULOS_PESADOS = [
+    "networkx",
+    "numpy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_tkagg",
+    "Graph_LIB.Metrics",
+    "Interface.LayoutEngine",
+    "Interface.GraphRenderer",
+    "Interface.GraphReportWindow",
+    "Interface.GlobalReportWindow",
+    "Metrics.CommunityMetricsWindow",
+]
+
+
+def aquecer_modulos(modulos=MODULOS_PESADOS):
+    """Importa os módulos pesados; erros ficam para o uso de verdade."""
+    for nome in modulos:
+        try:
+            importlib.import_module(nome)
+        except Exception:
+            pass
 
 
 class GitHubGraphGUI:
-    def __init__(self, root, data, build_graph_fn, slugify_fn):
+    # acima deste número de vértices o modo "auto" usa o renderizador LOD
+    LIMITE_RENDER_CLASSICO = 200
+
+    def __init__(
+        self,
+        root,
+        data,
+        build_graph_fn,
+        slugify_fn,
+        layout_cache=None,
+        modo_render="auto",
+        caminho_dataset=None,
+        aquecer=True
+    ):
+        """
+        :param layout_cache: LayoutCache já criado; se None, é criado no
+            primeiro uso (ao lado de `caminho_dataset`, ou só em memória).
+        :param aquecer: importa os módulos pesados em uma thread depois
+            que o menu aparece, para o primeiro clique não esperar.
+        """
         self.root = root
         self.data = data
 
+        # "classico" (nx.draw com todos os rótulos), "lod" ou "auto"
+        self.modo_render = modo_render
+
+        # cache de layouts (por fingerprint do grafo), criado no primeiro uso
+        self._layout_cache = layout_cache
+        self.caminho_dataset = caminho_dataset
+
+        # cálculos pesados rodam fora da thread do Tk
+        self.scheduler = TaskScheduler(self.root)
+
+        # instrumentação das etapas; só é ligada pelo painel de diagnóstico
+        self.profiler = Profiler(memoria=False)
+
         # funções vindas da main
         self.build_graph = build_graph_fn
         self.slugify = slugify_fn
@@ -32,7 +87,7 @@ class GitHubGraphGUI:
 
         # janela principal -> "menu" menor
         self.root.title(f"Análise em Grafos do repositório {self.repo}")
-        self.root.geometry("500x260")  # menor, quase um modal
+        self.root.geometry("500x295")  # menor, quase um modal
 
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -145,6 +200,29 @@ class GitHubGraphGUI:
         )
         btn_metricas_comunidade.pack(side=tk.TOP, anchor="w", pady=(4, 0))
 
+        btn_diagnostico = ttk.Button(
+            main_frame,
+            text="Diagnóstico (tempo por etapa)",
+            command=lambda: DiagnosticsWindow(self.root, self.profiler)
+        )
+        btn_diagnostico.pack(side=tk.TOP, anchor="w", pady=(4, 0))
+
+        if aquecer:
+            self.root.after_idle(
+                lambda: threading.Thread(target=aquecer_modulos, name="aquecer", daemon=True).start()
+            )
+
+    @property
+    def layout_cache(self):
+        if self._layout_cache is None:
+            from Interface.LayoutEngine import LayoutCache
+            if self.caminho_dataset:
+                self._layout_cache = LayoutCache.para_dataset(self.caminho_dataset)
+            else:
+                # sem arquivo, fica só em memória
+                self._layout_cache = LayoutCache()
+        return self._layout_cache
+
 
     # ---------- modal de relatório ----------
 
@@ -156,11 +234,18 @@ class GitHubGraphGUI:
             )
             return
 
-        # monta o grafo NetworkX a partir das interações
-        G = self.build_graph(self.usuarios, interacoes)
-
         titulo = f"Relatório – {nome_grafo} — {self.repo}"
-        GraphReportWindow(self.root, titulo, G)
+
+        # monta o grafo NetworkX a partir das interações (em segundo plano)
+        def construir(tarefa):
+            tarefa.progresso(None, "Construindo grafo...")
+            return self.build_graph(self.usuarios, interacoes)
+
+        def abrir(G):
+            from Interface.GraphReportWindow import GraphReportWindow
+            GraphReportWindow(self.root, titulo, G, scheduler=self.scheduler)
+
+        self.scheduler.submeter(titulo, construir, ao_concluir=abrir)
 
 
     # ---------- janela separada para o grafo ----------
@@ -174,8 +259,76 @@ class GitHubGraphGUI:
             )
             return
 
-        # constrói grafo
-        G = self.build_graph(self.usuarios, interacoes)
+        # criado aqui, na thread do Tk, e não dentro da tarefa
+        layout_cache = self.layout_cache
+
+        def preparar(tarefa):
+            from Interface.LayoutEngine import calcular_layout
+
+            # constrói grafo
+            tarefa.progresso(0.0, "Construindo grafo...")
+            G = self.build_graph(self.usuarios, interacoes)
+
+            tarefa.progresso(0.2, "Calculando layout...")
+            pos = calcular_layout(G, cache=layout_cache, chave=titulo)
+
+            # Figure avulsa (sem pyplot): pode ser desenhada fora da
+            # thread do Tk e só depois é embutida na janela
+            tarefa.progresso(0.6, "Desenhando grafo...")
+            fig, renderer = self._desenhar_figura(G, pos, titulo, cor)
+
+            if salvar_png:
+                tarefa.progresso(0.8, "Salvando PNG...")
+                fname = self.slugify(titulo) + ".png"
+                with etapa("salvar_png"):
+                    fig.savefig(fname, dpi=150, bbox_inches="tight")
+                print(f"✓ Figura salva em: {fname}")
+
+            return G, fig, renderer
+
+        self.scheduler.submeter(
+            titulo,
+            preparar,
+            ao_concluir=lambda resultado: self._mostrar_janela_grafo(titulo, *resultado)
+        )
+
+    def _desenhar_figura(self, G, pos, titulo, cor):
+        from matplotlib.figure import Figure
+        import networkx as nx
+        from Interface.GraphRenderer import LODRenderer
+
+        with etapa("render") as registro:
+            registro.itens = G.number_of_nodes()
+            fig = Figure(figsize=(7, 5))
+            ax = fig.add_subplot(111)
+
+            renderer = None
+            if self.modo_render == "lod" or (
+                self.modo_render == "auto" and G.number_of_nodes() > self.LIMITE_RENDER_CLASSICO
+            ):
+                # arestas/vértices em lote, rótulos só para os top-k ou com zoom
+                renderer = LODRenderer(ax, G, pos, cor=cor)
+            else:
+                nx.draw(
+                    G,
+                    pos,
+                    ax=ax,
+                    with_labels=True,
+                    node_color=cor,
+                    node_size=700,
+                    font_size=8,
+                    width=1.5
+                )
+
+                edge_labels = {(u, v): G[u][v]["weight"] for u, v in G.edges()}
+                nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=8, ax=ax)
+
+            ax.set_title(titulo)
+            fig.tight_layout()
+        return fig, renderer
+
+    def _mostrar_janela_grafo(self, titulo, G, fig, renderer=None):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
         # nova janela
         win = tk.Toplevel(self.root)
@@ -186,8 +339,6 @@ class GitHubGraphGUI:
         frame_canvas = ttk.Frame(win, padding=10)
         frame_canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
-        fig, ax = plt.subplots(figsize=(7, 5))
-
         # canvas do matplotlib dentro do Tk
         canvas = FigureCanvasTkAgg(fig, master=frame_canvas)
         canvas_widget = canvas.get_tk_widget()
@@ -197,43 +348,22 @@ class GitHubGraphGUI:
         toolbar = NavigationToolbar2Tk(canvas, frame_canvas)
         toolbar.update()
 
-        # desenha o grafo
-        pos = nx.spring_layout(G, seed=42)
-
-        nx.draw(
-            G,
-            pos,
-            ax=ax,
-            with_labels=True,
-            node_color=cor,
-            node_size=700,
-            font_size=8,
-            width=1.5
-        )
-
-        edge_labels = {(u, v): G[u][v]["weight"] for u, v in G.edges()}
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=8, ax=ax)
-
-        ax.set_title(titulo)
-        fig.tight_layout()
-
-        if salvar_png:
-            fname = self.slugify(titulo) + ".png"
-            fig.savefig(fname, dpi=150, bbox_inches="tight")
-            print(f"✓ Figura salva em: {fname}")
-
         canvas.draw()
 
         # info embaixo: vértices e arestas
         info_frame = ttk.Frame(win, padding=10)
         info_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
-        lbl_info = ttk.Label(
-            info_frame,
-            text=f"Vértices: {G.number_of_nodes()} | Arestas: {G.number_of_edges()}"
-        )
+        texto_info = f"Vértices: {G.number_of_nodes()} | Arestas: {G.number_of_edges()}"
+        lbl_info = ttk.Label(info_frame, text=texto_info)
         lbl_info.pack(side=tk.LEFT, anchor="w")
 
+        # no modo LOD, mostra o tempo do último quadro desenhado
+        if renderer is not None:
+            renderer.ao_quadro = lambda duracao: lbl_info.configure(
+                text=f"{texto_info} | Quadro: {duracao * 1000:.1f} ms"
+            )
+
     # ---------- wrappers dos 3 grafos ----------
 
     def mostrar_grafo_comentario_issues(self):
@@ -257,34 +387,29 @@ class GitHubGraphGUI:
         return G.number_of_edges()
 
     def mostrar_totais_arestas(self, inicial=False):
-        total_comentarios = self._contar_arestas(self.interacoes_comentarios)
-        total_fechamento = self._contar_arestas(self.interacoes_fechamento)
-        total_pr = self._contar_arestas(self.interacoes_pr)
-
-        texto = (
-            "Totais de arestas por grafo:\n"
-            f" - Comentários em Issues : {total_comentarios}\n"
-            f" - Fechamento de Issues  : {total_fechamento}\n"
-            f" - Pull Requests         : {total_pr}"
-        )
-        print("\n" + texto + "\n")
-    def abrir_relatorio_geral(self):
-        # monta os grafos de cada tipo (se tiver dados)
-        grafos = []
-
-        if self.interacoes_comentarios:
-            G_com = self.build_graph(self.usuarios, self.interacoes_comentarios)
-            grafos.append(("Comentários em Issues", G_com))
-
-        if self.interacoes_fechamento:
-            G_fech = self.build_graph(self.usuarios, self.interacoes_fechamento)
-            grafos.append(("Fechamento de Issues", G_fech))
+        def contar(tarefa):
+            tarefa.progresso(0.0, "Contando arestas...")
+            total_comentarios = self._contar_arestas(self.interacoes_comentarios)
+            tarefa.progresso(1 / 3)
+            total_fechamento = self._contar_arestas(self.interacoes_fechamento)
+            tarefa.progresso(2 / 3)
+            total_pr = self._contar_arestas(self.interacoes_pr)
+            return total_comentarios, total_fechamento, total_pr
+
+        def imprimir(totais):
+            total_comentarios, total_fechamento, total_pr = totais
+            texto = (
+                "Totais de arestas por grafo:\n"
+                f" - Comentários em Issues : {total_comentarios}\n"
+                f" - Fechamento de Issues  : {total_fechamento}\n"
+                f" - Pull Requests         : {total_pr}"
+            )
+            print("\n" + texto + "\n")
 
-        if self.interacoes_pr:
-            G_pr = self.build_graph(self.usuarios, self.interacoes_pr)
-            grafos.append(("Pull Requests", G_pr))
+        self.scheduler.submeter("Totais de arestas", contar, ao_concluir=imprimir)
 
-        if not grafos:
+    def abrir_relatorio_geral(self):
+        if not (self.interacoes_comentarios or self.interacoes_fechamento or self.interacoes_pr):
             messagebox.showinfo(
                 "Sem dados",
                 "Não há nenhum grafo com dados para gerar o relatório geral."
@@ -292,7 +417,33 @@ class GitHubGraphGUI:
             return
 
         titulo = f"Relatório Geral — {self.repo}"
-        GlobalReportWindow(self.root, titulo, grafos)
+
+        # monta os grafos de cada tipo (se tiver dados)
+        def construir(tarefa):
+            grafos = []
+
+            if self.interacoes_comentarios:
+                tarefa.progresso(0.0, "Construindo grafo: Comentários em Issues")
+                G_com = self.build_graph(self.usuarios, self.interacoes_comentarios)
+                grafos.append(("Comentários em Issues", G_com))
+
+            if self.interacoes_fechamento:
+                tarefa.progresso(1 / 3, "Construindo grafo: Fechamento de Issues")
+                G_fech = self.build_graph(self.usuarios, self.interacoes_fechamento)
+                grafos.append(("Fechamento de Issues", G_fech))
+
+            if self.interacoes_pr:
+                tarefa.progresso(2 / 3, "Construindo grafo: Pull Requests")
+                G_pr = self.build_graph(self.usuarios, self.interacoes_pr)
+                grafos.append(("Pull Requests", G_pr))
+
+            return grafos
+
+        def abrir(grafos):
+            from Interface.GlobalReportWindow import GlobalReportWindow
+            GlobalReportWindow(self.root, titulo, grafos, scheduler=self.scheduler)
+
+        self.scheduler.submeter(titulo, construir, ao_concluir=abrir)
 
     # ---------- MÉTRICAS DE COMUNIDADE ----------
     def abrir_metricas_comunidade(self):
@@ -306,8 +457,17 @@ class GitHubGraphGUI:
             messagebox.showinfo("Sem dados", "Não há interações suficientes para métricas de comunidade.")
             return
 
-        G = self.build_graph(self.usuarios, todas_interacoes)
-        CommunityMetricsWindow(self.root, f"Métricas de Comunidade — {self.repo}", G)
+        titulo = f"Métricas de Comunidade — {self.repo}"
+
+        def construir(tarefa):
+            tarefa.progresso(None, "Construindo grafo...")
+            return self.build_graph(self.usuarios, todas_interacoes)
+
+        def abrir(G):
+            from Metrics.CommunityMetricsWindow import CommunityMetricsWindow
+            CommunityMetricsWindow(self.root, titulo, G, scheduler=self.scheduler)
+
+        self.scheduler.submeter(titulo, construir, ao_concluir=abrir)
 
 
 if __name__ == "__main__":
@@ -315,5 +475,5 @@ if __name__ == "__main__":
 
     data = load_data("dados_github.json")
     root = tk.Tk()
-    app = GitHubGraphGUI(root, data, build_graph, slugify)
+    app = GitHubGraphGUI(root, data, build_graph, slugify, caminho_dataset="dados_github.json")
     root.mainloop()
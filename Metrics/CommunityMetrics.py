@@ -1,6 +1,10 @@
 import networkx as nx
+import numpy as np
 from networkx.algorithms import community
 
+from Graph_LIB import GraphLIB
+from Graph_LIB.Profiler import instrumentar
+
 
 class CommunityMetrics:
     """
@@ -8,19 +12,34 @@ class CommunityMetrics:
       1. Detecção de comunidades (Louvain-like usando greedy modularity)
       2. Modularidade
       3. Bridging ties: nós que conectam comunidades
+
+    Grafos do Graph_LIB (ou GrafoCSR) calculam o bridging com o
+    betweenness e o agrupamento nativos de Graph_LIB.GraphLIB; a
+    detecção usa uma cópia no NetworkX, feita uma única vez.
     """
 
-    def __init__(self, G: nx.Graph):
+    def __init__(self, G):
         self.G = G
+        self.csr = None if GraphLIB.e_networkx(G) else GraphLIB.congelar(G)
+        self._copia_nx = None
+
+    def _networkx(self):
+        if self.csr is None:
+            return self.G
+        if self._copia_nx is None:
+            self._copia_nx = self.csr.para_networkx()
+        return self._copia_nx
 
     # --------------------------------------------------------------
     # 1) DETECÇÃO DE COMUNIDADES
     # --------------------------------------------------------------
+    @instrumentar("Metrics.CommunityMetrics.detectar_comunidades", itens=lambda r: r["num_comunidades"])
     def detectar_comunidades(self):
         """
         Usa greedy_modularity_communities (NetworkX puro, sem SciPy)
         """
-        if self.G.number_of_nodes() == 0:
+        G = self._networkx()
+        if G.number_of_nodes() == 0:
             return {
                 "modularidade": 0.0,
                 "num_comunidades": 0,
@@ -28,9 +47,9 @@ class CommunityMetrics:
                 "comunidades": []
             }
 
-        comunidades = list(community.greedy_modularity_communities(self.G))
+        comunidades = list(community.greedy_modularity_communities(G))
 
-        modularidade = community.modularity(self.G, comunidades)
+        modularidade = community.modularity(G, comunidades)
 
         tamanhos = [len(c) for c in comunidades]
 
@@ -44,12 +63,16 @@ class CommunityMetrics:
     # --------------------------------------------------------------
     # 2) BRIDGING TIES
     # --------------------------------------------------------------
+    @instrumentar("Metrics.CommunityMetrics.bridging_ties", itens=len)
     def bridging_ties(self):
         """
         Nós que servem de ponte entre comunidades:
         Calculado usando 'bridging centrality':
             bridging centrality = betweenness * bridging coefficient
         """
+        if self.csr is not None:
+            return self._bridging_nativo()
+
         if self.G.number_of_nodes() == 0:
             return {}
 
@@ -66,3 +89,16 @@ class CommunityMetrics:
             bridging[n] = bet[n] * coef_ponte[n]
 
         return bridging
+
+    def _bridging_nativo(self):
+        g = self.csr
+        if g.n == 0:
+            return {}
+        bet = GraphLIB.betweenness(g, normalizado=True)
+        if g.direcionado:
+            # agrupamento dirigido só existe no NetworkX
+            clustering = nx.clustering(self._networkx())
+            coef_ponte = 1 - np.array([clustering[v] for v in g.rotulos])
+        else:
+            coef_ponte = 1 - GraphLIB.agrupamento(g)
+        return g.para_rotulos(bet * coef_ponte)
@@ -1,11 +1,38 @@
+import heapq
 import tkinter as tk
 from tkinter import ttk
 import networkx as nx
+import numpy as np
 from Metrics.CommunityMetrics import CommunityMetrics
+from Interface.VirtualTable import TabelaVirtual, TreeviewVirtual
+
+# itens carregados por vez nas listas paginadas
+MEMBROS_POR_PAGINA = 200
+BRIDGING_POR_PAGINA = 20
+
+
+def _ordenar_bridging(bridging):
+    return sorted(bridging.items(), key=lambda x: x[1], reverse=True)
 
 
 class CommunityMetricsWindow:
-    def __init__(self, master, titulo, G):
+    """
+    Janela de métricas de comunidade.
+
+    Com um `scheduler` (TaskScheduler), a detecção de comunidades e os
+    bridging ties rodam em segundo plano; a estrutura geral aparece na
+    hora e cada seção é montada quando o seu resultado chega.
+
+    As comunidades aparecem em um índice paginado (número e tamanho);
+    os membros só são carregados ao selecionar uma comunidade, e os
+    bridging ties são mostrados em páginas.
+    """
+
+    def __init__(self, master, titulo, G, scheduler=None):
+        self.G = G
+        self.scheduler = scheduler
+        self.tarefa = None
+
         self.win = tk.Toplevel(master)
         self.win.title(titulo)
         self.win.geometry("780x780")
@@ -25,6 +52,7 @@ class CommunityMetricsWindow:
 
         frame = ttk.Frame(canvas)
         canvas.create_window((0, 0), window=frame, anchor="nw")
+        self.canvas = canvas
 
         # ========== TÍTULO ==========
         ttk.Label(
@@ -34,21 +62,6 @@ class CommunityMetricsWindow:
             foreground="#003366"
         ).pack(pady=(15, 20))
 
-        # ======== Função auxiliar para blocos ========
-        def bloco(parent, titulo, texto, bg="#f0f0f0"):
-            box = tk.Frame(parent, bg=bg, padx=12, pady=12, highlightthickness=1,
-                           highlightbackground="#d0d0d0")
-            box.pack(fill="x", pady=10)
-
-            tk.Label(box, text=titulo, font=("Arial", 15, "bold"),
-                     bg=bg, fg="#000").pack(anchor="w", pady=(0, 6))
-
-            tk.Label(box, text=texto, font=("Arial", 11),
-                     bg=bg, fg="#000", justify="left",
-                     wraplength=740).pack(anchor="w")
-
-            return box
-
         # ====================== 1) MÉTRICAS BÁSICAS ======================
         num_nodes = G.number_of_nodes()
         num_edges = G.number_of_edges()
@@ -64,16 +77,86 @@ class CommunityMetricsWindow:
             "➤ Densidade próxima de 0 significa rede dispersa; próxima de 1 indica forte interconexão.\n"
         )
 
-        bloco(frame, "1) Estrutura Geral da Rede", texto_basico)
+        self.bloco(frame, "1) Estrutura Geral da Rede", texto_basico)
+
+        # seções preenchidas quando os cálculos terminam
+        self.secao_comunidades = ttk.Frame(frame)
+        self.secao_comunidades.pack(fill="x")
+        self.secao_bridging = ttk.Frame(frame)
+        self.secao_bridging.pack(fill="x")
+
+        # ====================== BOTÃO FECHAR ======================
+        tk.Button(
+            frame,
+            text="Fechar",
+            command=self.win.destroy,
+            font=("Arial", 12, "bold"),
+            bg="#003366",
+            fg="white",
+            padx=12,
+            pady=6
+        ).pack(pady=25)
 
-        # ====================== 2) COMUNIDADES ======================
         cm = CommunityMetrics(G)
-        info = cm.detectar_comunidades()
 
+        if self.scheduler is None:
+            self._mostrar_comunidades(cm.detectar_comunidades())
+            self._mostrar_bridging(_ordenar_bridging(cm.bridging_ties()))
+            return
+
+        aguarde = ttk.Label(self.secao_comunidades, text="Calculando comunidades...")
+        aguarde.pack(anchor="w", pady=10)
+
+        def calcular(tarefa):
+            tarefa.progresso(0.0, "Detectando comunidades...")
+            tarefa.parcial("comunidades", cm.detectar_comunidades())
+            tarefa.progresso(0.5, "Calculando bridging ties...")
+            bridging = cm.bridging_ties()
+            tarefa.progresso(0.9, "Ordenando bridging ties...")
+            tarefa.parcial("bridging", _ordenar_bridging(bridging))
+
+        def receber(chave, valor):
+            if not self.win.winfo_exists():
+                return
+            if chave == "comunidades":
+                aguarde.destroy()
+                self._mostrar_comunidades(valor)
+            else:
+                self._mostrar_bridging(valor)
+
+        self.tarefa = self.scheduler.submeter(titulo, calcular, ao_parcial=receber)
+        self.win.bind("<Destroy>", self._ao_fechar)
+
+    def _ao_fechar(self, event):
+        if event.widget is self.win and self.tarefa is not None:
+            self.tarefa.cancelar()
+
+    def _atualizar_scroll(self):
+        self.canvas.update_idletasks()
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    # ======== Função auxiliar para blocos ========
+    @staticmethod
+    def bloco(parent, titulo, texto, bg="#f0f0f0"):
+        box = tk.Frame(parent, bg=bg, padx=12, pady=12, highlightthickness=1,
+                       highlightbackground="#d0d0d0")
+        box.pack(fill="x", pady=10)
+
+        tk.Label(box, text=titulo, font=("Arial", 15, "bold"),
+                 bg=bg, fg="#000").pack(anchor="w", pady=(0, 6))
+
+        tk.Label(box, text=texto, font=("Arial", 11),
+                 bg=bg, fg="#000", justify="left",
+                 wraplength=740).pack(anchor="w")
+
+        return box
+
+    # ====================== 2) COMUNIDADES ======================
+    def _mostrar_comunidades(self, info):
         modularidade = info["modularidade"]
         num_comunidades = info["num_comunidades"]
         tamanhos = info["tamanho_comunidades"]
-        comunidades = info["comunidades"]
+        self.comunidades = info["comunidades"]
 
         # interpretação automática
         if modularidade >= 0.40:
@@ -83,9 +166,14 @@ class CommunityMetricsWindow:
         else:
             interpret_mod = "Comunidades fracas ou pouco separadas."
 
+        # com milhares de comunidades a lista completa de tamanhos não cabe no texto
+        maiores = heapq.nlargest(10, tamanhos)
+        isoladas = sum(1 for t in tamanhos if t <= 2)
         texto_mod = (
             f"• Número de comunidades: {num_comunidades}\n"
-            f"• Tamanhos (nós por comunidade): {tamanhos}\n"
+            f"• Maiores comunidades (nós): {maiores}"
+            f"{' …' if num_comunidades > 10 else ''}\n"
+            f"• Comunidades pequenas / isoladas (1–2 usuários): {isoladas}\n"
             f"• Modularidade: {modularidade:.4f}\n\n"
             f"Interpretação automática:\n→ {interpret_mod}\n\n"
             "Escala de referência para modularidade:\n"
@@ -94,9 +182,9 @@ class CommunityMetricsWindow:
             "• > 0.40 → Grupos fortes e bem formados\n"
         )
 
-        quadro_com = bloco(frame, "2) Estrutura de Comunidades", texto_mod)
+        quadro_com = self.bloco(self.secao_comunidades, "2) Estrutura de Comunidades", texto_mod)
 
-        # ----------------------- LISTA DE COMUNIDADES -----------------------
+        # ----------------------- ÍNDICE DE COMUNIDADES -----------------------
         tk.Label(
             quadro_com,
             text="Comunidades Detectadas",
@@ -104,67 +192,96 @@ class CommunityMetricsWindow:
             bg="#f0f0f0"
         ).pack(anchor="w", pady=(15, 5))
 
-        paleta = ["#fafafa", "#f5f5f5"]  # alternância leve de fundo
-
-        for idx, com in enumerate(comunidades):
-
-            # determinar força da comunidade baseada em seu tamanho
-            size = len(com)
-            if size >= 10:
-                nivel = "Comunidade grande (bem estabelecida)"
-            elif size >= 3:
-                nivel = "Comunidade média (atividade moderada)"
-            else:
-                nivel = "Comunidade pequena / isolada"
-
-            card = tk.Frame(
-                quadro_com,
-                bg=paleta[idx % 2],
-                padx=10, pady=8,
-                highlightbackground="#cccccc",
-                highlightthickness=1
-            )
-            card.pack(fill="x", pady=6)
-
-            tk.Label(
-                card,
-                text=f"Comunidade {idx+1} — {size} usuários",
-                font=("Arial", 12, "bold"),
-                bg=paleta[idx % 2]
-            ).pack(anchor="w")
-
-            # legenda individual por comunidade
-            legenda_texto = (
+        tk.Label(
+            quadro_com,
+            text=(
                 "Escala de tamanho:\n"
                 "• 1–2 usuários → comunidade extremamente pequena / isolada\n"
                 "• 3–9 usuários → comunidade moderada\n"
                 "• ≥10 usuários → comunidade importante / núcleo forte\n"
-                f"\nClassificação automática: {nivel}\n"
-            )
-
-            tk.Label(
-                card,
-                text=legenda_texto,
-                font=("Arial", 10),
-                bg=paleta[idx % 2],
-                justify="left",
-                wraplength=720
-            ).pack(anchor="w")
-
-            # membros da comunidade
-            tk.Label(
-                card,
-                text=", ".join(str(x) for x in com),
-                font=("Arial", 10),
-                bg=paleta[idx % 2],
-                wraplength=720,
-                justify="left"
-            ).pack(anchor="w")
-
-        # ====================== 3) BRIDGING TIES ======================
-        bridging = cm.bridging_ties()
-        bridge_sorted = sorted(bridging.items(), key=lambda x: x[1], reverse=True)
+                "Selecione uma comunidade para carregar seus membros."
+            ),
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            justify="left"
+        ).pack(anchor="w")
+
+        painel = ttk.Frame(quadro_com)
+        painel.pack(fill="x", pady=(8, 0))
+
+        # índice: só número e tamanho; linhas materializadas por página
+        indice_frame = ttk.Frame(painel)
+        indice_frame.pack(side="left", fill="both", expand=True)
+
+        rotulos = [f"Comunidade {i + 1}" for i in range(num_comunidades)]
+        self.modelo_comunidades = TabelaVirtual(
+            rotulos, coluna_rotulo="comunidade", chaves_rotulo=np.arange(num_comunidades)
+        )
+        self.modelo_comunidades.definir_coluna(
+            "tamanho", {r: t for r, t in zip(rotulos, tamanhos)}, formato=".0f"
+        )
+        self.modelo_comunidades.ordenar("tamanho", True)
 
+        self.tabela_comunidades = TreeviewVirtual(
+            indice_frame, ("comunidade", "tamanho"), ["Comunidade", "Usuários"],
+            modelo=self.modelo_comunidades, pagina=50
+        )
+        self.tabela_comunidades.tree.configure(height=10)
+        self.tabela_comunidades.recarregar()
+        self.tabela_comunidades.tree.bind("<<TreeviewSelect>>", self._ao_selecionar_comunidade)
+
+        # membros da comunidade selecionada, carregados sob demanda
+        membros_frame = ttk.Frame(painel, padding=(10, 0, 0, 0))
+        membros_frame.pack(side="left", fill="both", expand=True)
+
+        self.lbl_membros = ttk.Label(membros_frame, text="Membros: selecione uma comunidade")
+        self.lbl_membros.pack(anchor="w")
+        self.lista_membros = tk.Listbox(membros_frame, height=10, width=36)
+        self.lista_membros.pack(fill="both", expand=True)
+        self.btn_mais_membros = ttk.Button(
+            membros_frame, text="Carregar mais", command=self._carregar_membros, state=tk.DISABLED
+        )
+        self.btn_mais_membros.pack(anchor="e", pady=(4, 0))
+        self._membros = []
+        self._membros_carregados = 0
+
+        self._atualizar_scroll()
+
+    def _ao_selecionar_comunidade(self, event):
+        selecionados = self.tabela_comunidades.tree.selection()
+        if not selecionados:
+            return
+        rotulo = self.tabela_comunidades.tree.item(selecionados[0], "values")[0]
+        idx = self.modelo_comunidades.indice_de(rotulo)
+        com = self.comunidades[idx]
+
+        # determinar força da comunidade baseada em seu tamanho
+        size = len(com)
+        if size >= 10:
+            nivel = "Comunidade grande (bem estabelecida)"
+        elif size >= 3:
+            nivel = "Comunidade média (atividade moderada)"
+        else:
+            nivel = "Comunidade pequena / isolada"
+
+        self.lbl_membros.configure(text=f"{rotulo} — {size} usuários ({nivel})")
+        self._membros = sorted(str(x) for x in com)
+        self._membros_carregados = 0
+        self.lista_membros.delete(0, tk.END)
+        self._carregar_membros()
+
+    def _carregar_membros(self, pagina=MEMBROS_POR_PAGINA):
+        fim = min(self._membros_carregados + pagina, len(self._membros))
+        self.lista_membros.insert(tk.END, *self._membros[self._membros_carregados:fim])
+        self._membros_carregados = fim
+        estado = tk.NORMAL if fim < len(self._membros) else tk.DISABLED
+        self.btn_mais_membros.configure(state=estado)
+
+    # ====================== 3) BRIDGING TIES ======================
+    def _mostrar_bridging(self, bridge_sorted):
+        """
+        :param bridge_sorted: lista (usuário, score) em ordem decrescente.
+        """
         explic_bridge = (
             "Bridging ties medem quem conecta comunidades diferentes.\n\n"
             "Escala:\n"
@@ -174,9 +291,39 @@ class CommunityMetricsWindow:
             "• > 0.15 → Ponte forte (usuário crucial)\n"
         )
 
-        quadro_bridge = bloco(frame, "3) Usuários Ponte Entre Comunidades", explic_bridge)
+        quadro_bridge = self.bloco(self.secao_bridging, "3) Usuários Ponte Entre Comunidades", explic_bridge)
 
-        for user, score in bridge_sorted[:10]:
+        self._bridge_sorted = bridge_sorted
+        self._bridge_carregados = 0
+
+        tabela_frame = ttk.Frame(quadro_bridge)
+        tabela_frame.pack(fill="x")
+        self.tree_bridge = ttk.Treeview(
+            tabela_frame, columns=("usuario", "score", "nivel"), show="headings", height=10
+        )
+        for col, header, largura in (
+            ("usuario", "Usuário", 200),
+            ("score", "Bridging score", 120),
+            ("nivel", "Classificação", 220),
+        ):
+            self.tree_bridge.heading(col, text=header)
+            self.tree_bridge.column(col, anchor="center", width=largura)
+        self.tree_bridge.pack(side="left", fill="x", expand=True)
+        scroll = ttk.Scrollbar(tabela_frame, orient="vertical", command=self.tree_bridge.yview)
+        self.tree_bridge.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+
+        self.btn_mais_bridge = ttk.Button(
+            quadro_bridge, text="Carregar mais", command=self._carregar_bridging
+        )
+        self.btn_mais_bridge.pack(anchor="e", pady=(4, 0))
+        self._carregar_bridging()
+
+        self._atualizar_scroll()
+
+    def _carregar_bridging(self, pagina=BRIDGING_POR_PAGINA):
+        fim = min(self._bridge_carregados + pagina, len(self._bridge_sorted))
+        for user, score in self._bridge_sorted[self._bridge_carregados:fim]:
 
             if score < 0.01:
                 nivel = "Não conecta grupos"
@@ -187,21 +334,8 @@ class CommunityMetricsWindow:
             else:
                 nivel = "Ponte forte — usuário-chave"
 
-            bloco(
-                quadro_bridge,
-                user,
-                f"Bridging score: {score:.6f}\nClassificação: {nivel}",
-                bg="#f9f9f9"
-            )
+            self.tree_bridge.insert("", tk.END, values=(user, f"{score:.6f}", nivel))
 
-        # ====================== BOTÃO FECHAR ======================
-        tk.Button(
-            frame,
-            text="Fechar",
-            command=self.win.destroy,
-            font=("Arial", 12, "bold"),
-            bg="#003366",
-            fg="white",
-            padx=12,
-            pady=6
-        ).pack(pady=25)
+        self._bridge_carregados = fim
+        estado = tk.NORMAL if fim < len(self._bridge_sorted) else tk.DISABLED
+        self.btn_mais_bridge.configure(state=estado)
@@ -0,0 +1,421 @@
+"""Análise em lote de vários repositórios (sem interface gráfica).
+
+Cada dataset (um JSON de data_collection.py por repositório) é
+analisado em um processo de trabalho de um `ProcessPoolExecutor`, com
+as mesmas etapas de cli.analisar. Os resultados são combinados com
+media_entre_repositorios, que estende as médias ponderadas de
+resumo_geral_grafos para o conjunto de repositórios.
+
+Memória e tempo por repositório:
+  - os workers devolvem só os resumos (nunca os grafos);
+  - cada worker é reciclado após `--tarefas-por-worker` repositórios e
+    pode ter o espaço de endereçamento limitado com `--memoria-mb`;
+  - `--timeout` interrompe um repositório lento dentro do próprio
+    worker; se um worker travar mesmo assim (ex.: preso em código C),
+    o pool é encerrado e os repositórios ainda não analisados seguem
+    em um pool novo;
+  - um worker que morre (ex.: falta de memória) quebra o pool; os
+    repositórios que já tinham começado são tentados de novo até
+    `TENTATIVAS` vezes, e os que ainda esperavam na fila voltam sem
+    gastar tentativa.
+
+Cada worker avisa o coordenador, por uma fila, quando começa um
+repositório: só esses contam como travados ou gastam tentativas
+(`Future.running()` também é verdadeiro para chamadas que apenas
+foram repassadas à fila interna do pool).
+
+Uso:
+    python batch_analysis.py dados/ outro_repo.json -o lote --workers 4 --timeout 600
+"""
+
+import argparse
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from Graph_LIB.Metrics import METRICAS, media_entre_repositorios
+
+# tentativas por repositório quando um worker morre e quebra o pool
+TENTATIVAS = 2
+
+# folga (s) além do timeout antes de considerar um worker travado
+FOLGA_TRAVAMENTO = 30
+
+# intervalo (s) entre as verificações de travamento do coordenador
+INTERVALO_VERIFICACAO = 1.0
+
+
+class TempoEsgotado(Exception):
+    """Levantada no worker quando o repositório passa do timeout."""
+
+
+# ---------- lado do worker ----------
+
+# fila (caminho, instante) dos repositórios iniciados; None fora do pool
+_FILA_INICIOS = None
+
+
+def _iniciar_worker(memoria_mb, fila=None):
+    """Guarda a fila de inícios e limita a memória do worker (só em Unix)."""
+    global _FILA_INICIOS
+    _FILA_INICIOS = fila
+    if not memoria_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limite = memoria_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+
+
+def _esgotou(signum, frame):
+    raise TempoEsgotado()
+
+
+def analisar_repositorio(caminho, metricas=None, comunidades=True, agregar=False, timeout=None):
+    """
+    Analisa um dataset e devolve só dados serializáveis e pequenos.
+
+    Roda no processo de trabalho; erros viram {"status": "erro"} e o
+    timeout vira {"status": "timeout"}, sem derrubar o pool.
+    """
+    from cli import Cronometro, analisar
+    from main import load_data
+
+    if _FILA_INICIOS is not None:
+        _FILA_INICIOS.put((caminho, time.time()))
+    inicio = time.perf_counter()
+    alarme = timeout and hasattr(signal, "SIGALRM")
+    if alarme:
+        signal.signal(signal.SIGALRM, _esgotou)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    cronometro = Cronometro()
+    try:
+        with cronometro.etapa("carregar dataset"):
+            data = load_data(caminho, agregar=agregar)
+        resultado = analisar(data, metricas=metricas, comunidades=comunidades, cronometro=cronometro)
+    except TempoEsgotado:
+        return _falha(caminho, "timeout", f"passou de {timeout} s", inicio)
+    except MemoryError:
+        return _falha(caminho, "erro", "memória insuficiente", inicio)
+    except Exception as e:
+        traceback.print_exc()
+        return _falha(caminho, "erro", f"{type(e).__name__}: {e}", inicio)
+    finally:
+        if alarme:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    camadas = {}
+    for nome, camada in resultado["camadas"].items():
+        G = camada["grafo"]
+        camadas[nome] = {
+            "vertices": G.number_of_nodes(),
+            "arestas": G.number_of_edges(),
+            "resumo": camada["resumo"],
+        }
+
+    saida = {
+        "dataset": caminho,
+        "status": "ok",
+        "repository": resultado["repository"],
+        "camadas": camadas,
+        "media_geral": resultado["media_geral"],
+        "tempos": cronometro.como_dict(),
+        "segundos": time.perf_counter() - inicio,
+    }
+    info = resultado.get("comunidades")
+    if info is not None:
+        saida["comunidades"] = {
+            "modularidade": info["modularidade"],
+            "num_comunidades": info["num_comunidades"],
+        }
+    return saida
+
+
+def _falha(caminho, status, erro, inicio=None):
+    return {
+        "dataset": caminho,
+        "status": status,
+        "erro": erro,
+        "segundos": None if inicio is None else time.perf_counter() - inicio,
+    }
+
+
+# ---------- lado do coordenador ----------
+
+def _criar_pool(workers, memoria_mb, tarefas_por_worker):
+    """Pool novo e a fila pela qual os workers avisam cada início."""
+    # reciclar workers exige processos criados com "spawn"
+    contexto = multiprocessing.get_context("spawn" if tarefas_por_worker else None)
+    fila = contexto.Queue()
+    opcoes = {
+        "max_workers": workers,
+        "initializer": _iniciar_worker,
+        "initargs": (memoria_mb, fila),
+        "mp_context": contexto,
+    }
+    if tarefas_por_worker:
+        opcoes["max_tasks_per_child"] = tarefas_por_worker
+    return ProcessPoolExecutor(**opcoes), fila
+
+
+def _ler_inicios(fila, iniciados):
+    """Passa para `iniciados` (caminho -> instante) os avisos já na fila."""
+    while True:
+        try:
+            caminho, instante = fila.get_nowait()
+        except (queue.Empty, OSError, EOFError):
+            return
+        iniciados[caminho] = instante
+
+
+def _encerrar_pool(pool, travado=False):
+    """Encerra o pool; com `travado`, termina os workers antes de esperar."""
+    if travado:
+        # o executor não expõe os processos; sem terminar, um worker preso
+        # em código C seguraria o shutdown até o fim
+        for processo in list((getattr(pool, "_processes", None) or {}).values()):
+            if processo.is_alive():
+                processo.terminate()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def executar_lote(
+    datasets,
+    workers=None,
+    timeout=None,
+    memoria_mb=None,
+    tarefas_por_worker=1,
+    ao_concluir=None,
+    **opcoes
+):
+    """
+    Analisa os datasets em paralelo.
+
+    :param timeout: segundos por repositório (None = sem limite).
+    :param memoria_mb: limite de memória de cada worker (None = sem limite).
+    :param tarefas_por_worker: repositórios por worker antes de reciclá-lo.
+    :param ao_concluir: callback(resultado) chamado a cada repositório.
+    :param opcoes: repassadas para analisar_repositorio (metricas,
+        comunidades, agregar).
+    :return: resultados na mesma ordem de `datasets`.
+    """
+    workers = workers or os.cpu_count() or 1
+    resultados = {}
+    tentativas = {caminho: 0 for caminho in datasets}
+    pendentes = list(dict.fromkeys(datasets))
+
+    def registrar(caminho, resultado):
+        resultados[caminho] = resultado
+        if ao_concluir is not None:
+            ao_concluir(resultado)
+
+    limite = None if timeout is None else timeout + FOLGA_TRAVAMENTO
+    while pendentes:
+        pool, fila = _criar_pool(workers, memoria_mb, tarefas_por_worker)
+        futuros = {
+            pool.submit(analisar_repositorio, caminho, timeout=timeout, **opcoes): caminho
+            for caminho in pendentes
+        }
+        pendentes = []
+        ativos = set(futuros)
+        # caminho -> instante em que um worker começou a analisá-lo
+        iniciados = {}
+        travado = False
+
+        try:
+            while ativos:
+                espera = None if limite is None else INTERVALO_VERIFICACAO
+                feitos, ativos = wait(ativos, timeout=espera, return_when=FIRST_COMPLETED)
+                _ler_inicios(fila, iniciados)
+
+                quebrados = []
+                for futuro in feitos:
+                    caminho = futuros[futuro]
+                    try:
+                        registrar(caminho, futuro.result())
+                    except BrokenProcessPool:
+                        quebrados.append(caminho)
+                for caminho in quebrados:
+                    # quem nem começou volta sem gastar tentativa (se nenhum
+                    # começou, o próprio pool falha e todos gastam)
+                    if caminho in iniciados or not iniciados:
+                        tentativas[caminho] += 1
+                    if tentativas[caminho] < TENTATIVAS:
+                        pendentes.append(caminho)
+                    else:
+                        registrar(caminho, _falha(caminho, "erro", "processo de trabalho encerrado"))
+
+                if limite is None:
+                    continue
+                agora = time.time()
+                travados = {
+                    futuro for futuro in ativos
+                    if futuros[futuro] in iniciados and agora - iniciados[futuros[futuro]] > limite
+                }
+                if travados:
+                    # os repositórios travados falham; o resto (inclusive os
+                    # que estavam rodando sem problema) vai para um pool novo
+                    for futuro in ativos:
+                        caminho = futuros[futuro]
+                        if futuro in travados:
+                            registrar(caminho, _falha(caminho, "timeout", "worker travado"))
+                        else:
+                            pendentes.append(caminho)
+                    travado = True
+                    break
+        finally:
+            _encerrar_pool(pool, travado)
+            fila.close()
+
+    return [resultados[caminho] for caminho in dict.fromkeys(datasets)]
+
+
+def combinar(resultados, metricas=None):
+    """Resumo entre repositórios a partir dos resultados bem-sucedidos."""
+    ok = [r for r in resultados if r["status"] == "ok"]
+    # chave pelo caminho: dois datasets do mesmo repositório não se sobrescrevem
+    repositorios = [
+        (r["dataset"], [(nome, c["resumo"]) for nome, c in r["camadas"].items()])
+        for r in ok
+    ]
+    combinado = media_entre_repositorios(repositorios, metricas)
+
+    totais = {}
+    for r in ok:
+        for nome, camada in r["camadas"].items():
+            total = totais.setdefault(nome, {"repositorios": 0, "vertices": 0, "arestas": 0})
+            total["repositorios"] += 1
+            total["vertices"] += camada["vertices"]
+            total["arestas"] += camada["arestas"]
+    combinado["totais_por_camada"] = totais
+    combinado["repositorios_ok"] = len(ok)
+    combinado["falhas"] = [
+        {"dataset": r["dataset"], "status": r["status"], "erro": r["erro"]}
+        for r in resultados if r["status"] != "ok"
+    ]
+    return combinado
+
+
+def escrever_lote(resultados, combinado, pasta, metricas):
+    """Grava lote.json (tudo) e lote.csv (uma linha por repositório e camada)."""
+    os.makedirs(pasta, exist_ok=True)
+
+    caminho_json = os.path.join(pasta, "lote.json")
+    with open(caminho_json, "w", encoding="utf-8") as f:
+        json.dump(
+            {"repositorios": resultados, "entre_repositorios": combinado},
+            f, ensure_ascii=False, indent=2
+        )
+
+    caminho_csv = os.path.join(pasta, "lote.csv")
+    with open(caminho_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["repositorio", "dataset", "camada", "vertices", "arestas"] + [f"media_{m}" for m in metricas]
+        )
+        for r in resultados:
+            if r["status"] != "ok":
+                continue
+            for nome, camada in r["camadas"].items():
+                writer.writerow(
+                    [r["repository"], r["dataset"], nome, camada["vertices"], camada["arestas"]]
+                    + [camada["resumo"].get(m, {}).get("media", 0.0) for m in metricas]
+                )
+
+    return [caminho_json, caminho_csv]
+
+
+def expandir_datasets(entradas):
+    """Arquivos JSON e pastas (todos os *.json, exceto caches de layout)."""
+    datasets = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for caminho in sorted(glob.glob(os.path.join(entrada, "*.json"))):
+                if not caminho.endswith(".layout.json"):
+                    datasets.append(caminho)
+        else:
+            datasets.append(entrada)
+    return datasets
+
+
+# ---------- linha de comando ----------
+
+def criar_parser():
+    from cli import lista_opcoes
+
+    parser = argparse.ArgumentParser(
+        description="Análise de vários repositórios em paralelo."
+    )
+    parser.add_argument("datasets", nargs="+",
+                        help="arquivos JSON de data_collection.py ou pastas com eles")
+    parser.add_argument("-o", "--saida", default="lote",
+                        help="pasta de saída (padrão: lote)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processos de trabalho (padrão: número de CPUs)")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="segundos por repositório (padrão: sem limite)")
+    parser.add_argument("--memoria-mb", type=int, default=None,
+                        help="limite de memória por worker, em MB (Unix)")
+    parser.add_argument("--tarefas-por-worker", type=int, default=1,
+                        help="repositórios por worker antes de reciclá-lo (padrão: 1; 0 desativa)")
+    parser.add_argument("--metricas", default=",".join(METRICAS),
+                        type=lambda t: lista_opcoes(t, METRICAS, "métrica"),
+                        help=f"métricas separadas por vírgula (padrão: {','.join(METRICAS)})")
+    parser.add_argument("--sem-comunidades", action="store_true",
+                        help="não roda detecção de comunidades nem bridging ties")
+    parser.add_argument("--agregar", action="store_true",
+                        help="agrega interações brutas ao carregar (ver load_data)")
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    datasets = expandir_datasets(args.datasets)
+    if not datasets:
+        print("Nenhum dataset encontrado.", file=sys.stderr)
+        return 2
+
+    def mostrar(resultado):
+        if resultado["status"] == "ok":
+            print(f"✓ {resultado['repository']} ({resultado['segundos']:.1f} s)")
+        else:
+            print(f"✗ {resultado['dataset']}: {resultado['status']} — {resultado['erro']}")
+
+    inicio = time.perf_counter()
+    resultados = executar_lote(
+        datasets,
+        workers=args.workers,
+        timeout=args.timeout,
+        memoria_mb=args.memoria_mb,
+        tarefas_por_worker=args.tarefas_por_worker or None,
+        ao_concluir=mostrar,
+        metricas=args.metricas,
+        comunidades=not args.sem_comunidades,
+        agregar=args.agregar,
+    )
+    combinado = combinar(resultados, args.metricas)
+
+    for caminho in escrever_lote(resultados, combinado, args.saida, args.metricas):
+        print(f"✓ Arquivo salvo em: {caminho}")
+
+    print(
+        f"\n{combinado['repositorios_ok']}/{len(resultados)} repositórios analisados "
+        f"em {time.perf_counter() - inicio:.1f} s"
+    )
+    return 0 if not combinado["falhas"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Carga com muitas inserções e remoções (churn) no DynamicGraph.
+
+Simula um grafo vivo: a cada passo entram interações novas, expiram as
+mais antigas e, de vez em quando, uma conta inteira é removida (como
+um bot). As mesmas operações são aplicadas a um modelo de referência
+em dicionários, e o grafo é conferido contra ele a cada `--verificar`
+passos (arestas, pesos, graus de entrada, slots livres e a conversão
+para GrafoCSR).
+
+Para comparação, mede o mesmo fluxo só de arestas no
+AdjacencyListGraph, cujo remove_edge percorre a lista de vizinhos.
+
+Uso:
+    python -m benchmarks.benchmark_churn --passos 200 --lote 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+# permite rodar também como "python benchmarks/benchmark_churn.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Graph_LIB.AdjacencyListGraph import AdjacencyListGraph  # noqa: E402
+from Graph_LIB.DynamicGraph import DynamicGraph  # noqa: E402
+from Graph_LIB.GraphLIB import congelar  # noqa: E402
+
+
+def conferir(g, modelo):
+    """Compara o DynamicGraph com o modelo {u: {v: peso}}; lança AssertionError."""
+    assert set(g.vertices) == set(modelo), "vértices diferentes"
+    esperado = {(u, v): w for u, vizinhos in modelo.items() for v, w in vizinhos.items()}
+    assert g.get_edge_count() == len(esperado), "contagem de arestas diferente"
+    assert g.edge_weights == esperado, "arestas ou pesos diferentes"
+    entrada = {u: 0 for u in modelo}
+    for _, v in esperado:
+        entrada[v] += 1
+    assert all(g.get_vertex_in_degree(u) == entrada[u] for u in modelo), "grau de entrada diferente"
+    assert len(g._livres) + len(modelo) == len(g._rotulo_de), "slot perdido"
+
+    csr = congelar(g)
+    assert csr.n == len(modelo) and csr.m == len(esperado), "GrafoCSR diferente"
+
+
+def churn(passos, lote, usuarios, janela, prob_bot, verificar, seed):
+    rng = random.Random(seed)
+    g = DynamicGraph()
+    modelo = {}
+    vivos = [f"dev{i}" for i in range(usuarios)]
+    g.add_nodes_from(vivos)
+    for u in vivos:
+        modelo[u] = {}
+    proximo = usuarios
+    fila = deque()  # lotes ainda dentro da janela
+    operacoes = 0
+
+    inicio = time.perf_counter()
+    for passo in range(passos):
+        arestas = []
+        for _ in range(lote):
+            u, v = rng.choice(vivos), rng.choice(vivos)
+            arestas.append((u, v, rng.randint(1, 5)))
+        g.add_edges_from(arestas)
+        for u, v, w in arestas:
+            modelo[u][v] = modelo[u].get(v, 0) + w
+        fila.append(arestas)
+        operacoes += len(arestas)
+
+        # expira o lote mais antigo
+        if len(fila) > janela:
+            antigas = fila.popleft()
+            g.remove_edges_from(antigas)
+            for u, v, _ in antigas:
+                if u in modelo:
+                    modelo[u].pop(v, None)
+            operacoes += len(antigas)
+
+        # remove uma conta e cria outra no lugar (reusa o slot)
+        if rng.random() < prob_bot:
+            bot = vivos.pop(rng.randrange(len(vivos)))
+            g.rotulos[bot] = "bot"
+            g.remove_node(bot)
+            del modelo[bot]
+            for vizinhos in modelo.values():
+                vizinhos.pop(bot, None)
+            novo = f"dev{proximo}"
+            proximo += 1
+            vivos.append(novo)
+            g.add_node(novo)
+            modelo[novo] = {}
+            assert bot not in g.rotulos
+            operacoes += 1
+
+        if verificar and (passo + 1) % verificar == 0:
+            pausa = time.perf_counter()
+            conferir(g, modelo)
+            inicio += time.perf_counter() - pausa
+
+    return time.perf_counter() - inicio, operacoes, g
+
+
+def churn_lista(passos, lote, usuarios, janela, seed):
+    """Só inserção e expiração de arestas, no AdjacencyListGraph."""
+    rng = random.Random(seed)
+    g = AdjacencyListGraph()
+    vivos = [f"dev{i}" for i in range(usuarios)]
+    g.add_nodes_from(vivos)
+    fila = deque()
+    inicio = time.perf_counter()
+    for _ in range(passos):
+        arestas = [(rng.choice(vivos), rng.choice(vivos), rng.randint(1, 5)) for _ in range(lote)]
+        g.add_edges_from(arestas)
+        fila.append(arestas)
+        if len(fila) > janela:
+            for u, v, _ in fila.popleft():
+                g.remove_edge(u, v)
+    return time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Churn de arestas e vértices no DynamicGraph.")
+    parser.add_argument("--passos", type=int, default=100)
+    parser.add_argument("--lote", type=int, default=5000, help="interações novas por passo")
+    parser.add_argument("--usuarios", type=int, default=2000)
+    parser.add_argument("--janela", type=int, default=10, help="passos que uma interação fica no grafo")
+    parser.add_argument("--prob-bot", type=float, default=0.5, help="chance de remover uma conta por passo")
+    parser.add_argument("--verificar", type=int, default=10, help="confere com o modelo a cada N passos (0 = nunca)")
+    parser.add_argument("--sem-lista", action="store_true", help="não mede o AdjacencyListGraph")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    segundos, operacoes, g = churn(
+        args.passos, args.lote, args.usuarios, args.janela, args.prob_bot, args.verificar, args.seed
+    )
+    print(f"DynamicGraph:       {segundos:8.3f} s  {operacoes / segundos:12.0f} operações/s  ({g})")
+    if not args.sem_lista:
+        lista = churn_lista(args.passos, args.lote, args.usuarios, args.janela, args.seed)
+        print(f"AdjacencyListGraph: {lista:8.3f} s  (só arestas)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
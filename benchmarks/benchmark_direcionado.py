@@ -0,0 +1,116 @@
+"""Métricas direcionadas nativas contra uma chamada do NetworkX por métrica.
+
+Para cada escala, gera interações sintéticas, monta o grafo com
+`build_graph(..., direcionado=True)` e mede:
+
+  - networkx: in_degree/out_degree ponderados, HITS (versão em Python
+    puro; `nx.hits` exige SciPy) e reciprocidade por vértice e global,
+    cada uma em sua chamada;
+  - nativo: `GraphLIB.metricas_direcionadas` (congelamento incluído),
+    tudo do mesmo par CSR/CSC.
+
+Antes de medir, confere que os valores nativos batem com os do NetworkX.
+
+Uso:
+    python -m benchmarks.benchmark_direcionado --escalas 1e4,1e5
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import networkx as nx
+import numpy as np
+from networkx.algorithms.link_analysis.hits_alg import _hits_python
+
+# permite rodar também como "python benchmarks/benchmark_direcionado.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from Graph_LIB import GraphLIB  # noqa: E402
+from main import build_graph  # noqa: E402
+
+ESCALAS_PADRAO = [10_000, 100_000]
+
+
+def via_networkx(G):
+    hubs, autoridades = _hits_python(G, max_iter=1000)
+    return {
+        "forca_entrada": dict(G.in_degree(weight="weight")),
+        "forca_saida": dict(G.out_degree(weight="weight")),
+        "hubs": hubs,
+        "autoridades": autoridades,
+        "reciprocidade": nx.reciprocity(G, G.nodes()),
+        "reciprocidade_global": nx.overall_reciprocity(G) if G.number_of_edges() else float("nan"),
+    }
+
+
+def via_nativo(G):
+    g = GraphLIB.congelar(G)
+    return g, GraphLIB.metricas_direcionadas(g, max_iter=1000)
+
+
+def conferir(g, nativo, referencia):
+    """Lança AssertionError se alguma métrica nativa divergir do NetworkX."""
+    for nome in ("forca_entrada", "forca_saida", "hubs", "autoridades"):
+        esperado = np.array([referencia[nome][v] for v in g.rotulos], dtype=float)
+        assert np.allclose(nativo[nome], esperado, atol=1e-9), f"{nome} diferente"
+    esperado = np.array([np.nan if referencia["reciprocidade"][v] is None else referencia["reciprocidade"][v]
+                         for v in g.rotulos])
+    assert np.allclose(nativo["reciprocidade"], esperado, equal_nan=True), "reciprocidade diferente"
+    assert np.isclose(nativo["reciprocidade_global"], referencia["reciprocidade_global"], equal_nan=True), \
+        "reciprocidade global diferente"
+
+
+def rodar_escala(n, seed=42):
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    G = build_graph(data["users"], [i for lista in data["interactions"].values() for i in lista], direcionado=True)
+    print(f"  {G.number_of_nodes()} vértices, {G.number_of_edges()} arestas", flush=True)
+
+    referencia, tempo_nx = medir(lambda: via_networkx(G), memoria=False)
+    (g, nativo), tempo_nativo = medir(lambda: via_nativo(G), memoria=False)
+    conferir(g, nativo, referencia)
+
+    proporcao = tempo_nx["segundos"] / max(tempo_nativo["segundos"], 1e-9)
+    print(f"  networkx {tempo_nx['segundos']:9.3f} s", flush=True)
+    print(f"  nativo   {tempo_nativo['segundos']:9.3f} s  ({proporcao:.1f}x)  "
+          f"HITS em {nativo['iteracoes_hits']} iterações, "
+          f"reciprocidade global {nativo['reciprocidade_global']:.3f}", flush=True)
+    return {
+        "interacoes": n,
+        "vertices": g.n,
+        "arcos": g.m,
+        "networkx_s": tempo_nx["segundos"],
+        "nativo_s": tempo_nativo["segundos"],
+        "iteracoes_hits": nativo["iteracoes_hits"],
+    }
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Métricas direcionadas nativas x NetworkX.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e4,1e5)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(n, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
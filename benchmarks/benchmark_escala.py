@@ -0,0 +1,266 @@
+"""Benchmark de escala do pipeline de análise.
+
+Para cada escala (número de interações), gera um dataset sintético com
+benchmarks.gerador_sintetico e mede tempo e pico de memória de:
+  - load_data (bruto e com agregar=True) e build_graph;
+  - cada método de CentralityMetrics;
+  - as duas classes CommunityMetrics (Metrics/ e Graph_LIB/Metrics.py);
+  - calcular_layout (sem cache).
+
+O tempo vem de uma execução limpa; o pico de memória (tracemalloc) de
+uma segunda execução, já que o tracemalloc deixa o código mais lento.
+Etapas quadráticas são puladas acima de `--max-vertices-caros`.
+
+Os resultados vão para um JSON que pode ser usado como base em outra
+execução (`--comparar`), apontando etapas que ficaram mais lentas.
+
+Uso:
+    python -m benchmarks.benchmark_escala --escalas 1e3,1e4,1e5 -o base.json
+    python -m benchmarks.benchmark_escala --escalas 1e3,1e4,1e5 --comparar base.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# permite rodar também como "python benchmarks/benchmark_escala.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.gerador_sintetico import salvar_dataset  # noqa: E402
+from main import build_graph, load_data  # noqa: E402
+
+ESCALAS_PADRAO = [1_000, 10_000, 100_000]
+
+# etapas O(n·m) ou piores: puladas em grafos grandes
+ETAPAS_CARAS = {
+    "betweenness_centrality",
+    "closeness_centrality",
+    "comunidades.detectar_comunidades",
+    "comunidades.bridging_ties",
+    "graph_lib.detectar_comunidades",
+    "graph_lib.bridging_ties",
+}
+
+# abaixo disso a variação entre execuções é maior que a diferença medida
+PISO_COMPARACAO = 0.01
+
+
+def medir(funcao, memoria=True):
+    """
+    Executa `funcao` e mede o tempo; com `memoria`, executa de novo sob
+    tracemalloc para o pico de memória.
+
+    :return: (resultado, {"segundos", "pico_mb"})
+    """
+    gc.collect()
+    inicio = time.perf_counter()
+    resultado = funcao()
+    registro = {"segundos": time.perf_counter() - inicio, "pico_mb": None}
+
+    if memoria:
+        del resultado
+        gc.collect()
+        tracemalloc.start()
+        try:
+            resultado = funcao()
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        registro["pico_mb"] = pico / 1e6
+
+    return resultado, registro
+
+
+def _interacoes(data):
+    return [i for lista in data["interactions"].values() for i in lista]
+
+
+def etapas(G, data_agregada):
+    """Etapas medidas depois que o grafo existe: nome -> função."""
+    from Graph_LIB.Metrics import CentralityMetrics, CommunityMetrics as CommunityMetricsLib
+    from Interface.LayoutEngine import calcular_layout
+    from Metrics.CommunityMetrics import CommunityMetrics
+
+    cm = CentralityMetrics(G)
+    com = CommunityMetrics(G)
+    com_lib = CommunityMetricsLib(G)
+    interacoes_agregadas = _interacoes(data_agregada)
+
+    return {
+        "build_graph_agregado": lambda: build_graph(data_agregada["users"], interacoes_agregadas),
+        "degree_centrality": cm.degree_centrality,
+        "betweenness_centrality": cm.betweenness_centrality,
+        "closeness_centrality": cm.closeness_centrality,
+        "pagerank": cm.pagerank,
+        "comunidades.detectar_comunidades": com.detectar_comunidades,
+        "comunidades.bridging_ties": com.bridging_ties,
+        "graph_lib.detectar_comunidades": com_lib.detectar_comunidades,
+        "graph_lib.bridging_ties": com_lib.bridging_ties,
+        "layout": lambda: calcular_layout(G, cache=None),
+    }
+
+
+def _mostrar(nome, registro):
+    if "pulado" in registro:
+        print(f"  {nome:<34} pulado ({registro['pulado']})", flush=True)
+        return
+    memoria = "" if registro["pico_mb"] is None else f"  {registro['pico_mb']:9.1f} MB"
+    print(f"  {nome:<34} {registro['segundos']:9.3f} s{memoria}", flush=True)
+
+
+def rodar_escala(n, pasta, memoria=True, max_vertices_caros=5000, max_vertices_layout=50000, seed=42):
+    """Mede todas as etapas para um dataset sintético de n interações."""
+    caminho = os.path.join(pasta, f"sintetico_{n}.json")
+    registros = {}
+
+    inicio = time.perf_counter()
+    salvar_dataset(caminho, n, seed=seed)
+    registros["gerar_dataset"] = {"segundos": time.perf_counter() - inicio, "pico_mb": None}
+    tamanho_mb = os.path.getsize(caminho) / 1e6
+
+    data, registros["load_data"] = medir(lambda: load_data(caminho), memoria)
+    data_agregada, registros["load_data_agregar"] = medir(lambda: load_data(caminho, agregar=True), memoria)
+    interacoes = _interacoes(data)
+    G, registros["build_graph"] = medir(lambda: build_graph(data["users"], interacoes), memoria)
+    for nome in ("gerar_dataset", "load_data", "load_data_agregar", "build_graph"):
+        _mostrar(nome, registros[nome])
+
+    n_vertices = G.number_of_nodes()
+    for nome, funcao in etapas(G, data_agregada).items():
+        if nome in ETAPAS_CARAS and n_vertices > max_vertices_caros:
+            registros[nome] = {"pulado": f"mais de {max_vertices_caros} vértices"}
+            _mostrar(nome, registros[nome])
+            continue
+        if nome == "layout" and n_vertices > max_vertices_layout:
+            registros[nome] = {"pulado": f"mais de {max_vertices_layout} vértices"}
+            _mostrar(nome, registros[nome])
+            continue
+        _, registros[nome] = medir(funcao, memoria)
+        _mostrar(nome, registros[nome])
+
+    os.remove(caminho)
+    return {
+        "interacoes": n,
+        "arquivo_mb": tamanho_mb,
+        "vertices": n_vertices,
+        "arestas": G.number_of_edges(),
+        "etapas": registros,
+    }
+
+
+def ambiente():
+    """Versões e máquina, para saber se duas execuções são comparáveis."""
+    import networkx
+    import numpy
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "networkx": networkx.__version__,
+        "numpy": numpy.__version__,
+    }
+
+
+def comparar(atual, base, tolerancia=0.25):
+    """
+    Compara duas execuções escala a escala.
+
+    :return: lista de (escala, etapa, segundos_base, segundos_atual, razao, regressao)
+    """
+    linhas = []
+    for escala, dados in atual["escalas"].items():
+        dados_base = base.get("escalas", {}).get(escala)
+        if dados_base is None:
+            continue
+        for etapa, registro in dados["etapas"].items():
+            anterior = dados_base["etapas"].get(etapa, {})
+            if "segundos" not in registro or "segundos" not in anterior:
+                continue
+            razao = registro["segundos"] / max(anterior["segundos"], 1e-9)
+            regressao = anterior["segundos"] >= PISO_COMPARACAO and razao > 1 + tolerancia
+            linhas.append((escala, etapa, anterior["segundos"], registro["segundos"], razao, regressao))
+    return linhas
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escala com datasets sintéticos.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e3,1e4,1e5)")
+    parser.add_argument("-o", "--saida", default=None,
+                        help="JSON de resultados (padrão: benchmarks/resultados/escala_<data>.json)")
+    parser.add_argument("--comparar", default=None,
+                        help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="aumento relativo de tempo tolerado na comparação (padrão: 0.25)")
+    parser.add_argument("--sem-memoria", action="store_true",
+                        help="não mede o pico de memória (metade do tempo total)")
+    parser.add_argument("--max-vertices-caros", type=int, default=5000,
+                        help="pula betweenness/closeness/comunidades acima disso (padrão: 5000)")
+    parser.add_argument("--max-vertices-layout", type=int, default=50000,
+                        help="pula o layout acima disso (padrão: 50000)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    with tempfile.TemporaryDirectory() as pasta:
+        for n in args.escalas:
+            print(f"Escala: {n} interações", flush=True)
+            resultado["escalas"][str(n)] = rodar_escala(
+                n, pasta,
+                memoria=not args.sem_memoria,
+                max_vertices_caros=args.max_vertices_caros,
+                max_vertices_layout=args.max_vertices_layout,
+                seed=args.seed,
+            )
+
+    saida = args.saida
+    if saida is None:
+        pasta_resultados = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resultados")
+        os.makedirs(pasta_resultados, exist_ok=True)
+        saida = os.path.join(pasta_resultados, f"escala_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(saida, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Resultados salvos em: {saida}")
+
+    if args.comparar is None:
+        return 0
+
+    with open(args.comparar, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    linhas = comparar(resultado, base, args.tolerancia)
+    print(f"\nComparação com {args.comparar} (commit {base.get('ambiente', {}).get('commit')}):")
+    print(f"  {'escala':>9}  {'etapa':<34} {'base (s)':>10} {'atual (s)':>10} {'razão':>7}")
+    for escala, etapa, antes, agora, razao, regressao in linhas:
+        marca = "  <-- REGRESSÃO" if regressao else ""
+        print(f"  {escala:>9}  {etapa:<34} {antes:10.3f} {agora:10.3f} {razao:7.2f}{marca}")
+
+    return 1 if any(linha[-1] for linha in linhas) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
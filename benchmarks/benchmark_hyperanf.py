@@ -0,0 +1,133 @@
+"""Closeness aproximado (HyperANF) contra o closeness exato.
+
+Para cada escala, gera interações sintéticas, monta o grafo com
+build_graph e compara, para cada número de bits dos contadores:
+
+  - o tempo de `hyperanf` com o de `GraphLIB.closeness` (exato, uma BFS
+    por vértice), pulado acima de `--max-vertices-exato`;
+  - o erro relativo observado em closeness e na centralidade harmônica
+    (média, p95 e máximo sobre os vértices com closeness > 0) contra o
+    erro padrão reportado (1.04 / sqrt(2^bits));
+  - a função de vizinhança e o diâmetro efetivo contra os exatos.
+
+Uso:
+    python -m benchmarks.benchmark_hyperanf --escalas 1e4,1e5 --bits 6,8,10
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import networkx as nx
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_hyperanf.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from Graph_LIB import GraphLIB  # noqa: E402
+from Graph_LIB.HyperANF import diametro_efetivo, hyperanf  # noqa: E402
+from main import build_graph  # noqa: E402
+
+ESCALAS_PADRAO = [10_000, 100_000]
+BITS_PADRAO = [6, 8, 10]
+
+
+def _erros(aproximado, exato):
+    positivos = exato > 0
+    relativo = np.abs(aproximado[positivos] - exato[positivos]) / exato[positivos]
+    if len(relativo) == 0:
+        return {"media": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "media": float(relativo.mean()),
+        "p95": float(np.percentile(relativo, 95)),
+        "max": float(relativo.max()),
+    }
+
+
+def _exatos(G, g):
+    """Closeness, harmônica e função de vizinhança exatas (BFS por vértice)."""
+    closeness = GraphLIB.closeness(g)
+    harmonica = nx.harmonic_centrality(G)
+    contagem = {}
+    for _, distancias in nx.all_pairs_shortest_path_length(G):
+        for d in distancias.values():
+            contagem[d] = contagem.get(d, 0) + 1
+    funcao = np.cumsum([contagem.get(t, 0) for t in range(max(contagem) + 1)]).tolist()
+    return closeness, np.array([harmonica[v] for v in g.rotulos]), funcao
+
+
+def rodar_escala(n, bits_testados, max_vertices_exato, seed=42):
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    G = build_graph(data["users"], [i for lista in data["interactions"].values() for i in lista])
+    g = GraphLIB.congelar(G)
+    print(f"  {g.n} vértices, {g.m} arestas", flush=True)
+
+    registro = {"interacoes": n, "vertices": g.n, "arestas": g.m, "bits": {}}
+    exatos = None
+    if g.n <= max_vertices_exato:
+        exatos, tempo = medir(lambda: _exatos(G, g), memoria=False)
+        registro["exato_s"] = tempo["segundos"]
+        print(f"  exato              {tempo['segundos']:9.3f} s  "
+              f"diâmetro efetivo {diametro_efetivo(exatos[2]):.2f}", flush=True)
+
+    for bits in bits_testados:
+        estimativa, tempo = medir(lambda: hyperanf(g, bits=bits), memoria=False)
+        linha = {
+            "segundos": tempo["segundos"],
+            "iteracoes": estimativa["iteracoes"],
+            "memoria_bytes": estimativa["memoria_bytes"],
+            "erro_reportado": estimativa["erro_relativo"],
+            "diametro_efetivo": estimativa["diametro_efetivo"],
+        }
+        texto = (f"  bits={bits:<2} {tempo['segundos']:9.3f} s  {estimativa['memoria_bytes'] / 2**20:7.1f} MB  "
+                 f"erro reportado {estimativa['erro_relativo']:.3f}  "
+                 f"diâmetro efetivo {estimativa['diametro_efetivo']:.2f}")
+        if exatos is not None:
+            closeness, harmonica, funcao = exatos
+            linha["erro_closeness"] = _erros(estimativa["closeness"], closeness)
+            linha["erro_harmonica"] = _erros(estimativa["harmonica"], harmonica)
+            pares = min(len(funcao), len(estimativa["funcao_vizinhanca"]))
+            linha["erro_funcao_vizinhanca"] = _erros(
+                np.array(estimativa["funcao_vizinhanca"][:pares]), np.array(funcao[:pares], dtype=float)
+            )
+            texto += (f"  closeness média {linha['erro_closeness']['media']:.4f} "
+                      f"p95 {linha['erro_closeness']['p95']:.4f}  "
+                      f"harmônica média {linha['erro_harmonica']['media']:.4f}")
+        print(texto, flush=True)
+        registro["bits"][str(bits)] = linha
+    return registro
+
+
+def _lista(tipo):
+    return lambda texto: [tipo(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Closeness aproximado (HyperANF) x exato.")
+    parser.add_argument("--escalas", type=_lista(int), default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e4,1e5)")
+    parser.add_argument("--bits", type=_lista(int), default=BITS_PADRAO,
+                        help="bits dos contadores, separados por vírgula (padrão: 6,8,10)")
+    parser.add_argument("--max-vertices-exato", type=int, default=20_000,
+                        help="pula o cálculo exato acima deste número de vértices (padrão: 20000)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(n, args.bits, args.max_vertices_exato, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Benchmark da carga de interações em grafos do Graph_LIB.
+
+Para cada escala, grava um dataset sintético bruto e mede:
+  - load_data: leitura do JSON (o custo de E/S que a carga deveria dominar);
+  - individual: add_node + has_edge/add_edge/set_edge_weight por interação;
+  - lote: add_nodes_from + add_edges_from com as tuplas (from, to, weight);
+  - build_graph: o nx.Graph de main.build_graph, como referência.
+
+A carga individual é pulada acima de `--max-individual` interações,
+porque has_edge percorre a lista de vizinhos dos mantenedores a cada
+chamada.
+
+Antes de medir, confere que `AdjacencyMatrixGraph` e `AdjacencyListGraph`
+carregados pela API individual congelam para o mesmo `GrafoCSR` (e dão
+o mesmo grau ponderado), nas interações entre os primeiros
+`--max-vertices-matriz` usuários.
+
+Uso:
+    python -m benchmarks.benchmark_ingestao --escalas 1e5,1e6,1e7
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_ingestao.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import salvar_dataset  # noqa: E402
+from Graph_LIB.AdjacencyListGraph import AdjacencyListGraph  # noqa: E402
+from Graph_LIB.AdjacencyMatrixGraph import AdjacencyMatrixGraph  # noqa: E402
+from Graph_LIB.GraphLIB import GrafoCSR  # noqa: E402
+from Graph_LIB.Metrics import CentralityMetrics  # noqa: E402
+from main import build_graph, load_data  # noqa: E402
+
+ESCALAS_PADRAO = [100_000, 1_000_000]
+
+
+def carga_individual(usuarios, interacoes, g=None):
+    g = AdjacencyListGraph() if g is None else g
+    for usuario in usuarios:
+        g.add_node(usuario)
+    for interacao in interacoes:
+        de, para, peso = interacao["from"], interacao["to"], interacao.get("weight", 1)
+        if g.has_edge(de, para):
+            g.set_edge_weight(de, para, g.get_edge_weight(de, para) + peso)
+        else:
+            g.add_edge(de, para)
+            g.set_edge_weight(de, para, peso)
+    return g
+
+
+def carga_lote(usuarios, interacoes):
+    g = AdjacencyListGraph()
+    g.add_nodes_from(usuarios)
+    g.add_edges_from((i["from"], i["to"], i.get("weight", 1)) for i in interacoes)
+    return g
+
+
+def conferir_matriz(usuarios, interacoes, max_vertices):
+    """Lança AssertionError se a matriz de adjacência divergir da lista de adjacência."""
+    ids = {u: i for i, u in enumerate(usuarios[:max_vertices])}
+    internas = [
+        {"from": ids[i["from"]], "to": ids[i["to"]], "weight": i.get("weight", 1)}
+        for i in interacoes if i["from"] in ids and i["to"] in ids
+    ]
+    lista = carga_individual(list(ids.values()), internas)
+    matriz = carga_individual(list(ids.values()), internas, AdjacencyMatrixGraph(len(ids)))
+
+    a, b = GrafoCSR.de_grafo(lista), GrafoCSR.de_grafo(matriz)
+    assert a.rotulos == b.rotulos and np.array_equal(a.indptr, b.indptr) \
+        and np.array_equal(a.indices, b.indices) and np.array_equal(a.pesos, b.pesos), \
+        "AdjacencyMatrixGraph congelou arestas diferentes"
+    densa = np.zeros((len(ids), len(ids)))
+    densa[a.origens(), a.indices] = a.pesos
+    assert np.array_equal(np.asarray(matriz.adj_matrix, dtype=float), densa), "adj_matrix fora de sincronia"
+    assert CentralityMetrics(lista).degree_centrality() == CentralityMetrics(matriz).degree_centrality(), \
+        "grau diferente entre os backends"
+    return len(internas)
+
+
+def rodar_escala(n, pasta, max_individual, max_vertices_matriz, seed=42):
+    caminho = os.path.join(pasta, f"sintetico_{n}.json")
+    salvar_dataset(caminho, n, seed=seed)
+
+    registros = {}
+    data, registros["load_data"] = medir(lambda: load_data(caminho), memoria=False)
+    interacoes = [i for lista in data["interactions"].values() for i in lista]
+    usuarios = data["users"]
+    conferidas = conferir_matriz(usuarios, interacoes, max_vertices_matriz)
+    print(f"  matriz x lista de adjacência: {conferidas} interações conferidas", flush=True)
+
+    if n <= max_individual:
+        individual, registros["individual"] = medir(lambda: carga_individual(usuarios, interacoes), memoria=False)
+    else:
+        individual, registros["individual"] = None, {"pulado": f"mais de {max_individual} interações"}
+    lote, registros["lote"] = medir(lambda: carga_lote(usuarios, interacoes), memoria=False)
+    _, registros["build_graph"] = medir(lambda: build_graph(usuarios, interacoes), memoria=False)
+
+    if individual is not None and (individual.edge_weights != lote.edge_weights
+                                   or individual.get_edge_count() != lote.get_edge_count()):
+        raise AssertionError("A carga em lote não produziu o mesmo grafo da carga individual.")
+
+    for nome, registro in registros.items():
+        if "pulado" in registro:
+            print(f"  {nome:<12} pulado ({registro['pulado']})", flush=True)
+        else:
+            proporcao = registro["segundos"] / max(registros["load_data"]["segundos"], 1e-9)
+            print(f"  {nome:<12} {registro['segundos']:9.3f} s  ({proporcao:5.2f}x load_data)", flush=True)
+
+    os.remove(caminho)
+    return {"interacoes": n, "arestas": lote.get_edge_count(), "etapas": registros}
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga individual x em lote no Graph_LIB.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e5,1e6)")
+    parser.add_argument("--max-individual", type=int, default=200_000,
+                        help="pula a carga individual acima disso (padrão: 2e5)")
+    parser.add_argument("--max-vertices-matriz", type=int, default=500,
+                        help="usuários na conferência da matriz de adjacência (padrão: 500)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    with tempfile.TemporaryDirectory() as pasta:
+        for n in args.escalas:
+            print(f"Escala: {n} interações", flush=True)
+            resultado["escalas"][str(n)] = rodar_escala(
+                n, pasta, args.max_individual, args.max_vertices_matriz, args.seed
+            )
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Predição de arestas em lote contra uma chamada do NetworkX por par.
+
+Para cada escala, gera interações sintéticas, monta o grafo com
+build_graph e mede:
+
+  - networkx: `nx.adamic_adar_index` (e as outras três pontuações) sobre
+    os pares a dois passos de uma amostra de origens, extrapolado para
+    todas as origens;
+  - `prever_ligacoes` com o limite de caminhos padrão, com blocos
+    pequenos (`--max-caminhos`) e com `--processos` processos.
+
+Antes de medir, confere as pontuações da amostra com as do NetworkX.
+
+Uso:
+    python -m benchmarks.benchmark_ligacoes --escalas 1e4,1e5 --processos 2
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+import networkx as nx
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_ligacoes.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from Graph_LIB.LinkPrediction import METRICAS_LIGACAO, prever_ligacoes  # noqa: E402
+from main import build_graph  # noqa: E402
+
+ESCALAS_PADRAO = [10_000, 100_000]
+FUNCOES_NX = {
+    "jaccard": nx.jaccard_coefficient,
+    "adamic_adar": nx.adamic_adar_index,
+    "resource_allocation": nx.resource_allocation_index,
+}
+
+
+def via_networkx(U, origens):
+    """As quatro pontuações dos pares a dois passos das `origens`, par a par."""
+    pares = [
+        (u, w) for u in origens
+        for w in {w for z in U[u] for w in U[z]} - set(U[u]) - {u}
+    ]
+    pontuacoes = {(u, w): {"common_neighbors": len(list(nx.common_neighbors(U, u, w)))} for u, w in pares}
+    for nome, funcao in FUNCOES_NX.items():
+        for u, w, valor in funcao(U, pares):
+            pontuacoes[(u, w)][nome] = valor
+    return pontuacoes
+
+
+def conferir(resultado, referencia):
+    """Lança AssertionError se alguma pontuação nativa divergir do NetworkX."""
+    rotulos = resultado["grafo"].rotulos
+    for i, (u, w) in enumerate(zip(resultado["origem"].tolist(), resultado["destino"].tolist())):
+        par = (rotulos[u], rotulos[w])
+        if par in referencia:
+            for nome in METRICAS_LIGACAO:
+                assert abs(resultado[nome][i] - referencia[par][nome]) < 1e-9, f"{nome} diferente em {par}"
+
+
+def rodar_escala(n, amostra, max_caminhos, processos, seed=42):
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    G = build_graph(data["users"], [i for lista in data["interactions"].values() for i in lista])
+    U = nx.Graph(G)
+    U.remove_edges_from(nx.selfloop_edges(U))
+    print(f"  {U.number_of_nodes()} vértices, {U.number_of_edges()} arestas", flush=True)
+
+    com_vizinhos = [v for v in U if U.degree(v) > 0]
+    origens = random.Random(seed).sample(com_vizinhos, min(amostra, len(com_vizinhos)))
+    referencia, tempo_nx = medir(lambda: via_networkx(U, origens), memoria=False)
+    estimado_nx = tempo_nx["segundos"] * len(com_vizinhos) / max(len(origens), 1)
+
+    registro = {"interacoes": n, "vertices": U.number_of_nodes(), "arestas": U.number_of_edges(),
+                "networkx_estimado_s": estimado_nx}
+    print(f"  networkx (estimado) {estimado_nx:9.3f} s", flush=True)
+    variantes = [
+        ("lote", {}),
+        ("blocos_pequenos", {"max_caminhos": max_caminhos}),
+        (f"processos_{processos}", {"max_caminhos": max_caminhos, "processos": processos}),
+    ]
+    for nome, opcoes in variantes:
+        resultado, tempo = medir(lambda: prever_ligacoes(G, k=10, k_global=20, **opcoes), memoria=False)
+        conferir(resultado, referencia)
+        registro[nome] = {"segundos": tempo["segundos"], "blocos": resultado["blocos"]}
+        print(f"  {nome:<19} {tempo['segundos']:9.3f} s  ({resultado['blocos']} blocos, "
+              f"{estimado_nx / max(tempo['segundos'], 1e-9):.1f}x)", flush=True)
+
+    melhor = resultado["top_global"][0] if resultado["top_global"] else None
+    if melhor is not None:
+        print(f"  melhor par: {melhor[0]} -> {melhor[1]} ({melhor[2]:.3f})", flush=True)
+    return registro
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Predição de arestas em lote x NetworkX por par.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e4,1e5)")
+    parser.add_argument("--amostra", type=int, default=200,
+                        help="origens pontuadas pelo NetworkX (padrão: 200)")
+    parser.add_argument("--max-caminhos", type=int, default=1 << 16,
+                        help="caminhos por bloco nas variantes em blocos (padrão: 65536)")
+    parser.add_argument("--processos", type=int, default=2, help="processos da variante paralela (padrão: 2)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(n, args.amostra, args.max_caminhos, args.processos, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Memória ocupada por cada representação de grafo do Graph_LIB.
+
+Para cada escala, gera interações sintéticas, carrega as mesmas arestas
+(em lote, com peso) no AdjacencyListGraph, no DynamicGraph e no
+CompactGraph, dá um rótulo a cada vértice ("bot", "mantenedor" ou
+"colaborador") e congela o grafo em GrafoCSR. Imprime o relatório de
+`memory_usage()` por estrutura e os MB por milhão de arestas.
+
+Antes de medir, confere que o CompactGraph guarda as mesmas arestas,
+pesos, pesos de vértice e rótulos do AdjacencyListGraph, e que os dois
+congelam no mesmo GrafoCSR.
+
+Uso:
+    python -m benchmarks.benchmark_memoria --escalas 1e5,1e6 -o memoria.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_memoria.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from Graph_LIB.AdjacencyListGraph import AdjacencyListGraph  # noqa: E402
+from Graph_LIB.CompactGraph import CompactGraph  # noqa: E402
+from Graph_LIB.DynamicGraph import DynamicGraph  # noqa: E402
+from Graph_LIB.GraphLIB import GrafoCSR  # noqa: E402
+
+ESCALAS_PADRAO = [100_000, 1_000_000]
+PAPEIS = ("colaborador", "mantenedor", "bot")
+
+
+def carregar(classe, usuarios, arestas):
+    g = classe()
+    g.add_nodes_from(usuarios)
+    g.add_edges_from(arestas, create_nodes=True)
+    for i, u in enumerate(list(g.vertices)):
+        g.set_vertex_weight(u, float(i % 7))
+        if isinstance(g, CompactGraph):
+            g.set_rotulo(u, PAPEIS[i % 3])
+        else:
+            g.rotulos[u] = PAPEIS[i % 3]
+    return g
+
+
+def conferir(referencia, compacto):
+    """Lança AssertionError se o CompactGraph divergir da lista de adjacência."""
+    assert list(compacto.vertices) == list(referencia.vertices), "vértices diferentes"
+    assert compacto.get_edge_count() == referencia.get_edge_count(), "contagem de arestas diferente"
+    assert compacto.edge_weights == referencia.edge_weights, "arestas ou pesos diferentes"
+    assert compacto.peso_vertice == referencia.peso_vertice, "pesos de vértice diferentes"
+    assert compacto.rotulos == referencia.rotulos, "rótulos diferentes"
+
+    a, b = GrafoCSR.de_grafo(referencia), GrafoCSR.de_grafo(compacto)
+    assert a.rotulos == b.rotulos, "GrafoCSR com vértices diferentes"
+    assert np.array_equal(a.indptr, b.indptr) and np.array_equal(a.indices, b.indices), \
+        "GrafoCSR com arestas diferentes"
+    assert np.allclose(a.pesos, b.pesos), "GrafoCSR com pesos diferentes"
+
+
+def rodar_escala(n, seed=42):
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    interacoes = [i for lista in data["interactions"].values() for i in lista]
+    arestas = [(i["from"], i["to"], i.get("weight", 1)) for i in interacoes]
+    usuarios = data["users"]
+
+    grafos = {}
+    registros = {}
+    for classe in (AdjacencyListGraph, DynamicGraph, CompactGraph):
+        grafos[classe.__name__], tempo = medir(lambda: carregar(classe, usuarios, arestas), memoria=False)
+        registros[classe.__name__] = {"carga_s": tempo["segundos"]}
+    conferir(grafos["AdjacencyListGraph"], grafos["CompactGraph"])
+    grafos["GrafoCSR"] = GrafoCSR.de_grafo(grafos["CompactGraph"])
+    registros["GrafoCSR"] = {}
+
+    m = grafos["CompactGraph"].get_edge_count()
+    print(f"  {len(grafos['CompactGraph'].vertices)} vértices, {m} arestas", flush=True)
+    for nome, g in grafos.items():
+        relatorio = g.memory_usage()
+        registros[nome].update(relatorio)
+        detalhe = ", ".join(f"{k} {v / 2**20:.1f}" for k, v in relatorio["estruturas"].items())
+        print(
+            f"  {nome:<19} {relatorio['total'] / 2**20:8.1f} MB  "
+            f"{relatorio['mb_por_milhao_de_arestas']:7.1f} MB/M arestas  ({detalhe})",
+            flush=True
+        )
+    return {"interacoes": n, "arestas": m, "grafos": registros}
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memória por representação de grafo.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e5,1e6)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(n, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
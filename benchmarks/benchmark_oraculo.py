@@ -0,0 +1,160 @@
+"""Oráculo de distâncias por marcos contra uma BFS/Dijkstra por consulta.
+
+Para cada escala, gera interações sintéticas, monta o grafo com
+build_graph e mede:
+
+  - a construção do `OraculoDistancias` (k BFS ou Dijkstra por sentido);
+  - `--consultas` pares aleatórios: tempo dos limites em lote, da
+    distância exata (busca guiada pelos marcos) e de uma busca completa
+    por consulta (`GraphLIB.bfs`/`dijkstra`), além da folga média entre
+    os limites e de quantos pares os limites já resolvem;
+  - alterações de uma aresta (remoção e inserção): quantos marcos cada
+    uma invalida e o tempo de `atualizar`;
+  - a carga do índice gravado junto com o grafo (`GraphFile`).
+
+Antes de medir, confere todas as distâncias exatas (e os limites) com a
+busca completa. Com `--pesos-fracionarios`, os pesos viram valores como
+0.1 e 0.7, cujas somas não são exatas em ponto flutuante.
+
+Uso:
+    python -m benchmarks.benchmark_oraculo --escalas 1e4,1e5 --marcos 16 --ponderado
+    python -m benchmarks.benchmark_oraculo --ponderado --pesos-fracionarios
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_oraculo.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from Graph_LIB import GraphLIB  # noqa: E402
+from Graph_LIB.DistanceOracle import OraculoDistancias  # noqa: E402
+from main import build_graph  # noqa: E402
+
+ESCALAS_PADRAO = [10_000, 100_000]
+PESOS_FRACIONARIOS = [0.1, 0.2, 0.3, 0.7, 1.1]
+
+
+def _busca_completa(g, ponderado, u, v):
+    if ponderado:
+        return float(GraphLIB.dijkstra(g, u, alvo=v)[0][v])
+    d = GraphLIB.bfs(g, u)[1][v]
+    return float(d) if d >= 0 else np.inf
+
+
+def _alteracoes(G, oraculo, quantidade, rng):
+    """Remove e reinsere arestas uma a uma, medindo a invalidação de cada uma."""
+    arestas = list(G.edges(data="weight", default=1.0))
+    invalidados = []
+    recalculo = []
+    for u, v, peso in rng.sample(arestas, min(quantidade, len(arestas))):
+        G.remove_edge(u, v)
+        invalidados.append(oraculo.registrar_alteracao(u, v, peso_antigo=peso))
+        _, tempo = medir(lambda: oraculo.atualizar(G), memoria=False)
+        recalculo.append(tempo["segundos"])
+        G.add_edge(u, v, weight=peso)
+        invalidados.append(oraculo.registrar_alteracao(u, v, peso_novo=peso))
+        oraculo.atualizar(G)
+    return {
+        "invalidados_medio": float(np.mean(invalidados)) if invalidados else 0.0,
+        "sem_invalidacao": float(np.mean(np.array(invalidados) == 0)) if invalidados else 0.0,
+        "atualizar_s": float(np.mean(recalculo)) if recalculo else 0.0,
+    }
+
+
+def rodar_escala(n, k, ponderado, consultas, seed=42, pesos_fracionarios=False):
+    rng = random.Random(seed)
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    G = build_graph(data["users"], [i for lista in data["interactions"].values() for i in lista])
+    if pesos_fracionarios:
+        for _, _, atributos in G.edges(data=True):
+            atributos["weight"] = rng.choice(PESOS_FRACIONARIOS)
+    g = GraphLIB.congelar(G)
+    print(f"  {g.n} vértices, {g.m} arestas", flush=True)
+
+    registro = {"interacoes": n, "vertices": g.n, "arestas": g.m}
+    oraculo, tempo = medir(lambda: OraculoDistancias(g, k=k, ponderado=ponderado), memoria=False)
+    registro["construcao_s"] = tempo["segundos"]
+    registro["memoria_bytes"] = oraculo.memory_usage()["total"]
+
+    pares = [(rng.choice(g.rotulos), rng.choice(g.rotulos)) for _ in range(consultas)]
+    ids = [(g.id_de(u), g.id_de(v)) for u, v in pares]
+    (inferior, superior), tempo = medir(lambda: oraculo.limites_lote(pares), memoria=False)
+    registro["limites_s"] = tempo["segundos"]
+    exatas, tempo = medir(lambda: [oraculo.distancia(u, v) for u, v in pares], memoria=False)
+    registro["exata_s"] = tempo["segundos"]
+    completas, tempo = medir(lambda: [_busca_completa(g, ponderado, u, v) for u, v in ids], memoria=False)
+    registro["busca_completa_s"] = tempo["segundos"]
+
+    exatas, completas = np.array(exatas), np.array(completas)
+    assert np.allclose(exatas, completas) or np.array_equal(exatas, completas), "distância exata diferente"
+    assert np.all(inferior <= completas + 1e-9) and np.all(completas <= superior + 1e-9), "limite violado"
+    finitas = np.isfinite(completas) & (completas > 0)
+    registro["resolvidos_pelos_limites"] = float(np.mean(inferior == superior))
+    registro["folga_media"] = float(np.mean((superior[finitas] - inferior[finitas]) / completas[finitas])) \
+        if finitas.any() else 0.0
+
+    registro["alteracoes"] = _alteracoes(G, OraculoDistancias(G, k=k, ponderado=ponderado), 20, rng)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "grafo.grafo")
+        oraculo.salvar(caminho)
+        _, tempo = medir(lambda: OraculoDistancias.de_arquivo(caminho), memoria=False)
+        registro["carga_s"] = tempo["segundos"]
+
+    por_consulta = 1e3 / max(consultas, 1)
+    print(f"  construção {registro['construcao_s']:.3f} s  ({registro['memoria_bytes'] / 2**20:.1f} MB)  "
+          f"carga do arquivo {registro['carga_s']:.4f} s", flush=True)
+    print(f"  por consulta: limites {registro['limites_s'] * por_consulta:.4f} ms  "
+          f"exata (guiada) {registro['exata_s'] * por_consulta:.3f} ms  "
+          f"busca completa {registro['busca_completa_s'] * por_consulta:.3f} ms", flush=True)
+    print(f"  resolvidos pelos limites {registro['resolvidos_pelos_limites']:.1%}  "
+          f"folga média {registro['folga_media']:.2f}", flush=True)
+    alteracoes = registro["alteracoes"]
+    print(f"  alteração de aresta: {alteracoes['invalidados_medio']:.2f} marcos invalidados em média "
+          f"({alteracoes['sem_invalidacao']:.0%} sem nenhum), atualizar {alteracoes['atualizar_s']:.4f} s",
+          flush=True)
+    return registro
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Oráculo de distâncias por marcos x busca por consulta.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e4,1e5)")
+    parser.add_argument("--marcos", type=int, default=16, help="número de marcos (padrão: 16)")
+    parser.add_argument("--ponderado", action="store_true", help="distância pelo peso (Dijkstra)")
+    parser.add_argument("--pesos-fracionarios", action="store_true",
+                        help="sorteia pesos fracionários (0.1, 0.2, 0.3, 0.7, 1.1) nas arestas")
+    parser.add_argument("--consultas", type=int, default=200, help="pares consultados (padrão: 200)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(
+            n, args.marcos, args.ponderado, args.consultas, args.seed, args.pesos_fracionarios
+        )
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
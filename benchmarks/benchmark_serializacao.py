@@ -0,0 +1,171 @@
+"""Tempo de carga do arquivo binário de grafo contra JSON e pickle.
+
+Para cada escala, grava um dataset sintético e mede quanto custa ter o
+grafo pronto na memória por cada caminho:
+
+  - json:           load_data + build_graph (o que cada execução faz hoje);
+  - pickle_nx:      pickle.load do nx.Graph montado;
+  - pickle_csr:     pickle.load do GrafoCSR;
+  - arquivo:        GraphFile.carregar (mmap, sem ler as arestas);
+  - arquivo+leitura: o mesmo, somando indices e pesos (toca todas as páginas);
+  - compact_graph:  GraphFile.carregar_grafo em um CompactGraph mutável.
+
+Antes de medir, confere as idas e voltas: nx.Graph -> arquivo ->
+GrafoCSR igual ao congelado direto; CompactGraph com pesos de vértice e
+rótulos -> arquivo -> CompactGraph igual; e `--processos` workers abrindo
+o mesmo arquivo ao mesmo tempo leem as mesmas arestas.
+
+Uso:
+    python -m benchmarks.benchmark_serializacao --escalas 1e5,1e6 --processos 4
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+from multiprocessing import Pool
+
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_serializacao.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import salvar_dataset  # noqa: E402
+from Graph_LIB import GraphFile  # noqa: E402
+from Graph_LIB.CompactGraph import CompactGraph  # noqa: E402
+from Graph_LIB.GraphLIB import GrafoCSR  # noqa: E402
+from main import build_graph, load_data  # noqa: E402
+
+ESCALAS_PADRAO = [100_000, 1_000_000]
+
+
+def _mesmo_csr(a, b):
+    return (
+        a.direcionado == b.direcionado and a.rotulos == b.rotulos
+        and np.array_equal(a.indptr, b.indptr) and np.array_equal(a.indices, b.indices)
+        and np.array_equal(a.pesos, b.pesos)
+    )
+
+
+def _resumo_worker(caminho):
+    """Executado em cada worker: abre o arquivo e resume as arestas."""
+    g = GraphFile.carregar(caminho)
+    return g.m, int(g.indices.sum()), float(g.pesos.sum())
+
+
+def conferir(G, pasta, processos):
+    """Idas e voltas pelo arquivo; lança AssertionError se algo divergir."""
+    caminho = os.path.join(pasta, "conferencia.grafo")
+
+    esperado = GrafoCSR.de_networkx(G)
+    GraphFile.salvar(G, caminho)
+    assert _mesmo_csr(GraphFile.carregar(caminho), esperado), "nx.Graph -> arquivo diferente"
+    assert _mesmo_csr(GraphFile.carregar(caminho, usar_mmap=False), esperado), "leitura sem mmap diferente"
+
+    compacto = CompactGraph()
+    compacto.add_nodes_from(G.nodes())
+    compacto.add_edges_from((u, v, d.get("weight", 1)) for u, v, d in G.edges(data=True))
+    for i, v in enumerate(list(compacto.vertices)[::3]):
+        compacto.set_vertex_weight(v, i / 2)
+        compacto.set_rotulo(v, "bot" if i % 2 else "mantenedor")
+    GraphFile.salvar(compacto, caminho, extras={"teste": np.arange(10)})
+    volta = GraphFile.carregar_grafo(caminho)
+    assert list(volta.vertices) == list(compacto.vertices), "CompactGraph: vértices diferentes"
+    assert volta.edge_weights == compacto.edge_weights, "CompactGraph: arestas diferentes"
+    assert volta.peso_vertice == compacto.peso_vertice, "CompactGraph: pesos de vértice diferentes"
+    assert volta.rotulos == compacto.rotulos, "CompactGraph: rótulos diferentes"
+    assert np.array_equal(GraphFile.abrir(caminho).extras["teste"], np.arange(10)), "bloco extra diferente"
+
+    if processos > 1:
+        local = _resumo_worker(caminho)
+        with Pool(processos) as pool:
+            resumos = pool.map(_resumo_worker, [caminho] * processos)
+        assert all(r == local for r in resumos), "workers leram arestas diferentes"
+    os.remove(caminho)
+
+
+def rodar_escala(n, pasta, processos, seed=42):
+    caminho_json = os.path.join(pasta, f"sintetico_{n}.json")
+    salvar_dataset(caminho_json, n, agregado=True, seed=seed)
+
+    def via_json():
+        data = load_data(caminho_json)
+        return build_graph(data["users"], [i for lista in data["interactions"].values() for i in lista])
+
+    registros = {}
+    G, registros["json"] = medir(via_json, memoria=False)
+    conferir(G, pasta, processos)
+
+    g = GrafoCSR.de_networkx(G)
+    caminhos = {nome: os.path.join(pasta, f"{n}.{nome}") for nome in ("nx.pkl", "csr.pkl", "grafo")}
+    with open(caminhos["nx.pkl"], "wb") as f:
+        pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(caminhos["csr.pkl"], "wb") as f:
+        pickle.dump(g, f, protocol=pickle.HIGHEST_PROTOCOL)
+    GraphFile.salvar(g, caminhos["grafo"])
+
+    def ler_pickle(caminho):
+        with open(caminho, "rb") as f:
+            return pickle.load(f)
+
+    def arquivo_lido():
+        h = GraphFile.carregar(caminhos["grafo"])
+        return int(h.indices.sum()) + float(h.pesos.sum())
+
+    _, registros["pickle_nx"] = medir(lambda: ler_pickle(caminhos["nx.pkl"]), memoria=False)
+    _, registros["pickle_csr"] = medir(lambda: ler_pickle(caminhos["csr.pkl"]), memoria=False)
+    _, registros["arquivo"] = medir(lambda: GraphFile.carregar(caminhos["grafo"]), memoria=False)
+    _, registros["arquivo+leitura"] = medir(arquivo_lido, memoria=False)
+    _, registros["compact_graph"] = medir(lambda: GraphFile.carregar_grafo(caminhos["grafo"]), memoria=False)
+
+    tamanhos = {
+        "json": os.path.getsize(caminho_json),
+        "pickle_nx": os.path.getsize(caminhos["nx.pkl"]),
+        "pickle_csr": os.path.getsize(caminhos["csr.pkl"]),
+        "arquivo": os.path.getsize(caminhos["grafo"]),
+    }
+    print(f"  {g.n} vértices, {g.m} arestas", flush=True)
+    for nome, registro in registros.items():
+        proporcao = registros["json"]["segundos"] / max(registro["segundos"], 1e-9)
+        tamanho = tamanhos.get(nome.split("+")[0])
+        texto_tamanho = f"  {tamanho / 2**20:7.2f} MB" if tamanho and "+" not in nome else ""
+        print(f"  {nome:<16} {registro['segundos']:9.4f} s  ({proporcao:7.1f}x json){texto_tamanho}",
+              flush=True)
+
+    for caminho in [caminho_json, *caminhos.values()]:
+        os.remove(caminho)
+    return {"interacoes": n, "vertices": g.n, "arestas": g.m, "etapas": registros, "bytes": tamanhos}
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga do arquivo binário de grafo x JSON e pickle.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e5,1e6)")
+    parser.add_argument("--processos", type=int, default=2,
+                        help="workers que abrem o mesmo arquivo na conferência (padrão: 2)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    with tempfile.TemporaryDirectory() as pasta:
+        for n in args.escalas:
+            print(f"Escala: {n} interações", flush=True)
+            resultado["escalas"][str(n)] = rodar_escala(n, pasta, args.processos, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Benchmark do tempo de inicialização (imports) com `python -X importtime`.
+
+Para cada módulo de entrada (main, cli, Interface.interface), roda um
+interpretador novo com `-X importtime -c "import <módulo>"` algumas
+vezes e mostra a mediana do tempo de import e do tempo total do
+processo, além dos módulos que mais pesam na última execução.
+
+Com `--menu`, mede também o tempo até a janela do menu ser desenhada
+(precisa de display).
+
+Uso:
+    python -m benchmarks.benchmark_startup
+    python -m benchmarks.benchmark_startup --repeticoes 10 --detalhes 15 -o startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS_PADRAO = ["main", "cli", "Interface.interface"]
+
+# abre o menu, desenha uma vez e sai
+CODIGO_MENU = """
+import time
+inicio = time.perf_counter()
+import tkinter as tk
+from main import load_data, build_graph, slugify
+from Interface.interface import GitHubGraphGUI
+root = tk.Tk()
+GitHubGraphGUI(root, load_data("dados_github.json"), build_graph, slugify, aquecer=False)
+root.update()
+print(time.perf_counter() - inicio)
+root.destroy()
+"""
+
+
+def ler_importtime(saida_erro):
+    """
+    Interpreta a saída de -X importtime.
+
+    :return: lista de (modulo, proprio_us, acumulado_us, nivel)
+    """
+    linhas = []
+    for linha in saida_erro.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|", 2)
+        # o nome vem indentado com dois espaços por nível (após o espaço do separador)
+        nivel = (len(nome) - len(nome.lstrip()) - 1) // 2
+        linhas.append((nome.strip(), int(proprio), int(acumulado), nivel))
+    return linhas
+
+
+def medir_modulo(modulo, repeticoes=5):
+    """Mediana do import de `modulo` (ms) e do processo inteiro (ms)."""
+    imports, totais, ultima = [], [], []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            cwd=RAIZ, capture_output=True, text=True
+        )
+        totais.append((time.perf_counter() - inicio) * 1000.0)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Falha ao importar {modulo}:\n{proc.stderr[-2000:]}")
+        ultima = ler_importtime(proc.stderr)
+        raiz = [acumulado for nome, _, acumulado, nivel in ultima if nome == modulo and nivel == 0]
+        imports.append(raiz[-1] / 1000.0 if raiz else float("nan"))
+
+    return {
+        "import_ms": statistics.median(imports),
+        "processo_ms": statistics.median(totais),
+        "modulos": len(ultima),
+        "mais_pesados": [
+            {"modulo": nome, "acumulado_ms": acumulado / 1000.0, "proprio_ms": proprio / 1000.0}
+            for nome, proprio, acumulado, _ in sorted(ultima, key=lambda x: x[2], reverse=True)
+        ],
+    }
+
+
+def medir_menu(repeticoes=3):
+    """Tempo até o menu aparecer (ms), ou None sem display."""
+    tempos = []
+    for _ in range(repeticoes):
+        proc = subprocess.run([sys.executable, "-c", CODIGO_MENU], cwd=RAIZ, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None
+        tempos.append(float(proc.stdout.strip().splitlines()[-1]) * 1000.0)
+    return statistics.median(tempos)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de inicialização dos pontos de entrada.")
+    parser.add_argument("modulos", nargs="*", default=MODULOS_PADRAO,
+                        help=f"módulos a importar (padrão: {' '.join(MODULOS_PADRAO)})")
+    parser.add_argument("--repeticoes", type=int, default=5, help="execuções por módulo (padrão: 5)")
+    parser.add_argument("--detalhes", type=int, default=8, help="módulos mais pesados mostrados (padrão: 8)")
+    parser.add_argument("--menu", action="store_true", help="mede também o tempo até o menu aparecer")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for modulo in args.modulos:
+        r = medir_modulo(modulo, args.repeticoes)
+        resultados[modulo] = r
+        print(f"{modulo}: import {r['import_ms']:.1f} ms | processo {r['processo_ms']:.1f} ms | {r['modulos']} módulos")
+        for item in r["mais_pesados"][1:args.detalhes + 1]:
+            print(f"    {item['acumulado_ms']:8.1f} ms  {item['modulo']}")
+
+    if args.menu:
+        menu = medir_menu()
+        resultados["menu_ms"] = menu
+        print("menu: sem display" if menu is None else f"menu: {menu:.1f} ms até o primeiro desenho")
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
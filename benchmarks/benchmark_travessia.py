@@ -0,0 +1,173 @@
+"""Benchmark dos percursos do Graph_LIB contra o NetworkX.
+
+Para cada escala, gera um dataset sintético, monta o grafo com
+`main.build_graph` e congela o mesmo grafo em `GrafoCSR`. Cada
+algoritmo roda nos dois a partir das mesmas origens, e os resultados
+são conferidos antes de comparar os tempos:
+
+  - bfs                   x nx.single_source_shortest_path_length
+  - bfs_multiplas_origens x nx.multi_source_dijkstra_path_length (custo 1)
+  - dfs                   x nx.dfs_preorder_nodes
+  - dijkstra              x nx.single_source_dijkstra_path_length
+  - componentes_conexos   x nx.connected_components
+  - ordem_topologica      x nx.topological_sort (arestas orientadas do
+                            menor para o maior id, para não haver ciclo)
+
+Uso:
+    python -m benchmarks.benchmark_travessia --escalas 1e4,1e5,1e6 -o travessia.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+# permite rodar também como "python benchmarks/benchmark_travessia.py"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.benchmark_escala import ambiente, medir  # noqa: E402
+from benchmarks.gerador_sintetico import gerar_dataset  # noqa: E402
+from main import build_graph  # noqa: E402
+
+ESCALAS_PADRAO = [10_000, 100_000, 1_000_000]
+
+
+def _mesmos_valores(g, valores, referencia, ignorar):
+    """Compara um array por id com o dicionário rótulo -> valor do NetworkX."""
+    obtido = g.para_rotulos(valores, ignorar)
+    return obtido.keys() == referencia.keys() and all(
+        abs(obtido[r] - referencia[r]) < 1e-9 for r in referencia
+    )
+
+
+def _mesmos_componentes(g, componente, referencia):
+    nossos = {}
+    for i, c in enumerate(componente.tolist()):
+        nossos.setdefault(c, set()).add(g.rotulos[i])
+    return sorted(map(sorted, nossos.values())) == sorted(map(sorted, referencia))
+
+
+def comparacoes(G, g, origens):
+    """Pares (nativo, networkx, confere) por algoritmo."""
+    import networkx as nx
+    from Graph_LIB import GraphLIB as lib
+
+    rotulos = [g.rotulos[i] for i in origens]
+    custo_unitario = lambda u, v, d: 1  # noqa: E731
+
+    # DAG com as mesmas arestas, orientadas do menor para o maior id
+    u, v = g.origens(), g.indices
+    frente = u < v
+    dag = lib.GrafoCSR.de_arrays(g.n, u[frente], v[frente], g.pesos[frente], g.rotulos, direcionado=True)
+    D = nx.DiGraph()
+    D.add_nodes_from(G.nodes())
+    D.add_edges_from((g.rotulos[a], g.rotulos[b]) for a, b in zip(u[frente].tolist(), v[frente].tolist()))
+
+    def topologica_valida(ordem):
+        posicao = np.empty(g.n, dtype=np.int64)
+        posicao[ordem] = np.arange(len(ordem))
+        return len(ordem) == g.n and bool(np.all(posicao[u[frente]] < posicao[v[frente]]))
+
+    return {
+        "bfs": (
+            lambda: [lib.bfs(g, s)[1] for s in origens],
+            lambda: [nx.single_source_shortest_path_length(G, r) for r in rotulos],
+            lambda a, b: all(_mesmos_valores(g, x, y, -1) for x, y in zip(a, b)),
+        ),
+        "bfs_multiplas_origens": (
+            lambda: lib.bfs_multiplas_origens(g, origens)[0],
+            lambda: nx.multi_source_dijkstra_path_length(G, set(rotulos), weight=custo_unitario),
+            lambda a, b: _mesmos_valores(g, a, b, -1),
+        ),
+        "dfs": (
+            lambda: [lib.dfs(g, s)[0] for s in origens],
+            lambda: [list(nx.dfs_preorder_nodes(G, r)) for r in rotulos],
+            lambda a, b: all({g.rotulos[i] for i in x} == set(y) for x, y in zip(a, b)),
+        ),
+        "dijkstra": (
+            lambda: [lib.dijkstra(g, s)[0] for s in origens],
+            lambda: [nx.single_source_dijkstra_path_length(G, r) for r in rotulos],
+            lambda a, b: all(_mesmos_valores(g, x, y, np.inf) for x, y in zip(a, b)),
+        ),
+        "componentes_conexos": (
+            lambda: lib.componentes_conexos(g)[0],
+            lambda: list(nx.connected_components(G)),
+            lambda a, b: _mesmos_componentes(g, a, b),
+        ),
+        "ordem_topologica": (
+            lambda: lib.ordem_topologica(dag),
+            lambda: list(nx.topological_sort(D)),
+            lambda a, b: topologica_valida(a) and len(b) == g.n,
+        ),
+    }
+
+
+def rodar_escala(n, origens=5, seed=42):
+    from Graph_LIB.GraphLIB import GrafoCSR
+
+    data = gerar_dataset(n, agregado=True, seed=seed)
+    interacoes = [i for lista in data["interactions"].values() for i in lista]
+    G = build_graph(data["users"], interacoes)
+    g, congelar = medir(lambda: GrafoCSR.de_networkx(G), memoria=False)
+    print(f"  {g.n} vértices, {g.m} arestas; congelar: {congelar['segundos']:.3f} s", flush=True)
+
+    # origens entre os vértices de maior grau, para percorrer o componente principal
+    escolhidas = np.argsort(-g.graus(), kind="stable")[:origens].tolist()
+    registros = {"congelar": congelar}
+    for nome, (nativo, referencia, confere) in comparacoes(G, g, escolhidas).items():
+        a, tempo_nativo = medir(nativo, memoria=False)
+        b, tempo_nx = medir(referencia, memoria=False)
+        registro = {
+            "graph_lib_s": tempo_nativo["segundos"],
+            "networkx_s": tempo_nx["segundos"],
+            "aceleracao": tempo_nx["segundos"] / max(tempo_nativo["segundos"], 1e-9),
+            "confere": bool(confere(a, b)),
+        }
+        registros[nome] = registro
+        marca = "" if registro["confere"] else "  <-- RESULTADOS DIFERENTES"
+        print(
+            f"  {nome:<22} {registro['graph_lib_s']:9.3f} s  nx {registro['networkx_s']:9.3f} s"
+            f"  {registro['aceleracao']:6.1f}x{marca}",
+            flush=True
+        )
+
+    return {"interacoes": n, "vertices": g.n, "arestas": g.m, "etapas": registros}
+
+
+def _escalas(texto):
+    return [int(float(t)) for t in texto.split(",") if t.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Percursos do Graph_LIB x NetworkX.")
+    parser.add_argument("--escalas", type=_escalas, default=ESCALAS_PADRAO,
+                        help="interações por escala, separadas por vírgula (padrão: 1e4,1e5,1e6)")
+    parser.add_argument("--origens", type=int, default=5,
+                        help="origens por algoritmo de fonte única (padrão: 5)")
+    parser.add_argument("-o", "--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    resultado = {"versao": 1, "ambiente": ambiente(), "escalas": {}}
+    for n in args.escalas:
+        print(f"Escala: {n} interações", flush=True)
+        resultado["escalas"][str(n)] = rodar_escala(n, args.origens, args.seed)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Resultados salvos em: {args.saida}")
+
+    divergentes = [
+        (escala, nome)
+        for escala, dados in resultado["escalas"].items()
+        for nome, registro in dados["etapas"].items()
+        if registro.get("confere") is False
+    ]
+    return 1 if divergentes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""Gerador de datasets sintéticos no formato de data_collection.py.
+
+Produz interações de GitHub com características parecidas com as de um
+repositório real, para testar o comportamento em 10^5–10^7 interações:
+  - atividade dos usuários com cauda pesada (lei de potência): poucos
+    usuários aparecem em muitas interações, a maioria em poucas;
+  - mantenedores que concentram fechamentos, revisões e merges (hubs);
+  - proporção entre os tipos de interação igual à de dados_github.json
+    (ou de outro dataset real, com `proporcoes_de`);
+  - pesos e nomes de tipo iguais aos da coleta.
+
+Os vértices são sorteados com NumPy em lotes, e `salvar_dataset` grava
+o JSON em partes, sem montar a lista inteira de interações na memória.
+
+Uso:
+    python -m benchmarks.gerador_sintetico 1000000 -o sintetico_1M.json
+    python -m benchmarks.gerador_sintetico 10000000 --agregado -o sintetico_10M.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# proporções de dados_github.json (fastapi/fastapi): 107, 57, 26, 54 e 21 interações
+PROPORCOES = {
+    "comentario_em_issues": 107 / 265,
+    "fechamento_de_issues": 57 / 265,
+    "comentario_pull_request": 26 / 265,
+    "revisoes_pull_request": 54 / 265,
+    "merge_pull_request": 21 / 265,
+}
+
+# tipo e peso gravados pela coleta (None = sem chave "weight", peso 1)
+TIPOS = {
+    "comentario_em_issues": ("comentario_issue", 2),
+    "fechamento_de_issues": ("fechamento_de_issue", None),
+    "comentario_pull_request": ("comentario em pull request", 2),
+    "revisoes_pull_request": ("revisao de pull request", 4),
+    "merge_pull_request": ("merge_pull_request", 5),
+}
+
+# chance de quem age ser um mantenedor, por tipo de interação
+PARTICIPACAO_MANTENEDORES = {
+    "comentario_em_issues": 0.3,
+    "fechamento_de_issues": 0.85,
+    "comentario_pull_request": 0.5,
+    "revisoes_pull_request": 0.75,
+    "merge_pull_request": 0.97,
+}
+
+LOTE = 200_000
+
+
+def proporcoes_de(caminho):
+    """Proporções entre os tipos de interação de um dataset real."""
+    with open(caminho, "r") as f:
+        data = json.load(f)
+    contagens = {
+        chave: sum(i.get("count", 1) for i in data["interactions"].get(chave, []))
+        for chave in PROPORCOES
+    }
+    total = sum(contagens.values())
+    if total == 0:
+        raise ValueError(f"Dataset sem interações: {caminho}")
+    return {chave: c / total for chave, c in contagens.items()}
+
+
+def usuarios_padrao(n_interacoes):
+    """Número de usuários para um volume de interações (crescimento sublinear)."""
+    return max(20, int(n_interacoes ** 0.75))
+
+
+class GeradorSintetico:
+    """Sorteia interações por tipo a partir de uma população de usuários."""
+
+    def __init__(
+        self,
+        n_interacoes,
+        n_usuarios=None,
+        expoente=2.1,
+        frac_mantenedores=0.01,
+        proporcoes=None,
+        dias=365,
+        seed=42
+    ):
+        """
+        :param expoente: expoente da lei de potência da atividade (> 1).
+        :param frac_mantenedores: fração dos usuários que são mantenedores.
+        :param proporcoes: chave de interação -> fração (padrão: PROPORCOES).
+        :param dias: período coberto pelos timestamps, até a data atual.
+        """
+        self.n_interacoes = int(n_interacoes)
+        self.n_usuarios = int(n_usuarios or usuarios_padrao(self.n_interacoes))
+        self.proporcoes = proporcoes or PROPORCOES
+        self.dias = dias
+        self.rng = np.random.default_rng(seed)
+
+        n = self.n_usuarios
+        self.usuarios = [f"dev{i:07d}" for i in range(n)]
+
+        # atividade com cauda de Pareto; os mais ativos viram mantenedores
+        atividade = self.rng.pareto(expoente - 1, n) + 1.0
+        self.p_atividade = atividade / atividade.sum()
+        n_mant = max(2, int(n * frac_mantenedores))
+        self.mantenedores = np.argsort(-atividade)[:n_mant]
+        peso_mant = atividade[self.mantenedores]
+        self.p_mantenedores = peso_mant / peso_mant.sum()
+
+        self.fim = datetime.now().replace(microsecond=0)
+
+    def quantidades(self):
+        """Interações por tipo, somando exatamente n_interacoes."""
+        chaves = list(self.proporcoes)
+        fracoes = np.array([self.proporcoes[c] for c in chaves], dtype=float)
+        fracoes /= fracoes.sum()
+        qtd = np.floor(fracoes * self.n_interacoes).astype(np.int64)
+        # distribui o resto pelas maiores partes fracionárias
+        resto = self.n_interacoes - int(qtd.sum())
+        for i in np.argsort(-(fracoes * self.n_interacoes - qtd))[:resto]:
+            qtd[i] += 1
+        return dict(zip(chaves, qtd.tolist()))
+
+    def sortear(self, chave, n):
+        """Índices (de, para) e segundos desde o início do período."""
+        rng = self.rng
+        de = rng.choice(self.n_usuarios, size=n, p=self.p_atividade)
+        usa_mant = rng.random(n) < PARTICIPACAO_MANTENEDORES.get(chave, 0.0)
+        k = int(usa_mant.sum())
+        if k:
+            de[usa_mant] = self.mantenedores[rng.choice(len(self.mantenedores), size=k, p=self.p_mantenedores)]
+
+        para = rng.choice(self.n_usuarios, size=n, p=self.p_atividade)
+        # ninguém interage consigo mesmo: desloca para o próximo usuário
+        iguais = para == de
+        para[iguais] = (para[iguais] + 1) % self.n_usuarios
+
+        segundos = np.sort(rng.integers(0, self.dias * 86400, size=n))
+        return de, para, segundos
+
+    def lotes(self, chave, n):
+        """Gera as interações de um tipo em lotes de até LOTE itens."""
+        for inicio in range(0, n, LOTE):
+            yield self.sortear(chave, min(LOTE, n - inicio))
+
+    def _instantes(self, segundos):
+        """Segundos desde o início do período -> datas ISO (vetorizado)."""
+        inicio = np.datetime64(self.fim - timedelta(days=self.dias), "s")
+        return (inicio + segundos.astype("timedelta64[s]")).astype(str).tolist()
+
+    def registros(self, chave, de, para, segundos):
+        """Converte um lote em dicionários no formato bruto da coleta."""
+        tipo, peso = TIPOS[chave]
+        usuarios = self.usuarios
+        for d, p, quando in zip(de.tolist(), para.tolist(), self._instantes(segundos)):
+            registro = {"from": usuarios[d], "to": usuarios[p], "type": tipo, "timestamp": quando}
+            if peso is not None:
+                registro["weight"] = peso
+            yield registro
+
+    def agregados(self, chave, n):
+        """Interações de um tipo no formato agregado (uma por par)."""
+        tipo, peso = TIPOS[chave]
+        peso = 1 if peso is None else peso
+        partes = list(self.lotes(chave, n))
+        if not partes:
+            return []
+        de = np.concatenate([p[0] for p in partes])
+        para = np.concatenate([p[1] for p in partes])
+        segundos = np.concatenate([p[2] for p in partes])
+
+        codigo = de.astype(np.int64) * self.n_usuarios + para
+        ordem = np.argsort(codigo, kind="stable")
+        pares, inicios, contagens = np.unique(codigo[ordem], return_index=True, return_counts=True)
+        primeiro = np.minimum.reduceat(segundos[ordem], inicios)
+        ultimo = np.maximum.reduceat(segundos[ordem], inicios)
+
+        usuarios = self.usuarios
+        return [
+            {
+                "from": usuarios[c // self.n_usuarios],
+                "to": usuarios[c % self.n_usuarios],
+                "type": tipo,
+                "count": q,
+                "weight": q * peso,
+                "first": f,
+                "last": u,
+            }
+            for c, q, f, u in zip(
+                pares.tolist(), contagens.tolist(), self._instantes(primeiro), self._instantes(ultimo)
+            )
+        ]
+
+    def cabecalho(self, agregado=False):
+        return {
+            "repository": f"sintetico/{self.n_interacoes}",
+            "data_collection_date": self.fim.isoformat(),
+            "format": "agregado" if agregado else "bruto",
+            "users": self.usuarios,
+        }
+
+
+def gerar_dataset(n_interacoes, agregado=False, **opcoes):
+    """Dataset completo em memória (mesmo formato de load_data)."""
+    gerador = GeradorSintetico(n_interacoes, **opcoes)
+    data = gerador.cabecalho(agregado)
+    data["interactions"] = {}
+    for chave, n in gerador.quantidades().items():
+        if agregado:
+            data["interactions"][chave] = gerador.agregados(chave, n)
+        else:
+            data["interactions"][chave] = [
+                r for lote in gerador.lotes(chave, n) for r in gerador.registros(chave, *lote)
+            ]
+    return data
+
+
+def salvar_dataset(caminho, n_interacoes, agregado=False, **opcoes):
+    """Grava o dataset em partes (a memória não cresce com as interações brutas)."""
+    gerador = GeradorSintetico(n_interacoes, **opcoes)
+    cabecalho = json.dumps(gerador.cabecalho(agregado), ensure_ascii=False)
+
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(cabecalho[:-1] + ', "interactions": {')
+        for i, (chave, n) in enumerate(gerador.quantidades().items()):
+            f.write(("" if i == 0 else ", ") + json.dumps(chave) + ": [")
+            if agregado:
+                itens = iter(gerador.agregados(chave, n))
+            else:
+                itens = (r for lote in gerador.lotes(chave, n) for r in gerador.registros(chave, *lote))
+            for j, registro in enumerate(itens):
+                f.write(("" if j == 0 else ", ") + json.dumps(registro, ensure_ascii=False))
+            f.write("]")
+        f.write("}}")
+
+    return caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um dataset sintético de interações do GitHub.")
+    parser.add_argument("interacoes", type=float, help="número de interações (ex.: 1e6)")
+    parser.add_argument("-o", "--saida", default=None, help="arquivo de saída (padrão: sintetico_<n>.json)")
+    parser.add_argument("--usuarios", type=int, default=None, help="número de usuários (padrão: n^0.75)")
+    parser.add_argument("--expoente", type=float, default=2.1, help="expoente da lei de potência (padrão: 2.1)")
+    parser.add_argument("--mantenedores", type=float, default=0.01, help="fração de mantenedores (padrão: 0.01)")
+    parser.add_argument("--proporcoes-de", default=None, help="copia as proporções de tipos de um dataset real")
+    parser.add_argument("--agregado", action="store_true", help="grava no formato agregado")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    n = int(args.interacoes)
+    caminho = args.saida or f"sintetico_{n}.json"
+    salvar_dataset(
+        caminho,
+        n,
+        agregado=args.agregado,
+        n_usuarios=args.usuarios,
+        expoente=args.expoente,
+        frac_mantenedores=args.mantenedores,
+        proporcoes=proporcoes_de(args.proporcoes_de) if args.proporcoes_de else None,
+        seed=args.seed,
+    )
+    print(f"✓ Dataset salvo em: {caminho} ({os.path.getsize(caminho) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
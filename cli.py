@@ -0,0 +1,418 @@
+"""Relatórios sem interface gráfica (modo headless).
+
+Roda em servidores sem display: não importa tkinter nem backends
+interativos do matplotlib (as figuras usam `Figure` + Agg direto).
+
+Para um dataset gerado por data_collection.py:
+  - constrói os grafos de cada camada (CAMADAS de main.py);
+  - calcula as métricas de CentralityMetrics por vértice e o resumo
+    geral (mesmas somas/médias de resumo_geral_grafos);
+  - roda o pipeline de comunidades (comunidades + bridging ties) no
+    grafo com todas as interações;
+  - grava resumo.json, tabelas por vértice (CSV e/ou Parquet) e,
+    opcionalmente, os PNGs dos grafos e a tabela de revisores sugeridos
+    (Graph_LIB.LinkPrediction).
+
+Uso:
+    python cli.py dados_github.json --saida relatorios --png --tempos
+    python cli.py dados_github.json --metricas degree,pagerank --sem-comunidades
+    python cli.py dados_github.json --poda kcore --k-nucleo 2
+    python cli.py dados_github.json --por-componente --processos 4
+    python cli.py dados_github.json --closeness-aproximado --memoria-hll 32
+    python cli.py dados_github.json --direcionado --metricas pagerank,hub,authority,reciprocity
+    python cli.py dados_github.json --revisores 5
+    python main.py --headless dados_github.json ...
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from main import build_graph, interacoes_por_camada, load_data, slugify
+from Graph_LIB.Profiler import Profiler, etapa
+
+FORMATOS = ["json", "csv", "parquet"]
+
+# mesmas cores da interface gráfica
+CORES = {
+    "Comentários em Issues": "skyblue",
+    "Fechamento de Issues": "lightgreen",
+    "Pull Requests": "lightcoral",
+}
+
+
+class Cronometro:
+    """Mede o tempo de cada etapa para o resumo final."""
+
+    def __init__(self):
+        self.etapas = []
+
+    @contextmanager
+    def etapa(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.etapas.append((nome, time.perf_counter() - inicio))
+
+    def como_dict(self):
+        return {nome: segundos for nome, segundos in self.etapas}
+
+    def texto(self):
+        largura = max((len(nome) for nome, _ in self.etapas), default=0)
+        linhas = [f"  {nome:<{largura}}  {segundos:8.3f} s" for nome, segundos in self.etapas]
+        total = sum(segundos for _, segundos in self.etapas)
+        linhas.append(f"  {'total':<{largura}}  {total:8.3f} s")
+        return "Tempos por etapa:\n" + "\n".join(linhas)
+
+
+# ---------- análise ----------
+
+def analisar(data, metricas=None, comunidades=True, cronometro=None, poda=None, k_nucleo=2,
+             por_componente=False, processos=1, modo_closeness="exact", memoria_mb=64.0,
+             direcionado=False):
+    """
+    Calcula todos os relatórios de um dataset já carregado.
+
+    :param metricas: subconjunto de METRICAS e METRICAS_DIRECIONADAS
+        (padrão: todas as de METRICAS, mais as direcionadas com `direcionado`).
+    :param comunidades: roda o pipeline de comunidades.
+    :param poda: calcula betweenness e closeness só no k-core ("kcore")
+        ou no maior componente ("maior_componente"); ver CentralityMetrics.
+    :param k_nucleo: k do k-core com poda="kcore".
+    :param por_componente: betweenness e closeness componente a componente,
+        pulando os vértices isolados (mesmo resultado).
+    :param processos: processos por componente grande (com por_componente).
+    :param modo_closeness: "exact" ou "approx" (HyperANF).
+    :param memoria_mb: memória dos contadores HyperLogLog no modo "approx".
+    :param direcionado: grafos das camadas com o sentido das interações
+        (nx.DiGraph); o pipeline de comunidades continua não direcionado.
+    :return: dicionário com "repository", "camadas" (grafo, valores por
+        vértice e resumo de cada camada, e a reciprocidade global com
+        `direcionado`), "media_geral" e, se pedido, "comunidades".
+    """
+    from Graph_LIB.Metrics import (
+        METRICAS, METRICAS_DIRECIONADAS, CentralityMetrics, media_geral_grafos, resumir_metricas
+    )
+
+    cronometro = cronometro or Cronometro()
+    usuarios = data["users"]
+    por_camada = interacoes_por_camada(data)
+    if direcionado and metricas is None:
+        metricas = METRICAS + METRICAS_DIRECIONADAS
+
+    resultado = {
+        "repository": data.get("repository", "repositório-desconhecido"),
+        "camadas": {},
+    }
+
+    for nome, interacoes in por_camada.items():
+        # como no relatório geral da interface: camadas vazias ficam de fora
+        if not interacoes:
+            continue
+        with cronometro.etapa(f"grafo: {nome}"):
+            G = build_graph(usuarios, interacoes, direcionado=direcionado)
+        with cronometro.etapa(f"métricas: {nome}"):
+            cm = CentralityMetrics(
+                G, poda=poda, k_nucleo=k_nucleo, por_componente=por_componente, processos=processos,
+                modo_closeness=modo_closeness, memoria_mb=memoria_mb
+            )
+            valores = cm.compute_all(metricas=metricas)
+        resultado["camadas"][nome] = {
+            "grafo": G,
+            "valores": valores,
+            "resumo": resumir_metricas(valores),
+        }
+        if direcionado:
+            resultado["camadas"][nome]["reciprocidade_global"] = cm.overall_reciprocity()
+
+    individuais = [(nome, camada["resumo"]) for nome, camada in resultado["camadas"].items()]
+    resultado["media_geral"] = media_geral_grafos(individuais, metricas)
+
+    todas = [i for interacoes in por_camada.values() for i in interacoes]
+    if comunidades and todas:
+        from Metrics.CommunityMetrics import CommunityMetrics
+
+        with cronometro.etapa("grafo: todas as interações"):
+            G = build_graph(usuarios, todas)
+        cm = CommunityMetrics(G)
+        with cronometro.etapa("comunidades"):
+            info = cm.detectar_comunidades()
+        with cronometro.etapa("bridging ties"):
+            bridging = cm.bridging_ties()
+        info["bridging"] = bridging
+        resultado["comunidades"] = info
+
+    return resultado
+
+
+# ---------- saídas ----------
+
+def _resumo_json(resultado, cronometro, top=10):
+    from Graph_LIB.TopK import top_k
+
+    camadas = {}
+    for nome, camada in resultado["camadas"].items():
+        G = camada["grafo"]
+        camadas[nome] = {
+            "vertices": G.number_of_nodes(),
+            "arestas": G.number_of_edges(),
+            "resumo": camada["resumo"],
+            "top": {met: top_k(valores, top) for met, valores in camada["valores"].items()},
+        }
+        if "reciprocidade_global" in camada:
+            camadas[nome]["reciprocidade_global"] = camada["reciprocidade_global"]
+
+    saida = {
+        "repository": resultado["repository"],
+        "camadas": camadas,
+        "media_geral": resultado["media_geral"],
+    }
+
+    info = resultado.get("comunidades")
+    if info is not None:
+        saida["comunidades"] = {
+            "modularidade": info["modularidade"],
+            "num_comunidades": info["num_comunidades"],
+            "tamanho_comunidades": info["tamanho_comunidades"],
+            "top_bridging": top_k(info["bridging"], top),
+        }
+
+    saida["tempos"] = cronometro.como_dict()
+    return saida
+
+
+def escrever_tabela(caminho_base, colunas, linhas, formatos):
+    """Grava a tabela como CSV e/ou Parquet; devolve os arquivos gerados."""
+    gerados = []
+    if "csv" in formatos:
+        caminho = caminho_base + ".csv"
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(colunas)
+            writer.writerows(linhas)
+        gerados.append(caminho)
+
+    if "parquet" in formatos:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        caminho = caminho_base + ".parquet"
+        tabela = pa.table({col: [linha[i] for linha in linhas] for i, col in enumerate(colunas)})
+        pq.write_table(tabela, caminho)
+        gerados.append(caminho)
+
+    return gerados
+
+
+def escrever_saidas(resultado, pasta, formatos, cronometro):
+    """Grava resumo.json e as tabelas por vértice em `pasta`."""
+    os.makedirs(pasta, exist_ok=True)
+    gerados = []
+
+    for nome, camada in resultado["camadas"].items():
+        valores = camada["valores"]
+        colunas = ["vertice"] + list(valores)
+        linhas = [
+            [str(v)] + [valores[met].get(str(v), 0.0) for met in valores]
+            for v in camada["grafo"].nodes()
+        ]
+        gerados += escrever_tabela(
+            os.path.join(pasta, "metricas_" + slugify(nome)), colunas, linhas, formatos
+        )
+
+    info = resultado.get("comunidades")
+    if info is not None:
+        linhas = [
+            [str(v), idx, info["bridging"].get(v, 0.0)]
+            for idx, com in enumerate(info["comunidades"])
+            for v in com
+        ]
+        gerados += escrever_tabela(
+            os.path.join(pasta, "comunidades"), ["vertice", "comunidade", "bridging"], linhas, formatos
+        )
+
+    if "json" in formatos:
+        caminho = os.path.join(pasta, "resumo.json")
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(_resumo_json(resultado, cronometro), f, ensure_ascii=False, indent=2)
+        gerados.append(caminho)
+
+    return gerados
+
+
+def renderizar_png(G, titulo, cor, caminho, layout_cache=None):
+    """Desenha o grafo com o renderizador LOD em uma figura Agg (sem display)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from Interface.GraphRenderer import LODRenderer
+    from Interface.LayoutEngine import calcular_layout
+
+    pos = calcular_layout(G, cache=layout_cache, chave=titulo)
+
+    with etapa("render") as registro:
+        registro.itens = G.number_of_nodes()
+        fig = Figure(figsize=(7, 5))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        LODRenderer(ax, G, pos, cor=cor)
+        ax.set_title(titulo)
+        fig.tight_layout()
+    with etapa("salvar_png"):
+        fig.savefig(caminho, dpi=150, bbox_inches="tight")
+
+
+# ---------- linha de comando ----------
+
+def lista_opcoes(texto, validos, nome):
+    itens = [t.strip() for t in texto.split(",") if t.strip()]
+    invalidos = [t for t in itens if t not in validos]
+    if invalidos:
+        raise argparse.ArgumentTypeError(
+            f"{nome} desconhecido(s): {', '.join(invalidos)} (opções: {', '.join(validos)})"
+        )
+    return itens
+
+
+def _metricas(texto):
+    # Graph_LIB.Metrics (networkx) só é importado se a opção for usada
+    from Graph_LIB.Metrics import METRICAS, METRICAS_DIRECIONADAS
+    return lista_opcoes(texto, METRICAS + METRICAS_DIRECIONADAS, "métrica")
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(
+        description="Relatórios dos grafos de colaboração sem interface gráfica."
+    )
+    parser.add_argument("dataset", nargs="?", default="dados_github.json",
+                        help="JSON gerado por data_collection.py (padrão: dados_github.json)")
+    parser.add_argument("-o", "--saida", default="relatorios",
+                        help="pasta de saída (padrão: relatorios)")
+    parser.add_argument("--metricas", default=None, type=_metricas,
+                        help="degree, betweenness, closeness, pagerank e (com --direcionado) in_strength, "
+                             "out_strength, hub, authority, reciprocity, separadas por vírgula (padrão: todas)")
+    parser.add_argument("--poda", choices=["kcore", "maior_componente"], default=None,
+                        help="calcula betweenness e closeness só no k-core ou no maior componente "
+                             "(vértices podados ficam com 0)")
+    parser.add_argument("--k-nucleo", type=int, default=2,
+                        help="k do k-core mantido com --poda kcore (padrão: 2)")
+    parser.add_argument("--por-componente", action="store_true",
+                        help="calcula betweenness e closeness por componente, pulando vértices isolados")
+    parser.add_argument("--processos", type=int, default=1,
+                        help="processos por componente grande com --por-componente (padrão: 1)")
+    parser.add_argument("--direcionado", action="store_true",
+                        help="grafos com o sentido das interações; inclui hub, authority, "
+                             "in/out_strength e reciprocity")
+    parser.add_argument("--closeness-aproximado", action="store_true",
+                        help="closeness aproximado por HyperANF (contadores HyperLogLog, sem pesos)")
+    parser.add_argument("--memoria-hll", type=float, default=64.0, metavar="MB",
+                        help="memória dos contadores com --closeness-aproximado (padrão: 64)")
+    parser.add_argument("--revisores", type=int, default=0, metavar="K",
+                        help="grava os K revisores mais prováveis de cada autor (revisores.csv)")
+    parser.add_argument("--formatos", default="json,csv",
+                        type=lambda t: lista_opcoes(t, FORMATOS, "formato"),
+                        help="json, csv e/ou parquet, separados por vírgula (padrão: json,csv)")
+    parser.add_argument("--png", action="store_true",
+                        help="salva o desenho de cada grafo em PNG")
+    parser.add_argument("--sem-comunidades", action="store_true",
+                        help="não roda detecção de comunidades nem bridging ties")
+    parser.add_argument("--agregar", action="store_true",
+                        help="agrega interações brutas ao carregar (ver load_data)")
+    parser.add_argument("--tempos", action="store_true",
+                        help="mostra o tempo de cada etapa ao final")
+    parser.add_argument("--perfil", metavar="TRACE_JSON", default=None,
+                        help="instrumenta as etapas (tempo, CPU, memória, itens) e grava um Chrome trace")
+    return parser
+
+
+def _executar(args, cronometro):
+    with cronometro.etapa("carregar dataset"):
+        data = load_data(args.dataset, agregar=args.agregar)
+
+    resultado = analisar(
+        data,
+        metricas=args.metricas,
+        comunidades=not args.sem_comunidades,
+        cronometro=cronometro,
+        poda=args.poda,
+        k_nucleo=args.k_nucleo,
+        por_componente=args.por_componente,
+        processos=args.processos,
+        modo_closeness="approx" if args.closeness_aproximado else "exact",
+        memoria_mb=args.memoria_hll,
+        direcionado=args.direcionado
+    )
+
+    if args.png:
+        from Interface.LayoutEngine import LayoutCache
+
+        os.makedirs(args.saida, exist_ok=True)
+        cache = LayoutCache.para_dataset(args.dataset)
+        for nome, camada in resultado["camadas"].items():
+            titulo = f"Grafo: {nome} — {resultado['repository']}"
+            caminho = os.path.join(args.saida, slugify(titulo) + ".png")
+            with cronometro.etapa(f"png: {nome}"):
+                renderizar_png(camada["grafo"], titulo, CORES.get(nome, "skyblue"), caminho, cache)
+            print(f"✓ Figura salva em: {caminho}")
+
+    gerados = []
+    if args.revisores > 0:
+        from Graph_LIB.LinkPrediction import recomendar_revisores
+
+        # antes de gravar resumo.json, para o tempo da etapa entrar em "tempos"
+        with cronometro.etapa("revisores"):
+            sugestoes = recomendar_revisores(data, k=args.revisores, processos=args.processos)
+            linhas = [
+                [str(autor), posicao, str(revisor), pontuacao]
+                for autor, lista in sugestoes.items()
+                for posicao, (revisor, pontuacao) in enumerate(lista, 1)
+            ]
+            os.makedirs(args.saida, exist_ok=True)
+            gerados += escrever_tabela(
+                os.path.join(args.saida, "revisores"), ["autor", "posicao", "revisor", "pontuacao"],
+                linhas, args.formatos
+            )
+
+    with cronometro.etapa("gravar saídas"):
+        gerados += escrever_saidas(resultado, args.saida, args.formatos, cronometro)
+    for caminho in gerados:
+        print(f"✓ Arquivo salvo em: {caminho}")
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+
+    if "parquet" in args.formatos:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("Erro: a saída parquet requer o pacote pyarrow.", file=sys.stderr)
+            return 2
+
+    cronometro = Cronometro()
+    profiler = Profiler() if args.perfil else None
+    if profiler is not None:
+        profiler.iniciar()
+    try:
+        _executar(args, cronometro)
+    finally:
+        if profiler is not None:
+            profiler.parar()
+
+    if args.tempos:
+        print("\n" + cronometro.texto())
+
+    if profiler is not None:
+        print("\n" + profiler.texto())
+        profiler.salvar_chrome_trace(args.perfil)
+        print(f"✓ Trace salvo em: {args.perfil}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,15 @@ LIMIT_ISSUES_ALL = 100
 LIMIT_ISSUES_CLOSED = 100
 LIMIT_PRS_ALL = 100
 
+# Formato de saída:
+#   "bruto"    -> uma entrada por interação, com o instante do evento em "timestamp"
+#   "agregado" -> interações combinadas em (from, to, type) durante a coleta,
+#                 com contagem, peso total e primeiro/último instante
+MODO_SAIDA = os.getenv("MODO_SAIDA", "bruto")
+
+if MODO_SAIDA not in ("bruto", "agregado"):
+    raise ValueError("MODO_SAIDA inválido. Use 'bruto' ou 'agregado'.")
+
 interactions = {
     "comentario_em_issues": [],
     "fechamento_de_issues": [],
@@ -30,8 +39,76 @@ interactions = {
     "merge_pull_request": []
 }
 
+# (from, to, type) -> {"count", "weight", "first", "last"} por tipo de interação
+agregados = {chave: {} for chave in interactions}
+
 users_set = set()
 
+
+def registrar_interacao(chave, de, para, tipo, peso=None, quando=None):
+    """Registra uma interação no formato escolhido em MODO_SAIDA.
+
+    No modo agregado, interações repetidas entre o mesmo par e do mesmo
+    tipo apenas incrementam a contagem e o peso total do grupo.
+    """
+    if MODO_SAIDA == "agregado":
+        grupo = agregados[chave].get((de, para, tipo))
+        if grupo is None:
+            agregados[chave][(de, para, tipo)] = {
+                "count": 1,
+                "weight": peso if peso is not None else 1,
+                "first": quando,
+                "last": quando
+            }
+            return
+
+        grupo["count"] += 1
+        grupo["weight"] += peso if peso is not None else 1
+        if quando is not None:
+            if grupo["first"] is None or quando < grupo["first"]:
+                grupo["first"] = quando
+            if grupo["last"] is None or quando > grupo["last"]:
+                grupo["last"] = quando
+        return
+
+    registro = {}
+    if peso is not None:
+        registro["weight"] = peso
+    registro["from"] = de
+    registro["to"] = para
+    registro["type"] = tipo
+    registro["timestamp"] = quando.isoformat() if quando else None
+    interactions[chave].append(registro)
+
+
+def total_interacoes(chave):
+    """Quantidade de interações coletadas de um tipo (em qualquer formato)."""
+    if MODO_SAIDA == "agregado":
+        return sum(grupo["count"] for grupo in agregados[chave].values())
+    return len(interactions[chave])
+
+
+def interacoes_saida():
+    """Monta o dicionário de interações que será gravado no JSON."""
+    if MODO_SAIDA != "agregado":
+        return interactions
+
+    saida = {}
+    for chave, grupos in agregados.items():
+        saida[chave] = [
+            {
+                "from": de,
+                "to": para,
+                "type": tipo,
+                "count": grupo["count"],
+                "weight": grupo["weight"],
+                "first": grupo["first"].isoformat() if grupo["first"] else None,
+                "last": grupo["last"].isoformat() if grupo["last"] else None
+            }
+            for (de, para, tipo), grupo in grupos.items()
+        ]
+    return saida
+
 def imprimir_totais():
     """Mostra um resumo global (COMPLETO) antes da coleta limitada."""
     base = f"repo:{REPO_OWNER}/{REPO_NAME}"
@@ -77,12 +154,10 @@ def coletar_comentario_issues():
                 commenter = comment.user.login
                 users_set.add(commenter)
                 if commenter != issue_creator:
-                    interactions["comentario_em_issues"].append({
-                        "weight": 2,
-                        "from": commenter,
-                        "to": issue_creator,
-                        "type": "comentario_issue"
-                    })
+                    registrar_interacao(
+                        "comentario_em_issues", commenter, issue_creator,
+                        "comentario_issue", peso=2, quando=comment.created_at
+                    )
                 comment_count += 1
 
             print(f"Issue {issues_count+1}: Criador - {issue_creator}, Comentários - {comment_count}")
@@ -108,11 +183,10 @@ def coletar_fechamento_issue():
                 users_set.add(closer)
                 users_set.add(opener)
                 if closer != opener:
-                    interactions["fechamento_de_issues"].append({
-                        "from": closer,
-                        "to": opener,
-                        "type": "fechamento_de_issue"
-                    })
+                    registrar_interacao(
+                        "fechamento_de_issues", closer, opener,
+                        "fechamento_de_issue", quando=issue.closed_at
+                    )
                 print(f"Issue fechada {closed_count+1}: aberta por {opener}, fechada por {closer}")
             else:
                 print(f"Issue fechada {closed_count+1}: sem informações completas.")
@@ -141,12 +215,10 @@ def coletar_pull_request():
                 commenter = comment.user.login
                 users_set.add(commenter)
                 if commenter != pr_creator:
-                    interactions["comentario_pull_request"].append({
-                        "weight": 2,
-                        "from": commenter,
-                        "to": pr_creator,
-                        "type": "comentario em pull request"
-                    })
+                    registrar_interacao(
+                        "comentario_pull_request", commenter, pr_creator,
+                        "comentario em pull request", peso=2, quando=comment.created_at
+                    )
                 pr_comment_count += 1
 
             pr_review_count = 0
@@ -154,12 +226,10 @@ def coletar_pull_request():
                 reviewer = review.user.login
                 users_set.add(reviewer)
                 if reviewer != pr_creator:
-                    interactions["revisoes_pull_request"].append({
-                        "weight": 4,
-                        "from": reviewer,
-                        "to": pr_creator,
-                        "type": "revisao de pull request"
-                    })
+                    registrar_interacao(
+                        "revisoes_pull_request", reviewer, pr_creator,
+                        "revisao de pull request", peso=4, quando=review.submitted_at
+                    )
                 pr_review_count += 1
             
             merge_log = ""
@@ -167,12 +237,10 @@ def coletar_pull_request():
                 merger = pr.merged_by.login
                 users_set.add(merger)
                 if merger != pr_creator:
-                    interactions["merge_pull_request"].append({
-                        "weight": 5,
-                        "from": merger,
-                        "to": pr_creator,
-                        "type": "merge_pull_request"
-                    })
+                    registrar_interacao(
+                        "merge_pull_request", merger, pr_creator,
+                        "merge_pull_request", peso=5, quando=pr.merged_at
+                    )
                 merge_log = f", merge por {merger}"
             else:
                 merge_log = ", não mergeada"
@@ -190,20 +258,27 @@ coletar_pull_request()
 
 print("\n=== RESUMO DA AMOSTRA ===")
 print(f"Total de usuários (na amostra): {len(users_set)}")
-print(f"Comentários em issues: {len(interactions['comentario_em_issues'])}")
-print(f"Fechamentos de issues: {len(interactions['fechamento_de_issues'])}")
-print(f"Comentários em PRs: {len(interactions['comentario_pull_request'])}")
-print(f"Revisões de PRs: {len(interactions['revisoes_pull_request'])}")
-print(f"Merges de PRs: {len(interactions['merge_pull_request'])}")
+print(f"Comentários em issues: {total_interacoes('comentario_em_issues')}")
+print(f"Fechamentos de issues: {total_interacoes('fechamento_de_issues')}")
+print(f"Comentários em PRs: {total_interacoes('comentario_pull_request')}")
+print(f"Revisões de PRs: {total_interacoes('revisoes_pull_request')}")
+print(f"Merges de PRs: {total_interacoes('merge_pull_request')}")
+if MODO_SAIDA == "agregado":
+    print(f"Pares agregados: {sum(len(grupos) for grupos in agregados.values())}")
 
 output = {
     "repository": f"{REPO_OWNER}/{REPO_NAME}",
     "data_collection_date": datetime.now().isoformat(),
+    "format": MODO_SAIDA,
     "users": sorted(list(users_set)),
-    "interactions": interactions
+    "interactions": interacoes_saida()
 }
 
 with open("dados_github.json", "w") as f:
-    json.dump(output, f, indent=2)
+    if MODO_SAIDA == "agregado":
+        # sem indentação: no modo agregado o objetivo é o arquivo compacto
+        json.dump(output, f, separators=(",", ":"))
+    else:
+        json.dump(output, f, indent=2)
 
 print("\n✓ Dados salvos em 'dados_github.json'")
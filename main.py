@@ -1,40 +1,138 @@
 import json
 import re
-import networkx as nx
+
+from Graph_LIB.Profiler import instrumentar
+
+
+# camadas analisadas: nome -> tipos de interação em data["interactions"]
+CAMADAS = {
+    "Comentários em Issues": ["comentario_em_issues"],
+    "Fechamento de Issues": ["fechamento_de_issues"],
+    "Pull Requests": ["comentario_pull_request", "revisoes_pull_request", "merge_pull_request"],
+}
 
 
 def slugify(s: str) -> str:
     return re.sub(r'[^a-zA-Z0-9_.-]+', '_', s)
 
 
-def load_data(caminho_arquivo="dados_github.json"):
+@instrumentar(itens=lambda data: sum(len(v) for v in data["interactions"].values()))
+def load_data(caminho_arquivo="dados_github.json", agregar=False):
+    """
+    Carrega o JSON gerado por data_collection.py.
+
+    Aceita os dois formatos de saída da coleta:
+      - "bruto": uma entrada por interação (arquivos antigos não têm a chave "format")
+      - "agregado": uma entrada por (from, to, type) com "count" e "weight" total
+
+    :param agregar: se True, converte um arquivo bruto para o formato agregado
+        ao carregar, reduzindo o número de interações que build_graph percorre.
+    """
     with open(caminho_arquivo, "r") as f:
         data = json.load(f)
+
+    data.setdefault("format", "bruto")
+    if data["format"] not in ("bruto", "agregado"):
+        raise ValueError(f"Formato de dados desconhecido: {data['format']}")
+
+    if agregar and data["format"] == "bruto":
+        data["interactions"] = {
+            chave: agregar_interacoes(interacoes)
+            for chave, interacoes in data["interactions"].items()
+        }
+        data["format"] = "agregado"
+
     return data
 
 
-def build_graph(usuarios, interacoes):
+def agregar_interacoes(interacoes):
+    """
+    Combina interações repetidas em (from, to, type) -> count, peso total
+    e primeiro/último instante (quando houver "timestamp" ou "first"/"last").
+
+    Aceita entradas brutas e já agregadas, então pode ser usada para
+    mesclar arquivos nos dois formatos.
+    """
+    grupos = {}
+    for interacao in interacoes:
+        chave = (interacao["from"], interacao["to"], interacao.get("type"))
+        primeiro = interacao.get("first", interacao.get("timestamp"))
+        ultimo = interacao.get("last", interacao.get("timestamp"))
+
+        grupo = grupos.get(chave)
+        if grupo is None:
+            grupos[chave] = {
+                "from": chave[0],
+                "to": chave[1],
+                "type": chave[2],
+                "count": interacao.get("count", 1),
+                "weight": interacao.get("weight", 1),
+                "first": primeiro,
+                "last": ultimo
+            }
+            continue
+
+        grupo["count"] += interacao.get("count", 1)
+        grupo["weight"] += interacao.get("weight", 1)
+        if primeiro is not None and (grupo["first"] is None or primeiro < grupo["first"]):
+            grupo["first"] = primeiro
+        if ultimo is not None and (grupo["last"] is None or ultimo > grupo["last"]):
+            grupo["last"] = ultimo
+
+    return list(grupos.values())
+
+
+def interacoes_por_camada(data):
+    """Junta as interações de cada camada de CAMADAS (nome -> lista)."""
+    return {
+        nome: [i for chave in chaves for i in data["interactions"].get(chave, [])]
+        for nome, chaves in CAMADAS.items()
+    }
+
+
+@instrumentar(itens=lambda G: G.number_of_edges())
+def build_graph(usuarios, interacoes, direcionado=False):
     """
-    Constrói e retorna um grafo não direcionado (nx.Graph)
-    a partir da lista de usuários e das interações.
+    Constrói e retorna um grafo não direcionado (nx.Graph), ou um
+    nx.DiGraph com `direcionado=True`, a partir da lista de usuários e
+    das interações.
+
+    Funciona com interações brutas e agregadas: no formato agregado,
+    "weight" já é o peso total do grupo e "count" o número de interações.
+
+    :param direcionado: mantém o sentido "from" -> "to" de cada
+        interação (revisor -> autor, quem fez o merge -> autor) em um
+        nx.DiGraph; a -> b e b -> a viram arestas separadas.
     """
-    G = nx.Graph()
+    # importado aqui para "import main" (GUI, CLI) não carregar o networkx
+    import networkx as nx
+
+    G = nx.DiGraph() if direcionado else nx.Graph()
     G.add_nodes_from(usuarios)
 
     for interacao in interacoes:
         de = interacao["from"]
         para = interacao["to"]
         peso = interacao.get("weight", 1)
+        quantidade = interacao.get("count", 1)
 
         if G.has_edge(de, para):
             G[de][para]["weight"] += peso
+            G[de][para]["count"] += quantidade
         else:
-            G.add_edge(de, para, weight=peso)
+            G.add_edge(de, para, weight=peso, count=quantidade)
 
     return G
 
 
 if __name__ == "__main__":
+    import sys
+
+    # "python main.py --headless ..." roda os relatórios sem interface gráfica
+    if len(sys.argv) > 1 and sys.argv[1] == "--headless":
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[2:]))
+
     # quando rodar main.py, abre a interface gráfica
     from Interface.interface import GitHubGraphGUI
     import tkinter as tk
@@ -42,5 +140,6 @@ if __name__ == "__main__":
     data = load_data("dados_github.json")
 
     root = tk.Tk()
-    app = GitHubGraphGUI(root, data, build_graph, slugify)
+    # layouts calculados ficam salvos ao lado do dataset
+    app = GitHubGraphGUI(root, data, build_graph, slugify, caminho_dataset="dados_github.json")
     root.mainloop()